@@ -12,6 +12,9 @@ Geometric HeteroData object for downstream GNN workflows.
 # pylint: disable=broad-exception-caught
 
 import logging
+import operator
+import sys
+from statistics import fmean
 from typing import TYPE_CHECKING, Any
 
 import networkx as nx
@@ -41,6 +44,9 @@ _POWER_PREFIXES: tuple[str, ...] = ("vdd", "vcc", "vdda", "vddio", "avdd", "dvdd
 _NET_TYPE_NAMES: tuple[str, ...] = ("port", "signal", "power", "ground")
 _NET_TYPE_IDX: dict[str, int] = {t: i for i, t in enumerate(_NET_TYPE_NAMES)}
 
+# Below this many entries NumPy's array-construction overhead outweighs its faster reductions.
+_NUMPY_MIN_DEGREES = 1024
+
 try:
     from networkx.drawing.nx_pydot import to_pydot
 
@@ -56,8 +62,16 @@ try:
 except ImportError:  # pragma: no cover
     HAS_MATPLOTLIB = False
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+
 try:
     import torch
+    from torch.nn.functional import one_hot
     from torch_geometric.data import HeteroData
 
     HAS_PYG = True
@@ -114,30 +128,30 @@ class CircuitGraph:
         return graph
 
     def _populate_from_macro(self, macro: "Macro") -> None:
-        """Iterates macro instances and records their net connections."""
-        for instance in macro.instances:
-            self._process_instance_connections(instance)
+        """
+        Iterates macro instances and records their net connections.
 
-    def _process_instance_connections(self, instance: Any) -> None:
-        """Extracts model name and net connections from a single instance."""
-        ref_des = instance.name
+        This is the hot loop for large designs, so the per-connection work of
+        :meth:`add_connection` is inlined with its lookups bound once per macro.
+        """
+        add_net = self.nets.setdefault
+        intern = sys.intern
+        for instance in macro.instances:
+            ref_des = self._process_instance_metadata(instance)
+            for net_name, formal_port in instance.nets:
+                # ``ref_des.port`` when the port is resolved, else just ``ref_des``.
+                port_name = intern(f"{ref_des}.{formal_port.name}") if formal_port else ref_des
+                add_net(intern(net_name), []).append(port_name)
+
+    def _process_instance_metadata(self, instance: Any) -> str:
+        """Records the instance's model name and returns its interned ref_des."""
+        ref_des = sys.intern(instance.name)
         model_name = "Unknown"
         if instance.definition and instance.definition.name:
             model_name = instance.definition.name
         elif instance.definition_name:
             model_name = instance.definition_name
-        self.instance_metadata[ref_des] = {"model": model_name}
-        for net_name, formal_port in instance.nets:
-            self._add_resolved_connection(net_name, ref_des, formal_port)
-
-    def _add_resolved_connection(self, net_name: str, ref_des: str, formal_port: Any) -> None:
-        """Records a net-to-port-identifier connection."""
-        self.add_connection(net_name, self._format_port_identifier(ref_des, formal_port))
-
-    def _format_port_identifier(self, ref_des: str, formal_port: Any) -> str:
-        """Returns ``ref_des.port`` when the port is resolved, else just ``ref_des``."""
-        if formal_port:
-            return f"{ref_des}.{formal_port.name}"
+        self.instance_metadata[ref_des] = {"model": sys.intern(model_name)}
         return ref_des
 
     def add_connection(self, net_name: str, port_name: str) -> None:
@@ -147,7 +161,9 @@ class CircuitGraph:
         :param net_name: The net the port attaches to.
         :param port_name: Port identifier, formatted as ``ref_des`` or ``ref_des.port``.
         """
-        self.nets.setdefault(net_name, []).append(port_name)
+        # Net and port strings repeat across every instance that touches them; interning
+        # shares one object per name and lets dict lookups hit the identity fast path.
+        self.nets.setdefault(sys.intern(net_name), []).append(sys.intern(port_name))
 
     def analyze_connectivity(self) -> None:
         """Prints net fan-out statistics for the bipartite graph to stdout."""
@@ -156,14 +172,46 @@ class CircuitGraph:
         if not self.nets:
             print("Graph is empty.")
             return
-        graph = self._build_nx_graph()
-        net_nodes = [n for n, attr in graph.nodes(data=True) if attr.get("type") == "net"]
-        degrees = dict(graph.degree(net_nodes))
-        if degrees:
-            avg = sum(degrees.values()) / len(degrees)
-            max_net = max(degrees, key=degrees.get)
-            print(f"Average Fanout: {avg:.2f}")
-            print(f"Highest Fanout Net: {max_net} ({degrees[max_net]} connections)")
+        avg, max_net, max_degree = self._summarize_degrees(self._compute_net_degrees_direct())
+        print(f"Average Fanout: {avg:.2f}")
+        print(f"Highest Fanout Net: {max_net} ({max_degree} connections)")
+
+    def _compute_net_degrees_direct(self) -> dict[str, int]:
+        """
+        Returns the bipartite degree of every net without building a graph.
+
+        A net's degree is its number of distinct connected instances; repeated
+        terminals of one instance collapse to a single edge, exactly as they do
+        in the ``nx.Graph`` projection.
+
+        :return: Mapping of net name to fanout.
+        """
+        return {net: len({self._extract_ref_des(p) for p in ports}) for net, ports in self.nets.items()}
+
+    @staticmethod
+    def _summarize_degrees(degrees: dict[str, int]) -> tuple[float, str, int]:
+        """
+        Reduces a non-empty degree table to (average, name of max, max degree).
+
+        Large tables are reduced with NumPy when it is installed; ties resolve
+        to the first entry on both paths.
+
+        :param degrees: Mapping of node name to degree.
+        :return: Tuple of (mean degree, first node with the max degree, max degree).
+        """
+        if HAS_NUMPY and len(degrees) >= _NUMPY_MIN_DEGREES:
+            names = list(degrees)
+            counts = np.fromiter(degrees.values(), dtype=np.int64, count=len(names))
+            idx = int(counts.argmax())
+            return float(counts.mean()), names[idx], int(counts[idx])
+        name, max_degree = max(degrees.items(), key=operator.itemgetter(1))
+        return fmean(degrees.values()), name, max_degree
+
+    @staticmethod
+    def _extract_ref_des(port: str) -> str:
+        """Returns the instance reference designator from a ``ref_des[.port]`` identifier."""
+        # partition allocates only the pieces, never an intermediate list.
+        return sys.intern(port.partition(".")[0])
 
     def to_device_graph(self) -> nx.Graph:
         """
@@ -182,7 +230,7 @@ class CircuitGraph:
         for name, meta in self.instance_metadata.items():
             graph.add_node(name, model=meta["model"])
         for net_name, ports in self.nets.items():
-            ref_des_list = [p.split(".")[0] if "." in p else p for p in ports]
+            ref_des_list = [self._extract_ref_des(p) for p in ports]
             for i, a in enumerate(ref_des_list):
                 for b in ref_des_list[i + 1 :]:
                     if a == b:
@@ -209,10 +257,9 @@ class CircuitGraph:
             return
         graph = self.to_device_graph()
         degrees = dict(graph.degree())
-        avg = sum(degrees.values()) / len(degrees)
-        max_inst = max(degrees, key=degrees.get)
+        avg, max_inst, max_degree = self._summarize_degrees(degrees)
         print(f"Average Device Degree: {avg:.2f}")
-        print(f"Most Connected Device: {max_inst} ({degrees[max_inst]} neighbors)")
+        print(f"Most Connected Device: {max_inst} ({max_degree} neighbors)")
         isolated = [n for n, d in degrees.items() if d == 0]
         if isolated:
             print(f"Isolated Instances ({len(isolated)}): {', '.join(isolated)}")
@@ -248,29 +295,33 @@ class CircuitGraph:
     def _build_net_features(self, net_idx: dict) -> "torch.Tensor":
         """Builds net feature matrix: [fanout, is_port, is_signal, is_power, is_ground]."""
         net_x = torch.zeros(len(net_idx), 1 + len(_NET_TYPE_NAMES))
-        for name, ports in self.nets.items():
-            i = net_idx[name]
-            net_x[i, 0] = float(len(ports))
-            net_x[i, 1 + _NET_TYPE_IDX[self._classify_net_type(name)]] = 1.0
+        rows = [net_idx[name] for name in self.nets]
+        type_cols = [1 + _NET_TYPE_IDX[self._classify_net_type(name)] for name in self.nets]
+        net_x[rows, 0] = torch.tensor([float(len(ports)) for ports in self.nets.values()])
+        net_x[rows, type_cols] = 1.0
         return net_x
 
     def _build_edge_tensors(self, inst_idx: dict, net_idx: dict) -> "tuple[list, list, list]":
-        """Builds src/dst index lists and one-hot terminal edge feature rows."""
-        src_inst, dst_net, edge_feats = [], [], []
-        n_terms = len(_TERMINAL_VOCAB)
+        """
+        Builds parallel src/dst/terminal index lists, one entry per edge.
+
+        Terminals are kept as indices into ``_TERMINAL_VOCAB`` rather than
+        per-edge one-hot rows; :meth:`to_pyg` expands them in a single tensor op.
+        """
+        src_inst: list[int] = []
+        dst_net: list[int] = []
+        terminals: list[int] = []
+        other = _TERMINAL_IDX["other"]
         for net_name, ports in self.nets.items():
             n_i = net_idx[net_name]
             for port in ports:
                 parts = port.split(".")
                 ref_des = parts[0]
-                terminal = parts[1] if len(parts) > 1 else "other"
                 if ref_des in inst_idx:
                     src_inst.append(inst_idx[ref_des])
                     dst_net.append(n_i)
-                    feat = [0.0] * n_terms
-                    feat[_TERMINAL_IDX.get(terminal, _TERMINAL_IDX["other"])] = 1.0
-                    edge_feats.append(feat)
-        return src_inst, dst_net, edge_feats
+                    terminals.append(_TERMINAL_IDX.get(parts[1], other) if len(parts) > 1 else other)
+        return src_inst, dst_net, terminals
 
     def to_pyg(self) -> "HeteroData":
         """
@@ -298,13 +349,13 @@ class CircuitGraph:
             )
         inst_idx = {name: i for i, name in enumerate(sorted(self.instance_metadata))}
         net_idx = {name: i for i, name in enumerate(sorted(self.nets))}
-        src_inst, dst_net, edge_feats = self._build_edge_tensors(inst_idx, net_idx)
+        src_inst, dst_net, terminals = self._build_edge_tensors(inst_idx, net_idx)
         data = HeteroData()
         data["instance"].x = self._build_instance_features(inst_idx)
         data["net"].x = self._build_net_features(net_idx)
         if src_inst:
             edge_index = torch.tensor([src_inst, dst_net], dtype=torch.long)
-            edge_attr = torch.tensor(edge_feats, dtype=torch.float)
+            edge_attr = one_hot(torch.tensor(terminals, dtype=torch.long), len(_TERMINAL_VOCAB)).float()
             data["instance", "connects_to", "net"].edge_index = edge_index
             data["instance", "connects_to", "net"].edge_attr = edge_attr
             data["net", "rev_connects_to", "instance"].edge_index = edge_index.flip(0)
@@ -330,6 +381,12 @@ class CircuitGraph:
         if output_file and output_file.endswith(".dot"):
             self._export_dot(graph, output_file)
             return
+        if not self.nets:
+            # Nothing to lay out; leave an empty DOT source instead of a blank figure.
+            _LOGGER.warning("Graph is empty; nothing to render.")
+            if output_file:
+                self._export_dot(graph, output_file + ".dot")
+            return
         rendered = self._try_render_matplotlib(graph, output_file, show)
         if not rendered and output_file:
             dot_path = output_file + ".dot"
@@ -390,26 +447,46 @@ class CircuitGraph:
     def _build_nx_graph(self) -> nx.Graph:
         """Constructs and returns the NetworkX bipartite graph."""
         graph = nx.Graph()
-        self._populate_nx_graph(graph)
+        if self.nets:
+            self._populate_nx_graph(graph)
         return graph
 
     def _populate_nx_graph(self, graph: nx.Graph) -> None:
-        """Adds net and instance nodes with their edges to *graph*."""
-        processed_instances: set[str] = set()
+        """Adds net and instance nodes with their edges to *graph* in bulk."""
+        net_nodes = [(net_name, self._get_net_attributes(net_name)) for net_name in self.nets]
+        inst_nodes: dict[str, dict[str, str]] = {}
+        edges: list[tuple[str, str]] = []
+        # The same port identifier recurs across nets; resolve each one once per build.
+        ref_cache: dict[str, str] = {}
         for net_name, ports in self.nets.items():
-            graph.add_node(net_name, **self._get_net_attributes(net_name))
-            self._process_ports_for_graph(graph, net_name, ports, processed_instances)
+            self._process_ports_for_graph(net_name, ports, inst_nodes, edges, ref_cache)
+        graph.add_nodes_from(net_nodes)
+        graph.add_nodes_from(inst_nodes.items())
+        graph.add_edges_from(edges, color="#BDC3C7", penwidth="0.6")
 
     def _process_ports_for_graph(
-        self, graph: nx.Graph, net_name: str, ports: list[str], processed_instances: set[str]
+        self,
+        net_name: str,
+        ports: list[str],
+        inst_nodes: dict[str, dict[str, str]],
+        edges: list[tuple[str, str]],
+        ref_cache: dict[str, str],
     ) -> None:
-        """Ensures instance nodes exist and adds edges for each port on *net_name*."""
+        """
+        Collects instance node attributes and net-to-instance edges for each port on *net_name*.
+
+        Tied terminals of one instance (e.g. ``M1.s`` and ``M1.b`` on ``vss``)
+        collapse to a single edge here, so the bulk insert carries no duplicates.
+        """
+        refs: dict[str, None] = {}
         for port in ports:
-            ref_des = port.split(".")[0] if "." in port else port
-            if ref_des not in processed_instances:
-                processed_instances.add(ref_des)
-                graph.add_node(ref_des, **self._get_instance_attributes(ref_des))
-            graph.add_edge(net_name, ref_des, color="#BDC3C7", penwidth="0.6")
+            if (ref_des := ref_cache.get(port)) is None:
+                ref_des = ref_cache[port] = self._extract_ref_des(port)
+            refs[ref_des] = None
+        for ref_des in refs:
+            if ref_des not in inst_nodes:
+                inst_nodes[ref_des] = self._get_instance_attributes(ref_des)
+            edges.append((net_name, ref_des))
 
     def _get_net_attributes(self, net_name: str) -> dict[str, str]:
         """Returns node attributes for a net node."""
@@ -490,15 +567,15 @@ class CircuitGraph:
 
     def _execute_matplotlib_render(self, graph: nx.Graph, output_file: str | None, show: bool) -> None:
         """Lays out and draws the bipartite graph with matplotlib."""
-        net_nodes = [n for n, attr in graph.nodes(data=True) if attr.get("type") == "net"]
+        inst_nodes, net_nodes, inst_labels, net_labels = self._partition_mpl_nodes(graph)
         # bipartite_layout puts net nodes on the left column, instance nodes on
         # the right, which reflects the actual two-set structure of the graph.
         pos = nx.bipartite_layout(graph, nodes=net_nodes, align="vertical", scale=2)
         plt.figure(figsize=(12, 10))
         self._mpl_draw_edges(graph, pos)
-        self._mpl_draw_instances(graph, pos)
-        self._mpl_draw_nets(graph, pos)
-        self._mpl_draw_labels(graph, pos)
+        self._mpl_draw_instances(graph, pos, inst_nodes)
+        self._mpl_draw_nets(graph, pos, net_nodes)
+        self._mpl_draw_labels(graph, pos, inst_labels, net_labels)
         plt.title("Netlist Topology", fontsize=14, color="#2C3E50")
         plt.axis("off")
         if output_file:
@@ -514,13 +591,33 @@ class CircuitGraph:
                 _LOGGER.warning("Unable to display plot interactively (headless environment).")
         plt.close()
 
+    @staticmethod
+    def _partition_mpl_nodes(graph: nx.Graph) -> tuple[list[str], list[str], dict[str, str], dict[str, str]]:
+        """
+        Splits graph nodes into instance/net lists and their labels in a single pass.
+
+        :return: Tuple of (instance nodes, net nodes, instance labels, net labels).
+        """
+        inst_nodes: list[str] = []
+        net_nodes: list[str] = []
+        inst_labels: dict[str, str] = {}
+        net_labels: dict[str, str] = {}
+        for node, attr in graph.nodes(data=True):
+            node_type = attr.get("type")
+            if node_type == "instance":
+                inst_nodes.append(node)
+                inst_labels[node] = attr.get("mpl_label") or node
+            elif node_type == "net":
+                net_nodes.append(node)
+                net_labels[node] = attr.get("xlabel") or node
+        return inst_nodes, net_nodes, inst_labels, net_labels
+
     def _mpl_draw_edges(self, graph: nx.Graph, pos: dict) -> None:
         """Draws all edges with a neutral style."""
         nx.draw_networkx_edges(graph, pos, edge_color="#BDC3C7", alpha=0.4, width=1.0)
 
-    def _mpl_draw_instances(self, graph: nx.Graph, pos: dict) -> None:
+    def _mpl_draw_instances(self, graph: nx.Graph, pos: dict, nodes: list[str]) -> None:
         """Draws instance nodes as filled squares."""
-        nodes = [n for n, attr in graph.nodes(data=True) if attr.get("type") == "instance"]
         nx.draw_networkx_nodes(
             graph,
             pos,
@@ -532,20 +629,17 @@ class CircuitGraph:
             alpha=0.9,
         )
 
-    def _mpl_draw_nets(self, graph: nx.Graph, pos: dict) -> None:
+    def _mpl_draw_nets(self, graph: nx.Graph, pos: dict, nodes: list[str]) -> None:
         """Draws net nodes as circles proportional to instance nodes."""
-        nodes = [n for n, attr in graph.nodes(data=True) if attr.get("type") == "net"]
         nx.draw_networkx_nodes(
             graph, pos, nodelist=nodes, node_color="#AED6F1", node_shape="o", node_size=350, label="Nets", alpha=0.9
         )
 
-    def _mpl_draw_labels(self, graph: nx.Graph, pos: dict) -> None:
+    def _mpl_draw_labels(
+        self, graph: nx.Graph, pos: dict, inst_labels: dict[str, str], net_labels: dict[str, str]
+    ) -> None:
         """Draws instance and net labels in their respective styles."""
-        inst_labels = {
-            n: (attr.get("mpl_label") or n) for n, attr in graph.nodes(data=True) if attr.get("type") == "instance"
-        }
         nx.draw_networkx_labels(graph, pos, labels=inst_labels, font_size=9, font_color="white", font_weight="bold")
-        net_labels = {n: (attr.get("xlabel") or n) for n, attr in graph.nodes(data=True) if attr.get("type") == "net"}
         nx.draw_networkx_labels(graph, pos, labels=net_labels, font_size=8, font_color="#5DADE2")
 
     def _try_render_matplotlib_device(self, graph: nx.Graph, output_file: str | None, show: bool) -> bool:
@@ -584,13 +678,9 @@ class CircuitGraph:
 
     def _write_dot_content(self, f: Any, graph: nx.Graph) -> None:
         """Writes a minimal DOT representation of *graph* to file *f*."""
-        f.write("graph Circuit {\n")
-        f.write('  overlap="false";\n')
-        f.write('  splines="true";\n')
-        for node, attrs in graph.nodes(data=True):
-            f.write(f'  "{node}" [{self._format_dot_attrs(attrs)}];\n')
-        for u, v, attrs in graph.edges(data=True):
-            f.write(f'  "{u}" -- "{v}" [{self._format_dot_attrs(attrs)}];\n')
+        f.write('graph Circuit {\n  overlap="false";\n  splines="true";\n')
+        f.writelines(f'  "{node}" [{self._format_dot_attrs(attrs)}];\n' for node, attrs in graph.nodes(data=True))
+        f.writelines(f'  "{u}" -- "{v}" [{self._format_dot_attrs(attrs)}];\n' for u, v, attrs in graph.edges(data=True))
         f.write("}\n")
 
     def _format_dot_attrs(self, attrs: dict[str, Any]) -> str:
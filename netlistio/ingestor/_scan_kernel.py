@@ -0,0 +1,175 @@
+"""
+Numba-compiled byte scanner for SPICE ``.SUBCKT``/``.ENDS`` boundaries.
+
+Replays the :class:`~netlistio.ingestor.scanner.Scanner` state machine over a
+``uint8`` view of the mapped file in a single compiled pass, so no per-line
+``bytes`` objects or regex calls are made. The matching rules mirror
+``SpiceScanStrategy.RE_SUBCKT`` / ``RE_ENDS`` exactly (ASCII case-insensitive,
+optional leading whitespace, ``.ends`` as a prefix match).
+
+numba and numpy are optional. When either is missing ``HAS_NUMBA`` is False,
+the kernel stays a plain Python function, and callers fall back to the
+line-by-line FSM.
+"""
+
+# The kernel sticks to scalars and arrays, the types Numba compiles most directly:
+# the row writer takes each column as a positional argument and the scan loop keeps
+# its FSM state in scalar locals rather than in a jitclass or tuple.
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+
+import functools
+
+try:
+    import numpy as np
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    np = None
+    HAS_NUMBA = False
+
+    def njit(*_args, **_kwargs):
+        """No-op stand-in for ``numba.njit`` when numba is not installed."""
+        return lambda func: func
+
+
+__all__ = ["HAS_NUMBA", "KIND_GLOBAL", "KIND_MACRO", "scan_spice", "warm_up"]
+
+#: Row ``kind`` codes emitted by :func:`scan_spice`.
+KIND_GLOBAL = 0
+KIND_MACRO = 1
+
+# Column layout of the rows returned by scan_spice.
+_COLUMNS = 6
+_SUBCKT = tuple(b"subckt")
+_ENDS = tuple(b"ends")
+_NEWLINE = 10
+_DOT = 46
+
+_LINE_PLAIN = 0
+_LINE_SUBCKT = 1
+_LINE_ENDS = 2
+
+
+@njit(cache=True)
+def _is_space(c) -> bool:
+    """Matches the bytes-regex ``\\s`` class: space, ``\\t``, ``\\n``, ``\\v``, ``\\f``, ``\\r``."""
+    return c == 32 or 9 <= c <= 13
+
+
+@njit(cache=True)
+def _match_keyword(buf, pos: int, end: int, keyword) -> bool:
+    """ASCII case-insensitive compare of *keyword* (lowercase) at ``buf[pos:]``."""
+    if pos + len(keyword) > end:
+        return False
+    for i, expected in enumerate(keyword):
+        if buf[pos + i] | 0x20 != expected:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _classify_line(buf, pos: int, end: int):
+    """
+    Classifies the physical line ``buf[pos:end]`` (newline excluded).
+
+    :return: Tuple of (line kind, delimiter start, name start, name end); the
+        offsets are -1 unless the line opens a SUBCKT.
+    """
+    while pos < end and _is_space(buf[pos]):
+        pos += 1
+    if pos >= end or buf[pos] != _DOT:
+        return _LINE_PLAIN, -1, -1, -1
+    if _match_keyword(buf, pos + 1, end, _ENDS):
+        return _LINE_ENDS, -1, -1, -1
+    if not _match_keyword(buf, pos + 1, end, _SUBCKT):
+        return _LINE_PLAIN, -1, -1, -1
+    name_start = pos + 1 + len(_SUBCKT)
+    if name_start >= end or not _is_space(buf[name_start]):
+        return _LINE_PLAIN, -1, -1, -1
+    while name_start < end and _is_space(buf[name_start]):
+        name_start += 1
+    name_end = name_start
+    while name_end < end and not _is_space(buf[name_end]):
+        name_end += 1
+    if name_end == name_start:
+        return _LINE_PLAIN, -1, -1, -1
+    return _LINE_SUBCKT, pos, name_start, name_end
+
+
+@njit(cache=True)
+def _append(rows, count: int, start: int, end: int, kind: int, delim: int, name_start: int, name_end: int):
+    """Appends one region row, doubling *rows* when full. Returns the (possibly new) array."""
+    if count == rows.shape[0]:
+        grown = np.empty((rows.shape[0] * 2, _COLUMNS), dtype=np.int64)
+        grown[:count] = rows[:count]
+        rows = grown
+    rows[count, 0] = start
+    rows[count, 1] = end
+    rows[count, 2] = kind
+    rows[count, 3] = delim
+    rows[count, 4] = name_start
+    rows[count, 5] = name_end
+    return rows
+
+
+# nogil: the compiler scans files on a thread pool, and the pass touches no Python objects.
+@njit(cache=True, nogil=True)
+def scan_spice(buf):
+    """
+    Scans a SPICE file buffer for GLOBAL/MACRO regions.
+
+    :param buf: ``uint8`` array view of the whole file.
+    :return: ``int64`` array of shape ``(n, 6)``; each row is ``(start_byte,
+        end_byte, kind, delimiter_start, name_start, name_end)``. ``kind`` is
+        :data:`KIND_GLOBAL` or :data:`KIND_MACRO`; the last three columns are
+        -1 for GLOBAL rows. The delimiter spans ``len(".subckt")`` bytes.
+    """
+    size = buf.shape[0]
+    rows = np.empty((16, _COLUMNS), dtype=np.int64)
+    count = 0
+    pos = 0
+    current_start = 0
+    depth = 0
+    delim = name_start = name_end = -1
+    while pos < size:
+        line_end = pos
+        while line_end < size and buf[line_end] != _NEWLINE:
+            line_end += 1
+        nxt = line_end + 1 if line_end < size else size
+        kind, line_delim, line_name_start, line_name_end = _classify_line(buf, pos, line_end)
+        if depth > 0:
+            if kind == _LINE_SUBCKT:
+                depth += 1
+            elif kind == _LINE_ENDS:
+                depth -= 1
+                if depth == 0:
+                    rows = _append(rows, count, current_start, nxt, KIND_MACRO, delim, name_start, name_end)
+                    count += 1
+                    current_start = nxt
+        elif kind == _LINE_SUBCKT:
+            if pos > current_start:
+                rows = _append(rows, count, current_start, pos, KIND_GLOBAL, -1, -1, -1)
+                count += 1
+            delim, name_start, name_end = line_delim, line_name_start, line_name_end
+            current_start = pos
+            depth = 1
+        pos = nxt
+    # An unterminated macro at EOF is emitted as GLOBAL, matching Scanner._finalize_region.
+    if pos > current_start:
+        rows = _append(rows, count, current_start, pos, KIND_GLOBAL, -1, -1, -1)
+        count += 1
+    return rows[:count]
+
+
+@functools.cache
+def warm_up() -> None:
+    """
+    Compiles :func:`scan_spice` for the read-only ``uint8`` signature of an mmap view.
+
+    Numba's first-call compilation leaves a reference cycle holding the call
+    arguments until the next GC pass. Compiling against a throwaway buffer
+    keeps that cycle away from the mmap export, which must be released before
+    the mmap can close.
+    """
+    scan_spice(np.frombuffer(b"\n", dtype=np.uint8))
@@ -0,0 +1,92 @@
+"""
+On-disk cache of parse results for repeated runs over unchanged files.
+
+Entries are keyed by file identity (path, modification time, size), the exact
+regions parsed, and the chunk parser factory, so editing a file or changing
+how it is parsed simply misses. The cache is opt-in: pass ``cache_dir`` to
+the :class:`~netlistio.ingestor.compiler.Compiler` or
+:class:`~netlistio.ingestor.reader.SpiceReader`.
+
+Entries are pickles, so the directory must only be writable by trusted users.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable
+
+from netlistio.models.parsing import ParseRegion, ParseResult
+
+__all__ = ["CACHE_VERSION", "ResultCache"]
+
+#: Bumped whenever parser output changes, invalidating every existing entry.
+CACHE_VERSION = 2
+
+
+class ResultCache:
+    """
+    Content-addressed store of pickled :class:`ParseResult` objects.
+
+    Every operation is best-effort: an unreadable, missing, or corrupt entry
+    is a miss, and a failed write is dropped, so the cache can never fail a parse.
+    """
+
+    def __init__(self, directory: str | Path):
+        """
+        :param directory: Directory holding the entries; created on first write.
+        """
+        self.directory = Path(directory)
+
+    def key(self, filepath: str, regions: Iterable[ParseRegion], chunk_parser_factory: Any) -> str | None:
+        """
+        Computes the entry key for parsing *regions* of *filepath*.
+
+        :param filepath: File the regions belong to.
+        :param regions: Regions parsed together, in order.
+        :param chunk_parser_factory: Picklable factory the regions are parsed with.
+        :return: Hex digest, or None if the file cannot be stat'ed.
+        """
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        spans = [(r.start_byte, r.end_byte, r.region_type.value, r.context_delimiter, r.context_name) for r in regions]
+        identity = (CACHE_VERSION, filepath, stat.st_mtime_ns, stat.st_size, spans, chunk_parser_factory)
+        return hashlib.blake2b(pickle.dumps(identity), digest_size=20).hexdigest()
+
+    def load(self, key: str) -> ParseResult | None:
+        """
+        Returns the stored result for *key*, or None on a miss.
+
+        :param key: Digest from :meth:`key`.
+        """
+        try:
+            with open(self.directory / f"{key}.pkl", "rb") as f:
+                result = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        return result if isinstance(result, ParseResult) else None
+
+    def store(self, key: str, result: ParseResult) -> None:
+        """
+        Writes *result* under *key*, atomically replacing any existing entry.
+
+        :param key: Digest from :meth:`key`.
+        :param result: Result to store.
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.directory / f"{key}.pkl")
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
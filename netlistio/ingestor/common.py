@@ -7,19 +7,139 @@ across scanner and parser implementations.
 
 import contextlib
 import mmap
+import os
 from pathlib import Path
 from typing import Iterator
 
-__all__ = ["open_mmap"]
+__all__ = [
+    "open_mmap",
+    "open_buffer",
+    "advise",
+    "prefetch_file",
+    "MADV_SEQUENTIAL",
+    "MADV_WILLNEED",
+    "MADV_DONTNEED",
+    "MADV_HUGEPAGE",
+    "SMALL_FILE_BYTES",
+    "HUGE_PAGE_MIN_BYTES",
+]
+
+#: Readahead hints; None where the platform has no madvise (advice becomes a no-op).
+MADV_SEQUENTIAL: int | None = getattr(mmap, "MADV_SEQUENTIAL", None)
+MADV_WILLNEED: int | None = getattr(mmap, "MADV_WILLNEED", None)
+#: Release hint for a range that has been read; pages are refaulted from the page cache if touched again.
+MADV_DONTNEED: int | None = getattr(mmap, "MADV_DONTNEED", None)
+#: Transparent huge page hint; None where unavailable (Linux only).
+MADV_HUGEPAGE: int | None = getattr(mmap, "MADV_HUGEPAGE", None)
+
+#: Files smaller than this are read into memory by :func:`open_buffer` rather than mapped.
+SMALL_FILE_BYTES = 64 * 1024
+#: Mappings of at least this size are offered huge pages, see :func:`_map_file`.
+HUGE_PAGE_MIN_BYTES = 64 * 1024 * 1024
+
+
+@contextlib.contextmanager
+def _map_file(f, advice: int | None) -> Iterator[mmap.mmap]:
+    """
+    Maps an open file read-only and applies *advice*.
+
+    Very large mappings are also advised ``MADV_HUGEPAGE``: a multi-gigabyte
+    netlist spans millions of 4 KiB pages, more than the TLB can cover. The
+    kernel honours the hint only where file-backed huge pages are enabled,
+    and :func:`advise` ignores a refusal.
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) >= HUGE_PAGE_MIN_BYTES:
+            advise(mm, MADV_HUGEPAGE)
+        advise(mm, advice)
+        yield mm
 
 
 @contextlib.contextmanager
-def open_mmap(filepath: str | Path) -> Iterator[mmap.mmap]:
+def open_mmap(filepath: str | Path, advice: int | None = None) -> Iterator[mmap.mmap]:
     """
     Opens a file as a read-only memory-mapped object.
 
     :param filepath: Path to the file to map.
+    :param advice: Optional whole-file ``madvise`` hint (e.g. ``MADV_SEQUENTIAL``).
     :return: Context manager yielding a readable mmap.
     """
-    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    with open(filepath, "rb") as f, _map_file(f, advice) as mm:
         yield mm
+
+
+@contextlib.contextmanager
+def open_buffer(filepath: str | Path, advice: int | None = None) -> Iterator[bytes | mmap.mmap]:
+    """
+    Opens a file as a read-only buffer, reading small files instead of mapping them.
+
+    Below :data:`SMALL_FILE_BYTES` one ``read`` is cheaper than setting up and
+    tearing down a mapping. Callers must stick to the operations ``bytes`` and
+    ``mmap`` share: ``len``, slicing, ``find``/``rfind``, regex search and
+    ``memoryview``.
+
+    :param filepath: Path to the file to open.
+    :param advice: Optional whole-file ``madvise`` hint, applied only when mapped.
+    :return: Context manager yielding ``bytes`` or a readable mmap.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size < SMALL_FILE_BYTES:
+            yield f.read()
+            return
+        with _map_file(f, advice) as mm:
+            yield mm
+
+
+def advise(mm: mmap.mmap, advice: int | None, start: int = 0, end: int = -1) -> None:
+    """
+    Issues an ``madvise`` hint for ``mm[start:end]``.
+
+    On a cold page cache this lets the kernel fetch the whole range in large
+    requests up front instead of faulting it in one page at a time. The start
+    offset is rounded down to a page boundary as ``madvise`` requires. Hints
+    are best-effort: unsupported platforms and kernels are silently ignored,
+    as are in-memory buffers from :func:`open_buffer`.
+
+    :param mm: Mapped file, or a ``bytes`` buffer (ignored).
+    :param advice: ``MADV_*`` constant, or None for no hint.
+    :param start: First byte of the range.
+    :param end: End of the range (exclusive); -1 for end of file.
+    """
+    if advice is None or not hasattr(mm, "madvise"):
+        return
+    size = mm.size()
+    if size == 0:
+        return
+    end = size if end < 0 else min(end, size)
+    aligned = start - start % mmap.PAGESIZE
+    if end <= aligned:
+        return
+    try:
+        mm.madvise(advice, aligned, end - aligned)
+    except OSError:  # pragma: no cover
+        pass
+
+
+def prefetch_file(filepath: str | Path) -> None:
+    """
+    Asks the kernel to start reading a whole file into the page cache.
+
+    Returns immediately; the readahead proceeds asynchronously. Issuing this
+    for a batch of files before any of them is mapped keeps the storage queue
+    full instead of paying each file's cold-read latency in turn. Best-effort:
+    a no-op where ``posix_fadvise`` is unavailable or the file cannot be opened.
+
+    :param filepath: File to prefetch.
+    """
+    if not hasattr(os, "posix_fadvise"):  # pragma: no cover
+        return
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(fd)
@@ -7,18 +7,31 @@ resolving paths and queueing new work until the entire graph is built.
 """
 
 import logging
+import os
+import sys
 from collections import deque
-from dataclasses import dataclass
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Callable
 
+from netlistio.ingestor.common import prefetch_file
 from netlistio.ingestor.library import LibraryProcessor
-from netlistio.ingestor.parser import Parser
+from netlistio.ingestor.parser import (
+    Parser,
+    init_worker,
+    largest_first,
+    packed_batch_entry_point,
+    unpack_result,
+)
 from netlistio.ingestor.scanner import Scanner
 from netlistio.models.parsing import (
     WHOLE_FILE,
     IncludeDirective,
     LibraryDirective,
+    LibrarySection,
     ParseRegion,
     ParseResult,
     RegionType,
@@ -29,11 +42,81 @@ __all__ = ["Compiler"]
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass(slots=True, frozen=True)
-class _CompilerQueueKey:
-    filepath: str
-    start_byte: int
-    end_byte: int
+# (path id, start_byte, end_byte): hashing three small ints is far cheaper than
+# hashing the absolute path string on every enqueue.
+_RegionKey = tuple[int, int, int]
+
+
+@dataclass(slots=True)
+class _MergeOrder:
+    """
+    Breadth-first order in which region results join the aggregate.
+
+    Regions are dispatched as soon as a directive names them, but a region's
+    place is fixed only once the region including it has been merged: its
+    directives are then placed in file order, as a sequential breadth-first
+    walk would enqueue them. Worker scheduling therefore never decides which
+    of two duplicate definitions comes first.
+    """
+
+    # Placed regions not merged yet, in merge order.
+    order: deque[_RegionKey] = field(default_factory=deque)
+    placed: set[_RegionKey] = field(default_factory=set)
+    # Directives of merged regions not placed yet, with the file each was found in.
+    directives: deque[tuple[IncludeDirective, str]] = field(default_factory=deque)
+    # Completed region results not merged yet.
+    results: dict[_RegionKey, ParseResult] = field(default_factory=dict)
+
+    def place(self, key: _RegionKey) -> None:
+        """Appends *key* to the merge order unless an earlier directive already placed it."""
+        if key not in self.placed:
+            self.placed.add(key)
+            self.order.append(key)
+
+
+@dataclass(slots=True)
+class _DispatchState:
+    """
+    Work queue and outstanding futures of one :meth:`Compiler.compile` run.
+
+    :param result: Aggregate that region results are merged into, in breadth-first order.
+    """
+
+    result: ParseResult
+    queue: deque[tuple[_RegionKey, ParseRegion]] = field(default_factory=deque)
+    visited_regions: set[_RegionKey] = field(default_factory=set)
+    path_ids: dict[str, int] = field(default_factory=dict)
+    # Pending batch futures mapped to (region key, batch offset, source file).
+    in_flight: dict[Future, tuple[_RegionKey, int, str]] = field(default_factory=dict)
+    # Whole-file regions being scanned, mapped to their key.
+    scans: dict[Future, tuple[_RegionKey, ParseRegion]] = field(default_factory=dict)
+    # Pending section-index futures mapped to their library path.
+    index_lookups: dict[Future, Path] = field(default_factory=dict)
+    # Batch results of regions still missing at least one batch, in file order.
+    batch_results: dict[_RegionKey, list[ParseResult | None]] = field(default_factory=dict)
+    merge: _MergeOrder = field(default_factory=_MergeOrder)
+    # Pool futures post themselves here on completion (see Compiler._submit).
+    completed: SimpleQueue[Future] = field(default_factory=SimpleQueue)
+
+    def outstanding(self) -> bool:
+        """Returns True while any scan, batch or index future has not been handled."""
+        return bool(self.in_flight or self.scans or self.index_lookups)
+
+
+@dataclass(slots=True)
+class _IncludeState:
+    """Directive resolution and library section lookups of one :meth:`Compiler.compile` run."""
+
+    seen_directives: set[IncludeDirective] = field(default_factory=set)
+    prefetched: set[Path] = field(default_factory=set)
+    # (resolved library path, lower-cased section) pairs already looked up this run.
+    requested_sections: set[tuple[Path, str]] = field(default_factory=set)
+    # Each library file's sections are indexed once; directives naming a file whose
+    # index is still being built wait in awaiting_index.
+    section_indexes: dict[Path, dict[str, LibrarySection]] = field(default_factory=dict)
+    awaiting_index: dict[Path, list[LibraryDirective]] = field(default_factory=dict)
+    # (filename, base dir) -> resolved path, or None when nothing matched.
+    resolved_paths: dict[tuple[str, str], Path | None] = field(default_factory=dict)
 
 
 class Compiler:
@@ -49,7 +132,8 @@ class Compiler:
         parser_factory: Callable[[Path, Scanner], Parser],
         scanner_factory: Callable[[Path], Scanner],
         library_factory: Callable[[], LibraryProcessor],
-        num_workers: int = 4,
+        num_workers: int | None = None,
+        cache_dir: str | Path | None = None,
     ):
         """
         Initialize the compiler.
@@ -58,96 +142,308 @@ class Compiler:
         :param parser_factory: Callable to create new Parsers.
         :param scanner_factory: Callable to create new Scanners.
         :param library_factory: Callable to create a LibraryProcessor.
-        :param num_workers: Worker count passed to each file parse.
+        :param num_workers: Size of the shared worker pool (default: CPU count).
+        :param cache_dir: Optional directory where workers cache the parse results
+            of unchanged files across runs (see :class:`~netlistio.ingestor.cache.ResultCache`).
         """
         self._root = Path(root_filepath).resolve()
+        self._root_dir = os.fspath(self._root.parent)
         self._parser_factory = parser_factory
         self._scanner_factory = scanner_factory
         self._library_processor = library_factory()
-        self._num_workers = num_workers
-        self._visited_regions: set[_CompilerQueueKey] = set()
-        self._queue: deque[ParseRegion] = deque()
-        self._aggregated_result = ParseResult(filepath=str(self._root))
+        self._num_workers = num_workers or os.cpu_count() or 1
+        self._cache_dir = None if cache_dir is None else os.fspath(cache_dir)
+        self._path_cache: dict[str, Path] = {}
+        # State of the latest run; compile() replaces both so the compiler can be reused.
+        self._run = _DispatchState(ParseResult(filepath=str(self._root)))
+        self._includes = _IncludeState()
 
     @property
-    def visited_regions(self) -> frozenset:
+    def visited_regions(self) -> frozenset[_RegionKey]:
         """Returns an immutable snapshot of visited region keys (deduplication guard)."""
-        return frozenset(self._visited_regions)
+        return frozenset(self._run.visited_regions)
 
     def compile(self) -> ParseResult:
         """
         Execute the compilation process.
 
-        Resets internal state so the compiler may be reused for repeated runs.
+        Every region of every discovered file is dispatched to a single shared
+        process pool, so parsing of one file overlaps with the parsing of the
+        includes it discovers. Library files are indexed on the same pool, once
+        each however many sections are used, and section regions are enqueued by
+        the coordinator once the index arrives. Files are scanned on a thread
+        pool, so the coordinator keeps dispatching and merging while a large
+        include is scanned, and sibling includes are scanned together.
+        Results are merged in the breadth-first order of a sequential walk
+        (see :class:`_MergeOrder`), whatever order workers finish in; each is
+        folded into the aggregate as soon as every earlier result has been, so
+        only out-of-order results are held. Completions arrive on a queue fed by
+        future callbacks, so each costs O(1) however many futures are outstanding.
+
+        Run state is created afresh on each call, so the compiler may be reused for repeated runs.
 
         :return: Aggregated ParseResult from all discovered files and regions.
         """
-        self._visited_regions.clear()
-        self._queue.clear()
-        self._aggregated_result = ParseResult(filepath=str(self._root))
-        root_region = self._create_file_region(self._root)
-        self._enqueue(root_region)
-        while self._queue:
-            region = self._queue.popleft()
-            result = self._parse_region(region)
-            self._aggregated_result.cells.extend(result.cells)
-            self._aggregated_result.errors.extend(result.errors)
-            for directive in result.includes:
-                self._handle_directive(directive, region.filepath)
-        return self._aggregated_result
-
-    def _enqueue(self, region: ParseRegion):
-        """Add region to queue if not already visited."""
-        key = _CompilerQueueKey(str(region.filepath), region.start_byte, region.end_byte)
-        if key not in self._visited_regions:
-            self._visited_regions.add(key)
-            self._queue.append(region)
-
-    def _parse_region(self, region: ParseRegion) -> ParseResult:
-        """
-        Parses a specific region of a file.
-
-        Handles both full files (scanning for macros first) and strict
-        byte-ranges (library sections, treated as flat lists of models).
-        """
-        path = Path(region.filepath)
-        if region.start_byte == 0 and region.end_byte == WHOLE_FILE:
-            return self._parse_whole_file(path=path)
-        # LIB sections are treated as flat lists of models/subckts without further nesting.
-        return self._parse_slice(path=path, region=region)
-
-    def _parse_whole_file(self, path: Path):
-        scanner = self._scanner_factory(path)
-        regions = scanner.scan()
-        parser = self._parser_factory(path, regions)
-        return parser.parse(num_workers=self._num_workers)
-
-    def _parse_slice(self, path: Path, region: ParseRegion):
-        parser = self._parser_factory(path, [region])
-        return parser.parse(num_workers=self._num_workers)
-
-    def _handle_directive(self, directive: IncludeDirective, context_filepath: str):
-        """Resolves path and adds new work to queue."""
+        self._run = run = _DispatchState(ParseResult(filepath=str(self._root)))
+        self._includes = _IncludeState()
+        run.merge.place(self._enqueue(self._create_file_region(self._root)))
+        with ProcessPoolExecutor(
+            max_workers=self._num_workers, initializer=init_worker, initargs=(self._cache_dir,)
+        ) as executor, ThreadPoolExecutor(max_workers=self._num_workers, thread_name_prefix="netlistio-scan") as scans:
+            while run.queue or run.outstanding():
+                self._submit_queued(executor, scans)
+                if run.outstanding():
+                    self._handle_completion(executor, run.completed.get())
+                self._merge_ready()
+        return run.result
+
+    def _submit_queued(self, executor: ProcessPoolExecutor, scans: ThreadPoolExecutor):
+        """
+        Drains the region queue.
+
+        Whole files are handed to the scan pool and batched once their scan
+        comes back; library sections need no scan and are batched at once.
+
+        :param executor: Shared worker pool.
+        :param scans: Thread pool running file scans.
+        """
+        run = self._run
+        while run.queue:
+            key, region = run.queue.popleft()
+            if region.start_byte == 0 and region.end_byte == WHOLE_FILE:
+                run.scans[self._submit(scans, self._scan_file, self._as_path(region.filepath))] = (key, region)
+            else:
+                self._submit_batches(executor, self._build_parser(region), key)
+
+    def _handle_completion(self, executor: ProcessPoolExecutor, future: Future):
+        """Routes a completed future to the handler for its kind of work."""
+        run = self._run
+        if (path := run.index_lookups.pop(future, None)) is not None:
+            self._handle_section_index(future, path)
+        elif (scan := run.scans.pop(future, None)) is not None:
+            self._handle_scan(executor, future, *scan)
+        else:
+            self._handle_batch(executor, future, *run.in_flight.pop(future))
+
+    def _handle_scan(self, executor: ProcessPoolExecutor, future: Future, key: _RegionKey, region: ParseRegion):
+        """Submits the batches of a whole-file region once its scan has come back."""
+        parser = self._parser_factory(self._as_path(region.filepath), future.result())
+        self._submit_batches(executor, parser, key)
+
+    def _handle_batch(
+        self, executor: ProcessPoolExecutor, future: Future, key: _RegionKey, offset: int, context_filepath: str
+    ):
+        """
+        Records a completed batch and dispatches the work its directives name.
+
+        The directives are only dispatched here; their place in the aggregate
+        is fixed when the region is merged (see :meth:`_place_directives`).
+
+        :param executor: Shared worker pool.
+        :param future: Completed batch future.
+        :param key: Key of the batch's region.
+        :param offset: Position of the batch within its region.
+        :param context_filepath: File the batch's regions belong to.
+        """
+        result = unpack_result(future.result())
+        if (region_result := self._collect_batch(key, offset, result)) is not None:
+            self._run.merge.results[key] = region_result
+        seen_directives = self._includes.seen_directives
+        # A batch result can repeat a directive its regions share; dict keeps first-seen order.
+        new_directives = list(dict.fromkeys(d for d in result.includes if d not in seen_directives))
+        seen_directives.update(new_directives)
+        self._handle_directives(new_directives, context_filepath, executor)
+
+    def _scan_file(self, path: Path) -> list[ParseRegion]:
+        """Scans *path* into its parse regions; runs on the scan pool."""
+        return list(self._scanner_factory(path).scan())
+
+    def _submit_batches(self, executor: ProcessPoolExecutor, parser: Parser, key: _RegionKey):
+        """
+        Submits one future per batch of a region's parser.
+
+        Batches are submitted largest first but collected in file order, so a
+        dominant macro starts early without reordering the merged cells.
+
+        :param executor: Shared worker pool.
+        :param parser: Parser over the region with key *key*.
+        :param key: Key of the region; a region without batches completes at once.
+        """
+        run = self._run
+        batches = parser.work_batches(self._num_workers)
+        if not batches:
+            run.merge.results[key] = ParseResult(filepath=str(parser.filepath))
+            return
+        run.batch_results[key] = [None] * len(batches)
+        in_flight = run.in_flight
+        for offset in largest_first(batches):
+            future = self._submit(executor, packed_batch_entry_point, batches[offset])
+            in_flight[future] = (key, offset, batches[offset][0])
+
+    def _collect_batch(self, key: _RegionKey, offset: int, result: ParseResult) -> ParseResult | None:
+        """
+        Records one batch result of the region with key *key*.
+
+        :return: The region's result, its batches concatenated in file order,
+            once the last batch arrives; otherwise None.
+        """
+        results = self._run.batch_results[key]
+        results[offset] = result
+        if None in results:
+            return None
+        del self._run.batch_results[key]
+        if len(results) == 1:
+            return results[0]
+        return ParseResult(
+            filepath=results[0].filepath,
+            cells=list(chain.from_iterable(r.cells for r in results)),
+            errors=list(chain.from_iterable(r.errors for r in results)),
+            includes=list(chain.from_iterable(r.includes for r in results)),
+        )
+
+    def _submit(self, executor: Executor, fn: Callable, *args) -> Future:
+        """Submits *fn* to the pool; the future posts itself to the run's completion queue when done."""
+        future = executor.submit(fn, *args)
+        future.add_done_callback(self._run.completed.put)
+        return future
+
+    def _merge_ready(self):
+        """
+        Extends the aggregate with every result whose turn in the merge order has come.
+
+        Each merged result's directives are placed before the next result is
+        considered, so the order only ever grows at its tail.
+        """
+        merge, aggregate = self._run.merge, self._run.result
+        while True:
+            self._place_directives()
+            if not merge.order or merge.order[0] not in merge.results:
+                return
+            result = merge.results.pop(merge.order.popleft())
+            aggregate.cells.extend(result.cells)
+            aggregate.errors.extend(result.errors)
+            merge.directives.extend((directive, result.filepath) for directive in result.includes)
+
+    def _place_directives(self):
+        """
+        Places the regions named by merged directives, in directive order.
+
+        Stops at a section directive whose library index is still being built;
+        placement resumes once it arrives. Unresolvable includes and missing
+        sections were already reported when the directive was dispatched.
+        """
+        merge, includes = self._run.merge, self._includes
+        while merge.directives:
+            directive, context_filepath = merge.directives[0]
+            try:
+                path = self._resolve_path(directive.filepath, os.path.dirname(context_filepath))
+            except FileNotFoundError:
+                merge.directives.popleft()
+                continue
+            if isinstance(directive, LibraryDirective) and directive.section:
+                if (sections := includes.section_indexes.get(path)) is None:
+                    return
+                if (section_info := sections.get(directive.section.lower())) is not None:
+                    merge.place(self._region_key(str(path), section_info.start_byte, section_info.end_byte))
+            else:
+                merge.place(self._region_key(str(path), 0, WHOLE_FILE))
+            merge.directives.popleft()
+
+    def _region_key(self, filepath: str, start_byte: int, end_byte: int) -> _RegionKey:
+        """Returns the deduplication key of a byte range of *filepath*."""
+        path_ids = self._run.path_ids
+        return (path_ids.setdefault(filepath, len(path_ids)), start_byte, end_byte)
+
+    def _enqueue(self, region: ParseRegion) -> _RegionKey:
+        """
+        Adds region to the queue if not already visited.
+
+        :return: The region's key.
+        """
+        run = self._run
+        key = self._region_key(str(region.filepath), region.start_byte, region.end_byte)
+        if key not in run.visited_regions:
+            run.visited_regions.add(key)
+            run.queue.append((key, region))
+        return key
+
+    def _build_parser(self, region: ParseRegion) -> Parser:
+        """
+        Builds the parser for a library section's byte range.
+
+        Whole files are scanned for macros first (see :meth:`_scan_file`); LIB
+        sections are treated as flat lists of models/subckts without further nesting.
+        """
+        return self._parser_factory(self._as_path(region.filepath), [region])
+
+    def _handle_directives(
+        self,
+        directives: list[IncludeDirective],
+        context_filepath: str,
+        executor: ProcessPoolExecutor,
+    ):
+        """
+        Resolves a batch of directives and adds the new work to the queue.
+
+        All paths are resolved and prefetched before any is scanned, so the
+        kernel reads the whole batch concurrently rather than one file at a time.
+        Library files are indexed on the pool instead of being searched here;
+        each file and section is requested once however the directive spells them.
+
+        :param directives: Directives not seen earlier in this run.
+        :param context_filepath: File the directives were found in.
+        :param executor: Shared worker pool.
+        """
+        includes = self._includes
+        resolved = [(d, path) for d in directives if (path := self._resolve_directive(d, context_filepath))]
+        for _, path in resolved:
+            if path not in includes.prefetched:
+                includes.prefetched.add(path)
+                prefetch_file(path)
+        for directive, path in resolved:
+            if isinstance(directive, LibraryDirective) and directive.section:
+                # Section names match case-insensitively (see LibraryProcessor._find_start).
+                key = (path, directive.section.lower())
+                if key in includes.requested_sections:
+                    continue
+                includes.requested_sections.add(key)
+                if (sections := includes.section_indexes.get(path)) is not None:
+                    self._enqueue_section(directive, path, sections)
+                elif (waiting := includes.awaiting_index.get(path)) is not None:
+                    waiting.append(directive)
+                else:
+                    includes.awaiting_index[path] = [directive]
+                    future = self._submit(executor, self._library_processor.index_sections, path)
+                    self._run.index_lookups[future] = path
+            else:
+                self._enqueue(self._create_file_region(path))
+
+    def _resolve_directive(self, directive: IncludeDirective, context_filepath: str) -> Path | None:
+        """Resolves a directive's target path, warning on strict misses."""
         try:
-            path = self._resolve_path(directive.filepath, Path(context_filepath).parent)
+            return self._resolve_path(directive.filepath, os.path.dirname(context_filepath))
         except FileNotFoundError:
             if directive.strict:
                 _LOGGER.warning("Could not resolve include '%s' in %s", directive.filepath, context_filepath)
+            return None
+
+    def _handle_section_index(self, future: Future, path: Path):
+        """Records a completed library index and enqueues the sections waiting on it."""
+        sections = self._includes.section_indexes[path] = future.result()
+        for directive in self._includes.awaiting_index.pop(path):
+            self._enqueue_section(directive, path, sections)
+
+    def _enqueue_section(self, directive: LibraryDirective, path: Path, sections: dict[str, LibrarySection]):
+        """Enqueues the region of the section a directive names, warning if the library lacks it."""
+        if (section_info := sections.get(directive.section.lower())) is None:
+            _LOGGER.warning("Section '%s' not found in %s", directive.section, directive.filepath)
             return
-        if isinstance(directive, LibraryDirective) and directive.section:
-            try:
-                region = self._create_section_region(path=path, section=directive.section)
-                self._enqueue(region)
-            except ValueError:
-                _LOGGER.warning("Section '%s' not found in %s", directive.section, directive.filepath)
-        else:
-            region = self._create_file_region(path)
-            self._enqueue(region)
+        self._enqueue(self._create_section_region(path, section_info))
 
-    def _create_section_region(self, path: Path, section: str):
-        section_info = self._library_processor.find_section(path, section)
+    def _create_section_region(self, path: Path, section_info: LibrarySection) -> ParseRegion:
+        """Create a region spanning a library section's byte range."""
         return ParseRegion(
-            filepath=str(path),
+            filepath=sys.intern(str(path)),
             start_byte=section_info.start_byte,
             end_byte=section_info.end_byte,
             region_type=RegionType.GLOBAL,
@@ -155,15 +451,44 @@ class Compiler:
 
     def _create_file_region(self, path: Path) -> ParseRegion:
         """Create a region representing an entire file."""
-        return ParseRegion(filepath=str(path), start_byte=0, end_byte=WHOLE_FILE, region_type=RegionType.GLOBAL)
-
-    def _resolve_path(self, filename: str, base_dir: Path) -> Path:
-        """Resolve absolute path from filename relative to base or root."""
-        p = Path(filename)
-        if p.is_absolute() and p.exists():
-            return p
-        for candidate_root in (base_dir, self._root.parent):
-            candidate = candidate_root / filename
-            if candidate.exists():
-                return candidate.resolve()
-        raise FileNotFoundError(filename)
+        return ParseRegion(
+            filepath=sys.intern(str(path)), start_byte=0, end_byte=WHOLE_FILE, region_type=RegionType.GLOBAL
+        )
+
+    def _as_path(self, filepath: str) -> Path:
+        """Returns a cached Path for a region/directive filepath string."""
+        if (path := self._path_cache.get(filepath)) is None:
+            path = self._path_cache[filepath] = Path(filepath)
+        return path
+
+    def _resolve_path(self, filename: str, base_dir: str) -> Path:
+        """
+        Resolve absolute path from filename relative to base or root.
+
+        Results (including misses) are memoized per run on ``(filename,
+        base_dir)``: directives record their source file, so the same include
+        from sibling files would otherwise repeat the same ``stat`` probes.
+        """
+        key = (filename, base_dir)
+        resolved_paths = self._includes.resolved_paths
+        if key in resolved_paths:
+            path = resolved_paths[key]
+        else:
+            path = resolved_paths[key] = self._probe_path(filename, base_dir)
+        if path is None:
+            raise FileNotFoundError(filename)
+        return path
+
+    def _probe_path(self, filename: str, base_dir: str) -> Path | None:
+        """
+        Stats the candidate locations for *filename*, returning the first hit.
+
+        Works on plain strings with ``os.path`` and builds a Path only for the hit.
+        """
+        if os.path.isabs(filename) and os.path.exists(filename):
+            return Path(filename)
+        for candidate_root in (base_dir, self._root_dir):
+            candidate = os.path.join(candidate_root, filename)
+            if os.path.exists(candidate):
+                return Path(os.path.realpath(candidate))
+        return None
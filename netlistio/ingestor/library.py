@@ -11,7 +11,7 @@ from mmap import mmap
 from pathlib import Path
 from typing import Iterator
 
-from netlistio.ingestor.common import open_mmap
+from netlistio.ingestor.common import MADV_SEQUENTIAL, open_buffer
 from netlistio.models.parsing import LibrarySection
 
 __all__ = ["LibraryProcessor", "LibrarySection"]
@@ -22,47 +22,72 @@ class LibraryProcessor(abc.ABC):
     Scans library files to identify the byte boundaries of sections.
     """
 
+    # Section index per library file, created by the first find_section call so
+    # subclasses need not call __init__. Library files are assumed not to change
+    # while a processor is in use.
+    _section_indexes: dict[Path, dict[str, LibrarySection]] | None = None
+
     @abc.abstractmethod
     def find_start_indicator(self, line: mmap) -> Iterator[re.Match[str]]:
         """Find the start of a library section"""
 
     @abc.abstractmethod
-    def find_end_indicator(self, line: mmap) -> re.Match[str]:
-        """Find the end of a library section"""
+    def find_end_indicator(self, line: mmap, pos: int = 0) -> re.Match[str]:
+        """Find the end of a library section at or after byte offset *pos*"""
 
     def find_section(self, lib_path: Path, section_name: str) -> LibrarySection:
         """
         Locates the byte range of a specific section in a library file.
 
+        The first lookup in a file indexes all of its sections, so looking up
+        further corners of the same library does not rescan it.
+
         :param lib_path: Path to the library file.
         :param section_name: Name of the section to find.
         :return: LibrarySection containing start/end offsets.
         :raises ValueError: If section is not found.
         """
-        with open_mmap(lib_path) as mm:
-            start_offset = self._find_start(mm=mm, section_name=section_name)
-            if start_offset == -1:
-                raise ValueError(f"Section '{section_name}' not found in {lib_path}")
-            end_offset = self._find_end(mm=mm, start_offset=start_offset)
-            return LibrarySection(section_name, start_offset, end_offset)
-
-    def _find_start(self, mm, section_name: str):
-        start_offset = -1
-        for match in self.find_start_indicator(mm):
-            found_name = match.group("section").decode("utf-8", errors="ignore")
-            if found_name.lower() == section_name.lower():
+        if self._section_indexes is None:
+            self._section_indexes = {}
+        if (sections := self._section_indexes.get(lib_path)) is None:
+            sections = self._section_indexes[lib_path] = self.index_sections(lib_path)
+        if (section := sections.get(section_name.lower())) is None:
+            raise ValueError(f"Section '{section_name}' not found in {lib_path}")
+        return LibrarySection(section_name, section.start_byte, section.end_byte)
+
+    def index_sections(self, lib_path: Path) -> dict[str, LibrarySection]:
+        """
+        Locates every section of a library file in a single forward pass.
+
+        Names match case-insensitively and the first section of a name wins.
+        Each section starts just after its ``.lib`` line and ends at the first
+        end indicator at or after that point, or at end of file.
+
+        :param lib_path: Path to the library file.
+        :return: Lower-cased section name to LibrarySection.
+        """
+        sections: dict[str, LibrarySection] = {}
+        with open_buffer(lib_path, advice=MADV_SEQUENTIAL) as mm:
+            end_offset = -1
+            for match in self.find_start_indicator(mm):
+                name = match.group("section").decode("utf-8", errors="ignore")
+                if (key := name.lower()) in sections:
+                    continue
                 # We start parsing AFTER the .lib line to avoid
                 # the parser re-identifying it as a directive.
                 start_offset = match.end()
-                break
-        return start_offset
+                # Starts only move forward: an end not yet passed is still the first one.
+                if end_offset < start_offset:
+                    end_offset = self._find_end(mm, start_offset)
+                sections[key] = LibrarySection(name, start_offset, end_offset)
+        return sections
 
     def _find_end(self, mm, start_offset: int):
-        mm.seek(start_offset)
-        rest_of_file = mm.read()
-        end_match = self.find_end_indicator(rest_of_file)
+        # Search the mapping in place: copying the rest of the file would fault in
+        # and duplicate every page after the section, not just the ones scanned.
+        end_match = self.find_end_indicator(mm, start_offset)
         if end_match:
-            end_offset = start_offset + end_match.start()
+            end_offset = end_match.start()
         else:
-            end_offset = mm.size()
+            end_offset = len(mm)
         return end_offset
@@ -8,15 +8,12 @@ topologically sorts macros by dependency order to detect cycles.
 import logging
 from collections import deque
 from pathlib import Path
-from typing import Generator
-
-import networkx as nx
+from typing import Generator, Iterable
 
 from netlistio.models.generic import (
     Cell,
     Instance,
     Macro,
-    NetConnection,
     Netlist,
     Primitive,
 )
@@ -44,16 +41,13 @@ def link(parse_result: ParseResult, model_registry: ModelRegistry, netlist_class
     :return: LinkResult with linked netlist and errors.
     """
     errors: list[LinkError] = []
-    definitions_by_name = _build_definition_table(parse_result, errors)
+    definitions_by_name, top_instances = _partition_cells(parse_result, errors)
     for name, definition in definitions_by_name.items():
         model_registry.register_definition(name, definition)
-    top_instances = [cell for cell in parse_result.cells if isinstance(cell, Instance)]
     # When there are no top-level instances (library-only file), seed the traversal
     # with all defined macros so none are silently dropped by tree-shaking.
     seed_macros = (
-        {}
-        if top_instances
-        else {cell.name: cell for cell in parse_result.cells if isinstance(cell, Macro) and cell.name}
+        {} if top_instances else {cell.name: cell for cell in definitions_by_name.values() if isinstance(cell, Macro)}
     )
     used_macros, used_primitives = _tree_shake_and_link(top_instances, seed_macros, model_registry, errors)
     sorted_macros, cycle_errors = _topological_sort(used_macros)
@@ -67,36 +61,59 @@ def link(parse_result: ParseResult, model_registry: ModelRegistry, netlist_class
     return LinkResult(netlist=netlist, errors=errors, top_instances=top_instances)
 
 
-def _build_definition_table(parse_result: ParseResult, errors: list[LinkError]) -> dict[str, Cell]:
+def _partition_cells(parse_result: ParseResult, errors: list[LinkError]) -> tuple[dict[str, Cell], list[Instance]]:
     """
-    Builds lookup table for definitions (Macros/Models) and detects duplicates.
+    Splits top-level cells into a definition lookup table and the top-level instances.
+
+    Definition names are compared case-insensitively, matching
+    :class:`ModelRegistry` resolution; the first definition of a name wins.
 
     :param parse_result: Unlinked parse result.
     :param errors: Error list to append duplicate errors.
-    :return: Dictionary mapping definition names to Cell objects.
-    """
-    def_by_name = {}
-    for cell in parse_result.cells:
-        if not isinstance(cell, Instance):
-            if cell.name is None:
-                errors.append(
-                    LinkError(
-                        error_type=LinkErrorType.UNNAMED_CELL,
-                        message="Found a definition without a name, cannot link it.",
-                        affected_cells=[],
-                    )
+    :return: Tuple of (lowercased definition name to Cell, top-level instances in order).
+    """
+    def_by_name: dict[str, Cell] = {}
+    top_instances, definitions = _split_instances(parse_result.cells)
+    for cell in definitions:
+        if cell.name is None:
+            errors.append(
+                LinkError(
+                    error_type=LinkErrorType.UNNAMED_CELL,
+                    message="Found a definition without a name, cannot link it.",
+                    affected_cells=[],
                 )
-            elif cell.name in def_by_name:
-                errors.append(
-                    LinkError(
-                        error_type=LinkErrorType.DUPLICATE_DEFINITION,
-                        message=f"Duplicate definition: {cell.name}",
-                        affected_cells=[cell.name],
-                    )
+            )
+        elif (key := cell.name.lower()) in def_by_name:
+            errors.append(
+                LinkError(
+                    error_type=LinkErrorType.DUPLICATE_DEFINITION,
+                    message=f"Duplicate definition: {cell.name}",
+                    affected_cells=[cell.name],
                 )
-            else:
-                def_by_name[cell.name] = cell
-    return def_by_name
+            )
+        else:
+            def_by_name[key] = cell
+    return def_by_name, top_instances
+
+
+def _split_instances(cells: Iterable[Cell]) -> tuple[list[Instance], list[Cell]]:
+    """
+    Separates instances from definitions, keeping the order of each.
+
+    Instance has no subclasses, so testing the exact type is equivalent to
+    isinstance. Cells derive from abc.ABC, and every isinstance miss (each
+    definition) would go through ABCMeta.__instancecheck__; the identity test
+    costs the same on hits and a fraction of it on misses.
+
+    :param cells: Cells in parse order.
+    :return: Tuple of (instances, every other cell).
+    """
+    instances: list[Instance] = []
+    definitions: list[Cell] = []
+    for cell in cells:
+        # pylint: disable-next=unidiomatic-typecheck
+        (instances if type(cell) is Instance else definitions).append(cell)
+    return instances, definitions
 
 
 def _tree_shake_and_link(
@@ -115,7 +132,8 @@ def _tree_shake_and_link(
     used_primitives: set[Primitive] = set()
     visited_macros: set[str] = set(seed_macros)
     queue: deque[Instance] = deque(roots)
-    queue.extend(child for macro in seed_macros.values() for child in macro.children if isinstance(child, Instance))
+    for macro in seed_macros.values():
+        queue.extend(_split_instances(macro.children)[0])
     while queue:
         instance = queue.popleft()
         _resolve_instance_model(instance, model_registry, errors)
@@ -131,12 +149,12 @@ def _handle_macro(
     instance: Instance, visited_macros: set[str], used_macros: dict[str, Macro]
 ) -> Generator[Instance, None, None]:
     """
-    Maps formal ports onto the instance net dict and enqueues unvisited children.
+    Maps formal ports onto the instance connections and enqueues unvisited children.
 
-    The net dict keys are net names; after mapping, the values become the formal
-    Port objects from the macro definition so downstream analysis can identify
-    port roles. If the connection count does not match the port count the mapping
-    is skipped and a warning is emitted — the instance remains with None values.
+    Each NetConnection's ``port`` is filled in place with the formal Port from the
+    macro definition so downstream analysis can identify port roles. If the
+    connection count does not match the port count the mapping is skipped and a
+    warning is emitted — the connections keep ``port=None``.
 
     :param instance: Instance whose definition has already been resolved to a Macro.
     :param visited_macros: Set of macro names already enqueued (deduplication guard).
@@ -145,7 +163,8 @@ def _handle_macro(
     """
     macro = instance.definition
     if len(instance.nets) == len(macro.ports):
-        instance.nets = [NetConnection(net, port) for (net, _), port in zip(instance.nets, macro.ports)]
+        for connection, port in zip(instance.nets, macro.ports):
+            connection.port = port
     else:
         _LOGGER.warning(
             "Port count mismatch on instance '%s' of '%s': %d connection(s) provided, %d port(s) defined. "
@@ -158,9 +177,7 @@ def _handle_macro(
     if macro.name not in visited_macros:
         visited_macros.add(macro.name)
         used_macros[macro.name] = macro
-        for child in macro.children:
-            if isinstance(child, Instance):
-                yield child
+        yield from _split_instances(macro.children)[0]
 
 
 def _assign_primitive_ports(instance: Instance) -> None:
@@ -175,7 +192,8 @@ def _assign_primitive_ports(instance: Instance) -> None:
     """
     primitive = instance.definition
     if len(instance.nets) == len(primitive.ports):
-        instance.nets = [NetConnection(net, port) for (net, _), port in zip(instance.nets, primitive.ports)]
+        for connection, port in zip(instance.nets, primitive.ports):
+            connection.port = port
     else:
         _LOGGER.warning(
             "Port count mismatch on primitive instance '%s' (%s): %d connection(s), %d port(s). "
@@ -213,37 +231,74 @@ def _topological_sort(macro_by_name: dict[str, Macro]) -> tuple[list[Macro], lis
     """
     Topologically sorts macros by dependency order.
 
+    Uses Kahn's algorithm over plain dicts; macros that become ready at the
+    same time keep their definition order.
+
     :param macro_by_name: Macro lookup table.
     :return: Tuple of (sorted macros, cycle errors if any).
     """
-    graph = _build_dependency_graph(macro_by_name)
-    try:
-        sorted_names = list(nx.topological_sort(graph))
+    dependencies = _build_dependency_graph(macro_by_name)
+    consumers: dict[str, list[str]] = {name: [] for name in dependencies}
+    for name, deps in dependencies.items():
+        for dep in deps:
+            consumers[dep].append(name)
+    in_degree = {name: len(deps) for name, deps in dependencies.items()}
+    ready = deque(name for name, degree in in_degree.items() if degree == 0)
+    sorted_names: list[str] = []
+    while ready:
+        name = ready.popleft()
+        sorted_names.append(name)
+        for consumer in consumers[name]:
+            in_degree[consumer] -= 1
+            if in_degree[consumer] == 0:
+                ready.append(consumer)
+    if len(sorted_names) == len(dependencies):
         return [macro_by_name[name] for name in sorted_names], []
-    except nx.NetworkXUnfeasible:
-        cycle = nx.find_cycle(graph, orientation="original")
-        cycle_path = " → ".join([edge[0] for edge in cycle] + [cycle[0][0]])
-        error = LinkError(
-            error_type=LinkErrorType.CIRCULAR_DEPENDENCY,
-            message=f"Circular dependency detected: {cycle_path}",
-            affected_cells=[edge[0] for edge in cycle],
-        )
-        return list(macro_by_name.values()), [error]
+    cycle = _find_cycle(dependencies, {name for name, degree in in_degree.items() if degree})
+    error = LinkError(
+        error_type=LinkErrorType.CIRCULAR_DEPENDENCY,
+        message=f"Circular dependency detected: {' → '.join(cycle + [cycle[0]])}",
+        affected_cells=cycle,
+    )
+    return list(macro_by_name.values()), [error]
 
 
-def _build_dependency_graph(macro_by_name: dict[str, Macro]) -> nx.DiGraph:
+def _find_cycle(dependencies: dict[str, dict[str, None]], unsorted: set[str]) -> list[str]:
     """
-    Builds directed graph of macro dependencies.
+    Returns one dependency cycle among the macros Kahn's algorithm could not sort.
+
+    Every unsorted macro still has an unsorted dependency, so walking from
+    consumer to dependency within *unsorted* must revisit a macro.
+
+    :param dependencies: Macro name to the names of the macros it instantiates.
+    :param unsorted: Macros left with a non-zero in-degree.
+    :return: Cycle members ordered dependency-first, without repeating the first.
+    """
+    name = next(name for name in dependencies if name in unsorted)
+    position: dict[str, int] = {}
+    path: list[str] = []
+    while name not in position:
+        position[name] = len(path)
+        path.append(name)
+        name = next(dep for dep in dependencies[name] if dep in unsorted)
+    cycle = path[position[name] :]
+    # Reverse into dependency-first order, still starting from where the walk re-entered.
+    return [cycle[0], *reversed(cycle[1:])]
+
+
+def _build_dependency_graph(macro_by_name: dict[str, Macro]) -> dict[str, dict[str, None]]:
+    """
+    Builds the macro dependency table.
 
     :param macro_by_name: Macro lookup table.
-    :return: NetworkX directed graph with macros as nodes and dependencies as edges.
-    """
-    graph: nx.DiGraph = nx.DiGraph()
-    for macro in macro_by_name.values():
-        graph.add_node(macro.name)
-    for macro in macro_by_name.values():
-        for child in macro.children:
-            # Edge: dependency -> consumer, so the dependency sorts first.
-            if isinstance(child, Instance) and isinstance(child.definition, Macro):
-                graph.add_edge(child.definition.name, macro.name)
-    return graph
+    :return: Macro name to an insertion-ordered set (dict keys) of the macros it instantiates.
+    """
+    dependencies: dict[str, dict[str, None]] = {name: {} for name in macro_by_name}
+    for name, macro in macro_by_name.items():
+        deps = dependencies[name]
+        for child in _split_instances(macro.children)[0]:
+            # Only macros in the table take part; the dependency must sort first.
+            if isinstance(child.definition, Macro):
+                if child.definition.name in dependencies:
+                    deps[child.definition.name] = None
+    return dependencies
@@ -9,37 +9,243 @@ subclasses.
 from __future__ import annotations
 
 import abc
+import contextlib
+import gc
 import mmap
 import multiprocessing
+import os
+import pickle
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Any, Generator, Iterable
 
-from netlistio.ingestor.common import open_mmap
+from netlistio.ingestor.cache import ResultCache
+from netlistio.ingestor.common import (
+    MADV_DONTNEED,
+    MADV_SEQUENTIAL,
+    MADV_WILLNEED,
+    advise,
+    open_buffer,
+)
 from netlistio.models.generic import Cell, Instance, Macro
 from netlistio.models.parsing import (
+    WHOLE_FILE,
     IncludeDirective,
     ParseError,
     ParseRegion,
     ParseResult,
 )
 
-__all__ = ["ChunkParserFactory", "LineParser", "ChunkParser", "Parser"]
+__all__ = [
+    "ChunkParserFactory",
+    "LineParser",
+    "ChunkParser",
+    "Parser",
+    "WorkBatch",
+    "init_worker",
+    "largest_first",
+    "packed_batch_entry_point",
+    "unpack_result",
+]
+
+#: A picklable unit of work: consecutive regions of one file parsed by a single task
+#: (see :meth:`Parser.work_batches`).
+WorkBatch = tuple[str, list[ParseRegion], "ChunkParserFactory"]
+
+#: Regions are packed into batches spanning at least this many bytes.
+MIN_BATCH_BYTES = 64 * 1024
+# Batches are sized so each worker gets several; one slow batch cannot idle the rest.
+_BATCHES_PER_WORKER = 8
+#: Parser.parse handles files smaller than this in the calling process; starting a pool costs more.
+INLINE_PARSE_BYTES = 512 * 1024
+
+
+class _WorkerBuffers:
+    """
+    Keeps the most recently used file buffers open across a pool worker's tasks.
+
+    Consecutive regions usually come from the same file, so a worker maps each
+    file once instead of once per region. The cache is bounded to keep file
+    descriptors in check on netlists with thousands of includes, and it stays
+    disabled outside pool workers: a buffer held open in the caller would be
+    served stale if the file were rewritten between runs.
+    """
+
+    LIMIT = 8
+
+    def __init__(self):
+        self.enabled = False
+        self._open: OrderedDict[str, tuple[contextlib.ExitStack, bytes | mmap.mmap]] = OrderedDict()
+
+    def get(self, filepath: str) -> bytes | mmap.mmap:
+        """
+        Returns the open buffer for *filepath*, opening it (and evicting the oldest) if needed.
+
+        :param filepath: File to open.
+        :return: Buffer from :func:`open_buffer`, valid until evicted.
+        """
+        if (entry := self._open.get(filepath)) is not None:
+            self._open.move_to_end(filepath)
+            return entry[1]
+        stack = contextlib.ExitStack()
+        buffer = stack.enter_context(open_buffer(filepath))
+        self._open[filepath] = (stack, buffer)
+        if len(self._open) > self.LIMIT:
+            self._open.popitem(last=False)[1][0].close()
+        return buffer
+
+
+@dataclass(slots=True)
+class _WorkerSettings:
+    """
+    Per-process settings installed by :func:`init_worker`.
+
+    :param result_cache: Cache consulted before parsing, when the pool was given a cache directory.
+    """
+
+    result_cache: ResultCache | None = None
+
+
+_worker_buffers = _WorkerBuffers()
+_worker_settings = _WorkerSettings()
+
+
+def init_worker(cache_dir: str | None = None) -> None:
+    """
+    Pool initializer: lets this worker keep file buffers open between tasks.
+
+    :param cache_dir: Directory of a :class:`ResultCache` to consult before parsing, if any.
+    """
+    _worker_buffers.enabled = True
+    _worker_settings.result_cache = ResultCache(cache_dir) if cache_dir is not None else None
+
+
+def _worker_batch_entry_point(args: WorkBatch) -> ParseResult:
+    """
+    Worker process entry point for a batch of regions from one file.
+
+    The file buffer is obtained once for the whole batch, and the kernel is
+    told once that the batch's byte span will be read front to back. A buffer
+    kept open for later tasks has the span released again afterwards.
+
+    :param args: Tuple of (filepath, regions, chunk_parser_factory).
+    :return: ParseResult concatenating the regions' results in order.
+    """
+    return _parse_batch_cached(args, _worker_settings.result_cache)
+
+
+def _parse_batch_cached(args: WorkBatch, cache: ResultCache | None) -> ParseResult:
+    """Parses a batch, serving and storing its result through *cache* when one is given."""
+    filepath, regions, chunk_parser_factory = args
+    if cache is not None and (key := cache.key(filepath, regions, chunk_parser_factory)) is not None:
+        if (cached := cache.load(key)) is not None:
+            return cached
+        result = _parse_batch(filepath, regions, chunk_parser_factory)
+        cache.store(key, result)
+        return result
+    return _parse_batch(filepath, regions, chunk_parser_factory)
+
+
+def _parse_batch(filepath: str, regions: list[ParseRegion], chunk_parser_factory: ChunkParserFactory) -> ParseResult:
+    """Parses a batch of regions from one file; see :func:`_worker_batch_entry_point`."""
+    with contextlib.ExitStack() as stack:
+        if _worker_buffers.enabled:
+            mm = _worker_buffers.get(filepath)
+        else:
+            mm = stack.enter_context(open_buffer(filepath))
+        # Hint only this batch's span; other workers cover the rest of the file.
+        start = min(region.start_byte for region in regions)
+        end = WHOLE_FILE if any(r.end_byte == WHOLE_FILE for r in regions) else max(r.end_byte for r in regions)
+        advise(mm, MADV_SEQUENTIAL, start, end)
+        advise(mm, MADV_WILLNEED, start, end)
+        results = [_parse_region(filepath, mm, region, chunk_parser_factory) for region in regions]
+        if _worker_buffers.enabled:
+            # The mapping outlives the batch; drop the span's pages from it so a worker's
+            # footprint does not grow to the whole file. The page cache keeps them.
+            advise(mm, MADV_DONTNEED, start, end)
+    if len(results) == 1:
+        return results[0]
+    return ParseResult(
+        filepath=regions[0].filepath,
+        cells=[cell for result in results for cell in result.cells],
+        errors=[error for result in results for error in result.errors],
+        includes=[include for result in results for include in result.includes],
+    )
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Generator[None, None, None]:
+    """
+    Suspends the cyclic garbage collector for the duration of the block.
+
+    (Un)pickling a batch result allocates tens of thousands of container
+    objects, each allocation counting towards a collection that would traverse
+    the whole, still-growing, graph. None of it is garbage yet, so the passes
+    are pure overhead.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _pack_result(result: ParseResult) -> bytes:
+    """Pickles a worker's result in the worker, see :func:`_gc_paused`."""
+    with _gc_paused():
+        return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
 
-# A single picklable unit of work handed to a multiprocessing worker.
-_WorkItem = tuple[str, ParseRegion, "ChunkParserFactory"]
+def unpack_result(data: bytes) -> ParseResult:
+    """Restores a result packed by :func:`_pack_result`."""
+    with _gc_paused():
+        return pickle.loads(data)
 
 
-def _worker_entry_point(args: _WorkItem) -> ParseResult:
+def packed_batch_entry_point(args: WorkBatch) -> bytes:
     """
-    Worker process entry point for parallel parsing.
+    Pool entry point: :func:`_worker_batch_entry_point` with the result pre-pickled.
 
-    :param args: Tuple of (filepath, region, chunk_parser_factory).
-    :return: ParseResult from parsing the region.
+    The pool's own pickling of a result runs with the collector active on both
+    ends, in the parent on its result-handling thread. Returning bytes leaves
+    it a single buffer copy and lets the caller unpickle through
+    :func:`unpack_result` instead.
+
+    :param args: Tuple of (filepath, regions, chunk_parser_factory).
+    :return: Result pickled by :func:`_pack_result`.
     """
-    filepath, region, chunk_parser_factory = args
-    with open_mmap(filepath) as mm:
-        parser = chunk_parser_factory(filepath, mm, region)
-        return parser.parse()
+    return _pack_result(_worker_batch_entry_point(args))
+
+
+def _batch_bytes(batch: WorkBatch) -> int:
+    """Returns the bytes a batch spans; a region running to end of file counts as unbounded."""
+    return sum(sys.maxsize if r.end_byte == WHOLE_FILE else r.end_byte - r.start_byte for r in batch[1])
+
+
+def largest_first(batches: list[WorkBatch]) -> list[int]:
+    """
+    Orders batch indices for dispatch, largest span first.
+
+    The pool hands tasks to whichever worker is idle, so lengthy batches
+    started early overlap the many small ones instead of running alone after
+    them. Equal spans keep their original order.
+
+    :param batches: Batches as returned by :meth:`Parser.work_batches`.
+    :return: Indices into *batches* in dispatch order.
+    """
+    return sorted(range(len(batches)), key=lambda i: _batch_bytes(batches[i]), reverse=True)
+
+
+def _parse_region(
+    filepath: str, mm: bytes | mmap.mmap, region: ParseRegion, chunk_parser_factory: ChunkParserFactory
+) -> ParseResult:
+    """Parses one region of an open file buffer."""
+    return chunk_parser_factory(filepath, mm, region).parse()
 
 
 class ChunkParserFactory(abc.ABC):
@@ -66,8 +272,16 @@ class LineParser(abc.ABC):
 
     Subclasses implement format-specific logic for line iteration,
     instance parsing, and declaration parsing.
+
+    ``DIRECTIVE_CHARS`` optionally lets :meth:`ChunkParser.parse` skip handlers
+    that cannot succeed, by the first character of each logical line: a line
+    opening with one of them only tries :meth:`parse_declaration` and
+    :meth:`parse_include`, any other line only :meth:`parse_instance`. Unset,
+    every line tries all three.
     """
 
+    DIRECTIVE_CHARS: str | None = None
+
     def __init__(self, filepath: str | Path, mm: mmap.mmap, region: ParseRegion):
         """
         Initializes line parser with memory-mapped file and region.
@@ -151,25 +365,38 @@ class ChunkParser(abc.ABC):
         includes = []
         macro: Macro | None = None
 
+        line_parser = self.line_parser
+        directive_chars = line_parser.DIRECTIVE_CHARS
+        # Bound once: the loop runs per logical line, and each lookup would go through the instance and MRO.
+        parse_declaration = line_parser.parse_declaration
+        parse_include = line_parser.parse_include
+        parse_instance = line_parser.parse_instance
         for line in self:
-            # Handle declarations (Subckts, Models)
-            if decl := self.line_parser.parse_declaration(line):
-                if isinstance(decl, Macro):
-                    # It's a container (e.g., .subckt), this region defines it
-                    macro = decl
-                elif macro:
-                    # It's an atomic decl inside a macro (e.g., .model inside .subckt)
-                    macro.children.append(decl)
-                else:
-                    # It's a global atomic decl (e.g., .model at top level)
-                    cells.append(decl)
-
-            # Handle Includes
-            elif include_info := self.line_parser.parse_include(line):
-                includes.append(include_info)
+            # Lines are never empty, so line[0] is safe; a plain index beats any regex dispatch.
+            if directive_chars is None or line[0] in directive_chars:
+                # Handle declarations (Subckts, Models)
+                if decl := parse_declaration(line):
+                    if isinstance(decl, Macro):
+                        # It's a container (e.g., .subckt), this region defines it
+                        macro = decl
+                    elif macro:
+                        # It's an atomic decl inside a macro (e.g., .model inside .subckt)
+                        macro.children.append(decl)
+                    else:
+                        # It's a global atomic decl (e.g., .model at top level)
+                        cells.append(decl)
+                    continue
+
+                # Handle Includes
+                if include_info := parse_include(line):
+                    includes.append(include_info)
+                    continue
+
+                if directive_chars is not None:
+                    continue
 
             # Handle Instances
-            elif instance := self.line_parser.parse_instance(line):
+            if instance := parse_instance(line):
                 if macro:
                     macro.children.append(instance)
                 else:
@@ -177,11 +404,9 @@ class ChunkParser(abc.ABC):
 
         if macro:
             return ParseResult(
-                filepath=self.region.filepath, cells=[macro], errors=self.line_parser.errors, includes=includes
+                filepath=self.region.filepath, cells=[macro], errors=line_parser.errors, includes=includes
             )
-        return ParseResult(
-            filepath=self.region.filepath, cells=cells, errors=self.line_parser.errors, includes=includes
-        )
+        return ParseResult(filepath=self.region.filepath, cells=cells, errors=line_parser.errors, includes=includes)
 
 
 class Parser:
@@ -203,20 +428,76 @@ class Parser:
         self.scanner = scanner
         self.chunk_parser_factory = chunk_parser_factory
 
-    def parse(self, num_workers: int = 4) -> ParseResult:
+    def work_batches(self, num_workers: int) -> list[WorkBatch]:
+        """
+        Packs consecutive parse regions into batches, one picklable task each.
+
+        Files often split into thousands of tiny regions, and per-task pickling
+        and dispatch would then dominate. Regions are taken in order and a batch
+        is closed once it spans ``max(MIN_BATCH_BYTES, total / (num_workers * 8))``
+        bytes, so results concatenated batch by batch keep region order. A region
+        that alone reaches that size gets a batch of its own.
+
+        :param num_workers: Size of the pool the batches are meant for.
+        :return: List of (filepath, regions, chunk_parser_factory) tuples.
+        """
+        regions = list(self.scanner)
+        spans = [region.end_byte - region.start_byte for region in regions if region.end_byte != WHOLE_FILE]
+        target = max(MIN_BATCH_BYTES, sum(spans) // (max(num_workers, 1) * _BATCHES_PER_WORKER))
+        filepath = str(self.filepath)
+        batches: list[WorkBatch] = []
+        batch: list[ParseRegion] = []
+        batch_bytes = 0
+        for region in regions:
+            # A region running to end of file has no known size; treat it as oversized.
+            span = target if region.end_byte == WHOLE_FILE else region.end_byte - region.start_byte
+            if span >= target and batch:
+                # Oversized regions travel alone so they can be dispatched ahead of the rest.
+                batches.append((filepath, batch, self.chunk_parser_factory))
+                batch, batch_bytes = [], 0
+            batch.append(region)
+            batch_bytes += span
+            if batch_bytes >= target:
+                batches.append((filepath, batch, self.chunk_parser_factory))
+                batch, batch_bytes = [], 0
+        if batch:
+            batches.append((filepath, batch, self.chunk_parser_factory))
+        return batches
+
+    def parse(self, num_workers: int = 4, cache_dir: str | Path | None = None) -> ParseResult:
         """
         Parses the file using multiple worker processes.
 
+        Files under :data:`INLINE_PARSE_BYTES`, or a single worker, are parsed
+        in the calling process instead: the pool's startup and result pickling
+        would outweigh the parse itself.
+
         :param num_workers: Number of worker processes to spawn.
+        :param cache_dir: Optional :class:`ResultCache` directory for results of unchanged files.
         :return: Aggregated ParseResult from all workers.
         """
-        work_items = [(str(self.filepath), region, self.chunk_parser_factory) for region in self.scanner]
-        all_cells = []
-        all_errors = []
-        all_includes = set()
-        with multiprocessing.Pool(processes=num_workers) as pool:
-            for result in pool.imap_unordered(_worker_entry_point, work_items):
-                all_cells.extend(result.cells)
-                all_errors.extend(result.errors)
-                all_includes.update(result.includes)
-        return ParseResult(filepath=str(self.filepath), cells=all_cells, errors=all_errors, includes=list(all_includes))
+        batches = self.work_batches(num_workers)
+        cache_dir = None if cache_dir is None else os.fspath(cache_dir)
+        if num_workers <= 1 or self._file_size() < INLINE_PARSE_BYTES:
+            cache = ResultCache(cache_dir) if cache_dir is not None else None
+            results = [_parse_batch_cached(batch, cache) for batch in batches]
+        else:
+            with multiprocessing.Pool(processes=num_workers, initializer=init_worker, initargs=(cache_dir,)) as pool:
+                ordered = [batches[i] for i in largest_first(batches)]
+                # chunksize stays 1: batches are already coarse (about num_workers * 8
+                # of them), and grouping them would hand the largest ones to one worker.
+                results = [unpack_result(data) for data in pool.imap_unordered(packed_batch_entry_point, ordered)]
+        # Each output is built in one pass over the finished results.
+        return ParseResult(
+            filepath=str(self.filepath),
+            cells=list(chain.from_iterable(result.cells for result in results)),
+            errors=list(chain.from_iterable(result.errors for result in results)),
+            includes=list(set(chain.from_iterable(result.includes for result in results))),
+        )
+
+    def _file_size(self) -> int:
+        """Returns the file's size in bytes; sys.maxsize if it cannot be stat'ed, leaving the error to the workers."""
+        try:
+            return self.filepath.stat().st_size
+        except OSError:
+            return sys.maxsize
@@ -65,6 +65,13 @@ class SpiceReader(NetlistReader):
     3. Link (Linker): Tree-shaking resolution of instances to models/subckts.
     """
 
+    def __init__(self, cache_dir: str | Path | None = None):
+        """
+        :param cache_dir: Optional directory for caching parse results of
+            unchanged files across reads (see :class:`~netlistio.ingestor.cache.ResultCache`).
+        """
+        self._cache_dir = cache_dir
+
     def read(self, filepath: Path, num_workers: int | None = None) -> Netlist:
         num_workers = num_workers or os.cpu_count() or 1
         root_path = Path(filepath).resolve()
@@ -75,6 +82,7 @@ class SpiceReader(NetlistReader):
             scanner_factory=_spice_scanner_factory,
             library_factory=SpiceLibraryProcessor,
             num_workers=num_workers,
+            cache_dir=self._cache_dir,
         )
         parse_result = compiler.compile()
 
@@ -2,15 +2,21 @@
 
 import abc
 import mmap
+import re
+import sys
 from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
-from netlistio.ingestor.common import open_mmap
+from netlistio.ingestor.common import MADV_SEQUENTIAL, open_buffer
 from netlistio.models.parsing import ParseRegion, RegionType
 
 __all__ = ["ScanStrategy", "ScanContext", "Scanner"]
 
+# The line FSM splits the file this many bytes at a time (cut back to a newline).
+_BLOCK_BYTES = 4 * 1024 * 1024
+
 
 class ScanStrategy(abc.ABC):
     """
@@ -38,6 +44,34 @@ class ScanStrategy(abc.ABC):
         :return: True if line ends macro scope.
         """
 
+    def boundary_regex(self) -> re.Pattern[bytes] | None:
+        """
+        Optionally returns one pattern matching every macro boundary line.
+
+        When provided, the Scanner runs it once over the whole buffer and
+        replays the FSM on its matches alone instead of on every line. A match
+        opens a macro when its ``delimiter`` group is set (``name`` then holds
+        the macro name) and closes one otherwise. The pattern must agree with
+        :meth:`matches_macro_start` / :meth:`matches_macro_end` and never match
+        across a newline.
+
+        :return: Compiled multiline bytes pattern, or None to use the line FSM.
+        """
+        return None
+
+    def scan_buffer(self, mm: mmap.mmap, filepath: str) -> list[ParseRegion] | None:  # pylint: disable=unused-argument
+        """
+        Optionally scans the whole mapped file in one pass, bypassing the line FSM.
+
+        Strategies with a compiled or vectorized scanner override this. The
+        result must be identical to what the line-by-line FSM would produce.
+
+        :param mm: File buffer: an mmap, or ``bytes`` for files below ``SMALL_FILE_BYTES``.
+        :param filepath: Path recorded on the emitted regions.
+        :return: Ordered parse regions, or None to fall back to the line FSM.
+        """
+        return None
+
 
 @dataclass(slots=True)
 class ScanContext:
@@ -78,23 +112,41 @@ class Scanner:
         :param scan_strategy: Format-specific scanning strategy.
         """
         self.filepath = Path(filepath)
+        # One interned string shared by every emitted region; its hash is cached
+        # after first use, so downstream dedup by filepath never rehashes it.
+        self._region_path = sys.intern(str(self.filepath))
         self.context = ScanContext(scan_strategy=scan_strategy)
 
     def __iter__(self):
         yield from self.scan()
 
-    def _read_line(self, mm: mmap.mmap, start_pos: int) -> tuple[bytes, int, int] | None:
+    @staticmethod
+    def _line_blocks(mm: mmap.mmap) -> Iterator[list[bytes]]:
         """
-        Reads a single line from the memory-mapped file.
+        Splits the buffer into lists of lines, each line keeping its newline.
 
-        :param mm: Memory-mapped file object.
-        :param start_pos: Current position before reading.
-        :return: Tuple of (line_bytes, start_pos, end_pos) or None at EOF.
+        Blocks of about ``_BLOCK_BYTES`` end on a newline, so no line straddles
+        two blocks and concatenating every line reproduces the buffer.
+
+        :param mm: File buffer (mmap or bytes).
+        :return: Iterator over per-block line lists, in file order.
         """
-        line = mm.readline()
-        if not line:
-            return None
-        return (line, start_pos, mm.tell())
+        size = len(mm)
+        pos = 0
+        while pos < size:
+            cut = size if pos + _BLOCK_BYTES >= size else mm.rfind(b"\n", pos, pos + _BLOCK_BYTES) + 1
+            if cut == 0:
+                # A single line longer than a block.
+                newline = mm.find(b"\n", pos + _BLOCK_BYTES)
+                cut = size if newline == -1 else newline + 1
+            block = mm[pos:cut]
+            # splitlines also breaks on a lone "\r"; lines here end only at "\n".
+            if block.count(b"\r") == block.count(b"\r\n"):
+                yield block.splitlines(keepends=True)
+            else:
+                *lines, tail = block.split(b"\n")
+                yield [line + b"\n" for line in lines] + ([tail] if tail else [])
+            pos = cut
 
     def _handle_global_line(self, line: bytes, cur: int) -> None:
         """
@@ -107,14 +159,15 @@ class Scanner:
             if cur > self.context.current_start:
                 self.context.regions.append(
                     ParseRegion(
-                        filepath=str(self.filepath),
+                        filepath=self._region_path,
                         start_byte=self.context.current_start,
                         end_byte=cur,
                         region_type=RegionType.GLOBAL,
                     )
                 )
             delimiter, name = match
-            self.context.context_delimiter = delimiter
+            # Every macro of a file shares one delimiter string, pickled once per batch.
+            self.context.context_delimiter = sys.intern(delimiter)
             self.context.context_name = name
             self.context.current_start = cur
             self.context.depth = 1
@@ -135,7 +188,7 @@ class Scanner:
             if self.context.depth == 0:
                 self.context.regions.append(
                     ParseRegion(
-                        filepath=str(self.filepath),
+                        filepath=self._region_path,
                         start_byte=self.context.current_start,
                         end_byte=nxt,
                         region_type=RegionType.MACRO,
@@ -153,18 +206,54 @@ class Scanner:
         :param mm: Memory-mapped file object.
         """
         start_pos = 0
-        while True:
-            result = self._read_line(mm, start_pos)
-            if result is None:
-                break
-            line, start_pos, end_pos = result
-            if self.context.in_macro:
-                self._handle_macro_line(line, start_pos, end_pos)
-            else:
-                self._handle_global_line(line, start_pos)
-            start_pos = end_pos
+        for lines in self._line_blocks(mm):
+            for line in lines:
+                end_pos = start_pos + len(line)
+                if self.context.in_macro:
+                    self._handle_macro_line(line, start_pos, end_pos)
+                else:
+                    self._handle_global_line(line, start_pos)
+                start_pos = end_pos
         self._finalize_region(start_pos)
 
+    def _scan_boundaries(self, mm: mmap.mmap, regex: re.Pattern[bytes]) -> None:
+        """
+        Replays the state machine over the boundary lines matched by *regex*.
+
+        :param mm: File buffer (mmap or bytes).
+        :param regex: The strategy's :meth:`ScanStrategy.boundary_regex`.
+        """
+        ctx = self.context
+        for match in regex.finditer(mm):
+            if match.group("delimiter") is not None:
+                if ctx.depth == 0:
+                    if match.start() > ctx.current_start:
+                        ctx.regions.append(
+                            ParseRegion(self._region_path, ctx.current_start, match.start(), RegionType.GLOBAL)
+                        )
+                    ctx.current_start = match.start()
+                    ctx.context_delimiter = sys.intern(match.group("delimiter").decode("utf-8", errors="ignore"))
+                    ctx.context_name = match.group("name").decode("utf-8", errors="ignore")
+                ctx.depth += 1
+            elif ctx.depth:
+                ctx.depth -= 1
+                if ctx.depth == 0:
+                    line_end = mm.find(b"\n", match.end())
+                    nxt = len(mm) if line_end == -1 else line_end + 1
+                    ctx.regions.append(
+                        ParseRegion(
+                            filepath=self._region_path,
+                            start_byte=ctx.current_start,
+                            end_byte=nxt,
+                            region_type=RegionType.MACRO,
+                            context_delimiter=ctx.context_delimiter,
+                            context_name=ctx.context_name,
+                        )
+                    )
+                    ctx.current_start = nxt
+        # An unterminated macro at EOF is emitted as GLOBAL, like the line FSM does.
+        self._finalize_region(len(mm))
+
     def _finalize_region(self, start_pos: int) -> None:
         """
         Finalizes the current region at EOF.
@@ -173,7 +262,7 @@ class Scanner:
         """
         if start_pos > self.context.current_start:
             self.context.regions.append(
-                ParseRegion(str(self.filepath), self.context.current_start, start_pos, RegionType.GLOBAL)
+                ParseRegion(self._region_path, self.context.current_start, start_pos, RegionType.GLOBAL)
             )
 
     def scan(self) -> deque[ParseRegion]:
@@ -182,9 +271,14 @@ class Scanner:
 
         :return: Queue of ParseRegion objects representing file structure.
         """
-        self.context = ScanContext(scan_strategy=self.context.scan_strategy)
-        if self.filepath.stat().st_size == 0:
-            return self.context.regions
-        with open_mmap(self.filepath) as mm:
-            self._scan_regions(mm)
+        strategy = self.context.scan_strategy
+        self.context = ScanContext(scan_strategy=strategy)
+        # Boundary discovery is one forward pass over the whole file.
+        with open_buffer(self.filepath, advice=MADV_SEQUENTIAL) as mm:
+            if (regions := strategy.scan_buffer(mm, self._region_path)) is not None:
+                self.context.regions.extend(regions)
+            elif (regex := strategy.boundary_regex()) is not None:
+                self._scan_boundaries(mm, regex)
+            else:
+                self._scan_regions(mm)
         return self.context.regions
@@ -6,10 +6,12 @@ Crucially, it distinguishes between library *references* (directives)
 and library *definitions* (structural markers).
 """
 
+import functools
 import mmap
 import re
+import sys
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Generator, Iterator
 
 from netlistio.ingestor.library import LibraryProcessor
 from netlistio.ingestor.parser import ChunkParser, ChunkParserFactory, LineParser
@@ -20,6 +22,7 @@ from netlistio.models.parsing import (
     IncludeDirective,
     LibraryDirective,
     ParseRegion,
+    RegionType,
 )
 from netlistio.models.spice import (
     MOSFET,
@@ -29,6 +32,7 @@ from netlistio.models.spice import (
     Subckt,
     get_definition_from_prefix,
     passive_registry,
+    prefix_registry,
 )
 
 __all__ = ["SpiceScanStrategy", "SpiceChunkParserFactory", "SpiceLineParser", "SPICE_COMMENT_CHARS"]
@@ -37,13 +41,47 @@ SPICE_COMMENT_CHARS = ("*", "$")
 
 # The passive set is fixed once models.spice finishes importing; snapshot it once.
 _PASSIVE_TYPES = passive_registry()
+# Likewise the prefix registry; both spellings are keyed so a lookup needs no upper().
+_PREFIX_CLASSES: dict[str, type] = {
+    spelling: cls for prefix, cls in prefix_registry().items() for spelling in (prefix.upper(), prefix.lower())
+}
+# ASCII characters that open a bare numeric value; other Unicode digits fall back to isdigit().
+_VALUE_START = frozenset("0123456789.-+")
+
+
+@functools.cache
+def _load_scan_kernel():
+    """
+    Imports the compiled scan kernel module on first use.
+
+    Importing numba takes longer than scanning most netlists, so it is
+    deferred until a file actually reaches ``SpiceScanStrategy.JIT_MIN_BYTES``.
+    """
+    from netlistio.ingestor import _scan_kernel  # pylint: disable=import-outside-toplevel
+
+    return _scan_kernel
 
 
 class SpiceScanStrategy(ScanStrategy):
-    """SPICE-specific scanning strategy."""
+    """
+    SPICE-specific scanning strategy.
+
+    Files of at least ``JIT_MIN_BYTES`` are scanned by the Numba kernel in
+    ``_scan_kernel`` when numba is installed. Smaller files (and every file
+    without numba) are handed back to the Scanner, which runs ``RE_BOUNDARY``
+    (see ``boundary_regex``) in a single ``finditer`` over the buffer. This avoids the kernel's first-call compile
+    latency while still touching only the boundary lines from Python.
+    """
 
     RE_SUBCKT = re.compile(rb"^\s*(?P<delimiter>\.subckt)\s+(?P<name>[^\s]+)", re.IGNORECASE | re.MULTILINE)
     RE_ENDS = re.compile(rb"^\s*\.ends", re.IGNORECASE | re.MULTILINE)
+    # Whole-buffer union of RE_SUBCKT and RE_ENDS. Whitespace around the keyword
+    # excludes "\n" so a match never spans lines, as the per-line patterns cannot.
+    RE_BOUNDARY = re.compile(
+        rb"^[^\S\n]*(?:(?P<delimiter>\.subckt)[^\S\n]+(?P<name>[^\s]+)|\.ends)", re.IGNORECASE | re.MULTILINE
+    )
+    JIT_MIN_BYTES = 1 << 20
+    _DELIMITER_LEN = len(".subckt")
 
     def matches_macro_start(self, line: bytes) -> tuple[str, str] | None:
         """
@@ -52,7 +90,8 @@ class SpiceScanStrategy(ScanStrategy):
         :param line: Raw line bytes from the file.
         :return: Tuple of (delimiter, name) on match, otherwise None.
         """
-        if match := self.RE_SUBCKT.search(line):
+        # match, not search: the pattern is anchored, and search would retry it at every offset on a miss.
+        if match := self.RE_SUBCKT.match(line):
             delimiter = match.group("delimiter").decode("utf-8", errors="ignore")
             name = match.group("name").decode("utf-8", errors="ignore")
             return (delimiter, name)
@@ -67,12 +106,78 @@ class SpiceScanStrategy(ScanStrategy):
         """
         return self.RE_ENDS.match(line) is not None
 
+    def boundary_regex(self) -> re.Pattern[bytes]:
+        """
+        Returns ``RE_BOUNDARY``, the union of the SUBCKT and ENDS line patterns.
+
+        :return: Compiled multiline bytes pattern.
+        """
+        return self.RE_BOUNDARY
+
+    def scan_buffer(self, mm: mmap.mmap, filepath: str) -> list[ParseRegion] | None:
+        """
+        Scans the whole file with the compiled kernel.
+
+        :param mm: Memory-mapped file object.
+        :param filepath: Path recorded on the emitted regions.
+        :return: Ordered parse regions, or None below ``JIT_MIN_BYTES`` or without numba.
+        """
+        if len(mm) < self.JIT_MIN_BYTES or not (kernel := _load_scan_kernel()).HAS_NUMBA:
+            return None
+        kernel.warm_up()
+        buf = kernel.np.frombuffer(mm, dtype=kernel.np.uint8)
+        try:
+            rows = kernel.scan_spice(buf)
+        finally:
+            # The array exports the mmap buffer; it must be released before the mmap closes.
+            del buf
+        # One flat int list per column: rows.tolist() would allocate a list per
+        # row, and those GC-tracked lists trigger repeated collections.
+        return self._regions_from_rows(mm, filepath, [column.tolist() for column in rows.T], kernel.KIND_GLOBAL)
+
+    # The locals are hoisted and the MACRO decode is inlined on purpose: a helper call per
+    # row made this loop about 10% slower on a 600k-region file.
+    def _regions_from_rows(  # pylint: disable=too-many-locals
+        self, mm: mmap.mmap, filepath: str, columns: list[list[int]], global_kind: int
+    ) -> list[ParseRegion]:
+        """
+        Converts kernel rows into ParseRegions, decoding each SUBCKT delimiter and name.
+
+        The kernel itself is a small share of a large scan; building the regions
+        dominates, so this loop creates them positionally and decodes each
+        distinct delimiter spelling only once.
+
+        :param columns: The kernel's row columns, each as a list of ints.
+        """
+        regions: list[ParseRegion] = []
+        append = regions.append
+        delimiters: dict[bytes, str] = {}
+        delimiter_len = self._DELIMITER_LEN
+        for start, end, kind, delim, name_start, name_end in zip(*columns):
+            if kind == global_kind:
+                append(ParseRegion(filepath, start, end, RegionType.GLOBAL))
+                continue
+            raw = mm[delim : delim + delimiter_len]
+            if (delimiter := delimiters.get(raw)) is None:
+                delimiter = delimiters[raw] = sys.intern(raw.decode("utf-8", errors="ignore"))
+            name = mm[name_start:name_end].decode("utf-8", errors="ignore")
+            append(ParseRegion(filepath, start, end, RegionType.MACRO, delimiter, name))
+        return regions
+
 
 class SpiceChunkParser(ChunkParser):
     """SPICE-specific chunk parser that assembles logical lines from physical ones."""
 
     COMMENT_CHARS = ("*", "$")
     CONTINUATION_CHAR = "+"
+    # Physical lines are decoded and split a block at a time; blocks end on a newline.
+    READ_BLOCK_BYTES = 1 << 20
+    # A blank or comment line with the newline before it. [^\S\n] is the whitespace
+    # str.strip() removes, minus "\n". Both patterns open with "\n", so the regex
+    # engine skips ahead to line breaks instead of trying every offset.
+    RE_SKIPPED_LINE = re.compile(r"\n[^\S\n]*(?:[" + re.escape("".join(COMMENT_CHARS)) + r"][^\n]*)?(?=\n|\Z)")
+    # A line break followed by a continuation marker; see _fold_continuations.
+    RE_CONTINUATION = re.compile(r"\n[^\S\n]*" + re.escape(CONTINUATION_CHAR) + r"[^\S\n]*")
 
     def __init__(self, mm: mmap.mmap, region: ParseRegion, line_parser: LineParser):
         super().__init__(mm, region, line_parser)
@@ -88,96 +193,150 @@ class SpiceChunkParser(ChunkParser):
         """
         return not line or line[0] in self.COMMENT_CHARS
 
-    def _is_continuation(self, line: str) -> bool:
+    def _region_stop(self) -> int:
         """
-        Returns True if *line* is a SPICE continuation line (starts with ``+``).
+        Returns the byte offset just past the region's last physical line.
 
-        :param line: Decoded, stripped physical line.
+        A line that starts before ``end_byte`` is read in full, so a boundary
+        that falls mid-line extends to that line's newline.
         """
-        return line.startswith(self.CONTINUATION_CHAR)
+        size = len(self.mm)
+        if self.region.end_byte == WHOLE_FILE or self.region.end_byte >= size:
+            return size
+        if self.region.end_byte <= self.region.start_byte:
+            return self.region.start_byte
+        newline = self.mm.find(b"\n", self.region.end_byte - 1)
+        return size if newline == -1 else newline + 1
 
-    def _read_physical_line(self) -> str | None:
+    def _iter_blocks(self) -> Iterator[str]:
         """
-        Reads and decodes a single physical line from the mmap.
+        Yields the region's text, decoded a block at a time.
 
-        Respects the region's ``end_byte`` boundary; returns None at EOF or
-        when the boundary is exceeded.
-
-        :return: Stripped line string, or None if the region is exhausted.
+        Each block of up to ``READ_BLOCK_BYTES`` ends on a newline (or the
+        region's end), so no line or multi-byte character is split.
         """
-        if self.mm.tell() >= self.region.end_byte and self.region.end_byte != WHOLE_FILE:
-            return None
-        self.current_line_number += 1
-        line_bytes = self.mm.readline()
-        if not line_bytes:
-            return None
-        return line_bytes.decode("utf-8", errors="ignore").strip()
+        mm = self.mm
+        pos, stop = self.region.start_byte, self._region_stop()
+        while pos < stop:
+            block_end = min(pos + self.READ_BLOCK_BYTES, stop)
+            if block_end < stop:
+                newline = mm.rfind(b"\n", pos, block_end)
+                if newline == -1:
+                    newline = mm.find(b"\n", block_end, stop)
+                block_end = stop if newline == -1 else newline + 1
+            # Decode straight from the mapping; the views are released before any yield
+            # so the mmap can always close, even if iteration is abandoned.
+            with memoryview(mm) as whole, whole[pos:block_end] as block:
+                text = str(block, "utf-8", "ignore")
+            self.current_line_number += text.count("\n") + (not text.endswith("\n"))
+            yield text
+            pos = block_end
 
-    def _consume_title_line(self) -> list[str] | None:
+    def _drop_title_line(self, text: str) -> str:
         """
         Handles the SPICE title-line convention for GLOBAL regions.
 
         SPICE requires that the first line of a netlist file be treated as a
-        title/comment regardless of its content. This method reads and discards
-        that line when processing a region that starts at byte 0.
+        title/comment regardless of its content, so the first line of a region
+        starting at byte 0 is dropped unless it is a comment or a directive.
 
-        :return: Seed accumulator (``[directive]`` if the first line is a
-            directive, otherwise ``[]``), or None if the region is empty.
+        :param text: The region's first block.
+        :return: *text*, without its first line if that line is the title.
         """
-        if self.region.start_byte != 0 or self._title_line_consumed:
-            return []
-        first_line = self._read_physical_line()
-        if first_line is None:
-            return None
-        if self._is_comment(first_line):
-            return []
-        if first_line.startswith("."):
-            return [first_line]
+        first_line, newline, rest = text.partition("\n")
+        first_line = first_line.strip()
+        if self._is_comment(first_line) or first_line.startswith("."):
+            return text
         self._title_line_consumed = True
-        return []
+        return rest if newline else ""
+
+    def _fold_continuations(self, text: str) -> str:
+        """
+        Joins every continued line of *text* to the line before it with one space.
+
+        The continued line also loses its trailing whitespace, a CRLF ``\r``
+        included, as ``str.strip()`` would. A pattern consuming that whitespace
+        could not open on ``"\n"``, so the regex engine would try every offset;
+        splitting on the break and stripping each piece stays fast.
+
+        :param text: Lines of a block, comment lines already removed.
+        :return: *text* with one line per logical line.
+        """
+        parts = self.RE_CONTINUATION.split(text)
+        if len(parts) == 1:
+            return text
+        last = parts.pop()
+        parts = [part.rstrip() for part in parts]
+        parts.append(last)
+        return " ".join(parts)
 
     def __iter__(self) -> Generator[str, Any, Any]:
         """
         Iterates over logical lines in the region.
 
-        Handles SPICE ``+`` continuation lines by accumulating them into
-        single logical lines. Filters out SPICE comments (``*``, ``$``). In
-        GLOBAL regions, skips the first non-directive line as it is
-        traditionally a SPICE title line. Never yields empty strings.
-        """
-        self.mm.seek(self.region.start_byte)
-        accumulated = self._consume_title_line()
-        if accumulated is None:
-            return
-        while (line := self._read_physical_line()) is not None:
-            if self._is_comment(line):
-                continue
-            if self._is_continuation(line):
-                accumulated.append(line[1:].strip())
-                continue
-            if accumulated:
-                yield " ".join(accumulated)
-            accumulated = [line]
-        if accumulated:
-            yield " ".join(accumulated)
+        Handles SPICE ``+`` continuation lines by folding them into single
+        logical lines. Filters out SPICE comments (``*``, ``$``). In GLOBAL
+        regions, skips the first non-directive line as it is traditionally a
+        SPICE title line. Never yields empty strings.
+
+        Folding runs on whole blocks in the regex engine: comment lines are
+        removed and continuation breaks replaced by a space, leaving one
+        logical line per remaining line. The last line of a block is carried
+        into the next one, whose first lines may continue it.
+        """
+        check_title = self.region.start_byte == 0 and not self._title_line_consumed
+        continuation = self.CONTINUATION_CHAR
+        carry = ""
+        for text in self._iter_blocks():
+            if check_title:
+                text = self._drop_title_line(text)
+                check_title = False
+            # Every line, the first included, gets a leading "\n" for the patterns to anchor on.
+            text = carry + self.RE_SKIPPED_LINE.sub("", "\n" + text)
+            lines = self._fold_continuations(text).split("\n")
+            carry = lines.pop()
+            for line in lines:
+                line = line.strip()
+                # A continuation with no line before it to join still has its marker.
+                if line and line[0] == continuation:
+                    line = line[1:].strip()
+                if line:
+                    yield line
+        carry = carry.strip()
+        if carry and carry[0] == continuation:
+            carry = carry[1:].strip()
+        if carry:
+            yield carry
 
 
 class SpiceLineParser(LineParser):
     """SPICE-specific line parser."""
 
-    _SUBCKT = ".SUBCKT"
+    # Declarations and includes all open with "." or "[", and no instance prefix is
+    # either, so the first character picks the one handler family to try.
+    DIRECTIVE_CHARS = ".["
     _RE_EQUALS_NORM = re.compile(r"\s*=\s*")
+    # An "=" with whitespace on either side, the only case _RE_EQUALS_NORM changes.
+    # Opening on the literal "=" lets the engine skip straight between equals signs.
+    _RE_SPACED_EQUALS = re.compile(r"=(?:(?<=\s=)|\s)")
     _MODEL_PATTERN = r"^\s*(?P<delimiter>\.model)\s+(?P<name>\S+)\s+(?P<type>\S+)\s*(?P<params>.*)$"
     RE_MODEL_STR = re.compile(_MODEL_PATTERN, re.IGNORECASE | re.MULTILINE)
-    RE_LIB_DIRECTIVE = re.compile(
-        rb"^\s*\.lib\s+(?:[\"'](?P<q_filename>[^\"']+)[\"']|(?P<u_filename>[^\s]+))(?:\s+(?P<section>[^\s]+))?\s*$",
-        re.IGNORECASE | re.MULTILINE,
+    # A .SUBCKT prefix or a whole .MODEL line, told apart by one anchored match;
+    # the model branch carries RE_MODEL_STR's groups for _parse_model.
+    RE_DECLARATION = re.compile(
+        r"\s*(?:(?P<subckt>\.subckt)|" + _MODEL_PATTERN.removeprefix(r"^\s*") + ")", re.IGNORECASE | re.MULTILINE
     )
-    RE_INCLUDE = re.compile(
-        rb"^\s*\.include\s+(?:[\"'](?P<q_filename>[^\"']+)[\"']|(?P<u_filename>[^\s]+))", re.IGNORECASE | re.MULTILINE
+    # .include, .lib and the Cadence [! ] / [? ] forms in a single pattern; the
+    # keyword group that participated selects the directive built from it.
+    # re.ASCII keeps \s and case folding to the ASCII rules of a bytes pattern.
+    RE_DIRECTIVE = re.compile(
+        r"^\s*(?:"
+        r"(?P<include>\.include)\s+(?:[\"'](?P<include_q>[^\"']+)[\"']|(?P<include_u>[^\s]+))"
+        r"|(?P<lib>\.lib)\s+(?:[\"'](?P<lib_q>[^\"']+)[\"']|(?P<lib_u>[^\s]+))(?:\s+(?P<section>[^\s]+))?\s*$"
+        r"|\[(?P<cadence>[!?])\s*(?P<cadence_path>[^\"\]]+)\s*\]"
+        r")",
+        re.ASCII | re.IGNORECASE | re.MULTILINE,
     )
-    RE_CADENCE_STRICT = re.compile(rb'^\s*\[\!\s*(?P<filename>[^"\]]+)\s*\]', re.IGNORECASE | re.MULTILINE)
-    RE_CADENCE_LENIENT = re.compile(rb'^\s*\[\?\s*(?P<filename>[^"\]]+)\s*\]', re.IGNORECASE | re.MULTILINE)
 
     def parse_instance(self, line: str) -> Instance | None:
         """
@@ -217,7 +376,10 @@ class SpiceLineParser(LineParser):
         :param line: Raw logical line.
         :return: Tuple of (name_token, remaining_tokens) or (None, []).
         """
-        tokens = self._RE_EQUALS_NORM.sub("=", line).split()
+        # Most lines write key=value unspaced; only rewrite the line when needed.
+        if self._RE_SPACED_EQUALS.search(line):
+            line = self._RE_EQUALS_NORM.sub("=", line)
+        tokens = line.split()
         if len(tokens) < 2:
             return None, []
         return tokens[0], tokens[1:]
@@ -229,8 +391,12 @@ class SpiceLineParser(LineParser):
         :param name_token: The full instance name (e.g. ``R1``, ``Xbuf``).
         :return: The definition class, or None if the prefix is unrecognised.
         """
+        prefix = name_token[0]
+        if (definition_cls := _PREFIX_CLASSES.get(prefix)) is not None or prefix.isascii():
+            return definition_cls
+        # A non-ASCII letter may still upper-case onto a registered prefix.
         try:
-            return get_definition_from_prefix(name_token[0])
+            return get_definition_from_prefix(prefix)
         except ValueError:
             return None
 
@@ -240,9 +406,8 @@ class SpiceLineParser(LineParser):
         """
         Extracts nets, params, and the definition name from the token list.
 
-        Mutates *tokens* in place: key=value pairs are removed and (for passives)
-        a trailing numeric value token is also removed. What remains after both
-        extractions is the net-and-model token sequence.
+        For passives a trailing numeric value token is first popped from
+        *tokens*; the rest is split by :meth:`_split_device_tokens`.
 
         :param tokens: Mutable token list (everything after the instance name).
         :param definition_cls: Device class resolved from the instance prefix.
@@ -250,8 +415,7 @@ class SpiceLineParser(LineParser):
         """
         params: dict[str, str] = {}
         definition_name = self._handle_passive_prefix(tokens, definition_cls, params)
-        self._extract_params(tokens, params)
-        nets_list, definition_name = self._separate_nets_from_model(tokens, definition_name)
+        nets_list, definition_name = self._split_device_tokens(tokens, params, definition_name)
         return nets_list, params, definition_name
 
     def _handle_passive_prefix(self, tokens: list[str], definition_cls: type, params: dict[str, str]) -> str | None:
@@ -270,35 +434,43 @@ class SpiceLineParser(LineParser):
         if definition_cls not in _PASSIVE_TYPES:
             return None
         if tokens and self._is_value(tokens[-1]):
-            params["value"] = tokens.pop()
+            params["value"] = sys.intern(tokens.pop())
         return definition_cls.name
 
-    def _separate_nets_from_model(
-        self, tokens: list[str], definition_name: str | None
+    def _split_device_tokens(
+        self, tokens: list[str], params: dict[str, str], definition_name: str | None
     ) -> tuple[list[NetConnection], str | None]:
         """
-        Partitions remaining tokens into net names and the model/subckt reference.
+        Partitions tokens into parameters, net names and the model/subckt reference.
 
-        Iterates from the end: the last token not yet assigned to
-        *definition_name* becomes the model reference; all preceding tokens
-        are net connections (restored to forward order).
+        A single pass from the end: ``key=value`` tokens go to *params*, the
+        last other token becomes the model reference unless *definition_name*
+        is already set, and all preceding tokens are net connections (restored
+        to forward order). For a repeated key the first occurrence wins.
 
         Duplicate net names are preserved — two terminals tied to the same net
         (e.g. source and bulk both on vss) produce two separate entries so that
         positional port assignment in the linker remains correct.
 
-        :param tokens: Tokens remaining after param and passive-value extraction.
+        Net names and parameter keys and values are interned: supply nets and
+        the same few parameters (``w``, ``l``, ``m``) and sizes repeat on most
+        lines, and shared strings pickle once per result instead of once per use.
+
+        :param tokens: Tokens after the instance name and any passive value; not modified.
+        :param params: Params dict to populate.
         :param definition_name: Pre-assigned definition name (passives only).
         :return: Tuple of (nets_list, definition_name).
         """
-        nets: list[str] = []
+        nets: list[NetConnection] = []
         for token in reversed(tokens):
-            if definition_name is None:
+            if (eq := token.find("=")) != -1:
+                params[sys.intern(token[:eq])] = sys.intern(token[eq + 1 :])
+            elif definition_name is None:
                 definition_name = token
             else:
-                nets.append(token)
+                nets.append(NetConnection(sys.intern(token)))
         nets.reverse()
-        return [NetConnection(n) for n in nets], definition_name
+        return nets, definition_name
 
     def _build_instance(
         self,
@@ -311,9 +483,9 @@ class SpiceLineParser(LineParser):
         """
         Assembles the final Instance, handling Subckt vs Primitive distinction.
 
-        Subckts carry an unresolved ``definition_name`` for the linker to
-        resolve; primitives are instantiated directly (with MOSFET refinement
-        applied when possible).
+        Subckts carry an unresolved, interned ``definition_name`` for the
+        linker to resolve; primitives are instantiated directly (with MOSFET
+        refinement applied when possible).
 
         :param name_token: Full instance name string (e.g. ``M1``).
         :param definition_cls: Device class resolved from the prefix.
@@ -323,6 +495,8 @@ class SpiceLineParser(LineParser):
         :return: Populated Instance.
         """
         if issubclass(definition_cls, Subckt) or getattr(definition_cls, "inst_prefix", None) == "X":
+            if definition_name is not None:
+                definition_name = sys.intern(definition_name)
             return Instance(name=name_token, nets=nets_list, params=params, definition_name=definition_name)
         definition = self._resolve_primitive(definition_cls, definition_name)
         return Instance(name=name_token, nets=nets_list, params=params, definition=definition)
@@ -358,25 +532,6 @@ class SpiceLineParser(LineParser):
             return PMOS()  # pylint: disable=no-value-for-parameter
         return MOSFET()  # pylint: disable=no-value-for-parameter
 
-    def _extract_params(self, tokens: list[str], params: dict[str, str]) -> None:
-        """
-        Extracts ``key=value`` tokens from *tokens* into *params* in place.
-
-        Iterates the token list backwards so indices remain valid as items are
-        removed. Tokens without ``=`` are left untouched and remain as net names
-        or the model reference for the caller to handle.
-
-        :param tokens: Mutable token list; matched pairs are removed.
-        :param params: Params dict to populate.
-        """
-        i = len(tokens) - 1
-        while i >= 0:
-            if "=" in (token := tokens[i]):
-                k, v = token.split("=", 1)
-                params[k] = v
-                tokens.pop(i)
-            i -= 1
-
     def _is_value(self, token: str) -> bool:
         """
         Returns True if *token* looks like a bare numeric value (e.g. ``10k``, ``1.5e-9``).
@@ -388,7 +543,7 @@ class SpiceLineParser(LineParser):
         if not token:
             return False
         c = token[0]
-        return c.isdigit() or c in (".", "-", "+")
+        return c in _VALUE_START or c.isdigit()
 
     def parse_declaration(self, line: str):
         """
@@ -397,11 +552,11 @@ class SpiceLineParser(LineParser):
         :param line: Logical line string.
         :return: Subckt, Model, or None if the line is neither.
         """
-        if line.lstrip().upper().startswith(self._SUBCKT):
+        if not (match := self.RE_DECLARATION.match(line)):
+            return None
+        if match["subckt"]:
             return self._parse_subckt(line)
-        if match := self.RE_MODEL_STR.search(line):
-            return self._parse_model(match)
-        return None
+        return self._parse_model(match)
 
     def _parse_subckt(self, line: str) -> Subckt | None:
         """
@@ -418,18 +573,18 @@ class SpiceLineParser(LineParser):
             return None
         _, name, *port_tokens = tokens
         ports = [p for p in port_tokens if "=" not in p]
-        return Subckt(name=name, ports=tuple(Port(p) for p in ports))
+        return Subckt(name=sys.intern(name), ports=tuple(Port.get(p) for p in ports))
 
     def _parse_model(self, match: re.Match) -> Model:
         """
         Parses a .MODEL declaration into a Model.
 
-        :param match: Regex match from RE_MODEL_STR against the line.
+        :param match: Regex match from RE_DECLARATION (or RE_MODEL_STR) against the line.
         :return: Populated Model instance.
         """
         return Model(
-            name=match.group("name"),
-            base_type=match.group("type"),
+            name=sys.intern(match.group("name")),
+            base_type=sys.intern(match.group("type")),
             params=self._parse_model_params(match.group("params")),
         )
 
@@ -467,56 +622,18 @@ class SpiceLineParser(LineParser):
         :param line: Logical line string.
         :return: IncludeDirective, LibraryDirective, or None.
         """
-        encoded = line.encode("utf-8")
-        if match := self.RE_INCLUDE.search(encoded):
-            return IncludeDirective(filepath=self._extract_filename(match), source_file=self.filepath)
-        if match := self.RE_LIB_DIRECTIVE.search(encoded):
-            section = self._decode_group(match, "section")
-            return LibraryDirective(filepath=self._extract_filename(match), source_file=self.filepath, section=section)
-        if match := self.RE_CADENCE_STRICT.search(encoded):
-            return IncludeDirective(
-                filepath=self._get_filepath_from_match(match), source_file=self.filepath, strict=True
-            )
-        if match := self.RE_CADENCE_LENIENT.search(encoded):
-            return IncludeDirective(
-                filepath=self._get_filepath_from_match(match), source_file=self.filepath, strict=False
+        # match, not search: the pattern is anchored, and search would retry it at every offset on a miss.
+        if not (match := self.RE_DIRECTIVE.match(line)):
+            return None
+        if match["include"]:
+            return IncludeDirective(filepath=match["include_q"] or match["include_u"], source_file=self.filepath)
+        if match["lib"]:
+            return LibraryDirective(
+                filepath=match["lib_q"] or match["lib_u"], source_file=self.filepath, section=match["section"]
             )
-        return None
-
-    def _extract_filename(self, match: re.Match[bytes]) -> str:
-        """
-        Extracts the filename from either the quoted or unquoted capture group.
-
-        :param match: Regex match containing ``q_filename`` or ``u_filename`` groups.
-        :return: Decoded filename string.
-        """
-        if q := match.group("q_filename") if "q_filename" in match.groupdict() else None:
-            return q.decode("utf-8", errors="ignore")
-        if u := match.group("u_filename") if "u_filename" in match.groupdict() else None:
-            return u.decode("utf-8", errors="ignore")
-        return self._get_filepath_from_match(match)  # pragma: no cover
-
-    @staticmethod
-    def _decode_group(match: re.Match[bytes], group: str) -> str | None:
-        """
-        Decodes an optional named group from a bytes regex match.
-
-        :param match: Regex match object.
-        :param group: Name of the capture group.
-        :return: Decoded string, or None if the group did not participate.
-        """
-        raw = match.group(group)
-        return raw.decode("utf-8", errors="ignore") if raw else None
-
-    @staticmethod
-    def _get_filepath_from_match(match: re.Match[bytes]) -> str:
-        """
-        Decodes and strips quotes from the ``filename`` capture group.
-
-        :param match: Regex match containing a ``filename`` group.
-        :return: Cleaned filename string.
-        """
-        return match.group("filename").decode("utf-8", errors="ignore").strip("\"'")
+        return IncludeDirective(
+            filepath=match["cadence_path"].strip("\"'"), source_file=self.filepath, strict=match["cadence"] == "!"
+        )
 
 
 class SpiceChunkParserFactory(ChunkParserFactory):
@@ -549,11 +666,12 @@ class SpiceLibraryProcessor(LibraryProcessor):
         """
         return self.SECTION_START.finditer(line)
 
-    def find_end_indicator(self, line):
+    def find_end_indicator(self, line, pos=0):
         """
-        Returns the first ``.endl`` match, or None if absent.
+        Returns the first ``.endl`` match at or after *pos*, or None if absent.
 
         :param line: Raw mmap bytes to search.
+        :param pos: Byte offset to start searching from.
         :return: Regex Match or None.
         """
-        return self.SECTION_END.search(line)
+        return self.SECTION_END.search(line, pos)
@@ -5,13 +5,30 @@ circuit hierarchies, including cells, instances, ports, and primitives.
 """
 
 import abc
-from collections.abc import Generator
+import sys
+from collections.abc import Generator, Iterator
 from dataclasses import dataclass, field
-from typing import ClassVar, get_origin, get_type_hints
+from itertools import chain
+from typing import ClassVar, get_origin
 
 __all__ = ["Port", "NetConnection", "Cell", "Primitive", "Macro", "Instance", "Netlist"]
 
 
+def _is_class_var(annotation) -> bool:
+    """
+    Tells whether a class's own annotation declares a ``ClassVar``.
+
+    Only the outermost form matters, so a string annotation is judged by its
+    head instead of being evaluated: no forward references are resolved and
+    no MRO is walked, as ``typing.get_type_hints`` would for every subclass.
+
+    :param annotation: Annotation object or string from ``__annotations__``.
+    """
+    if isinstance(annotation, str):
+        return annotation.partition("[")[0].strip() in ("ClassVar", "typing.ClassVar")
+    return get_origin(annotation) is ClassVar
+
+
 @dataclass(slots=True)
 class _NamedItem(abc.ABC):
     name: str
@@ -25,6 +42,28 @@ class Port(_NamedItem):
     :param name: The port identifier.
     """
 
+    @classmethod
+    def get(cls, name: str) -> "Port":
+        """
+        Returns the shared Port for *name*, creating it on first use.
+
+        Ports carry nothing but their name and are never modified, so every
+        cell declaring, say, ``vdd`` can hold the same object; a parse
+        result then pickles each distinct port once.
+
+        :param name: The port identifier.
+        """
+        if (port := _PORTS.get(name)) is None:
+            port = _PORTS[name] = cls(sys.intern(name))
+        return port
+
+    def __reduce__(self):
+        """Unpickles through :meth:`get`, so ports stay shared across process boundaries."""
+        return (Port.get, (self.name,))
+
+
+_PORTS: dict[str, Port] = {}
+
 
 @dataclass(slots=True)
 class NetConnection:
@@ -77,10 +116,20 @@ class Primitive(Cell, abc.ABC):
     """
     Base class for primitive device types.
 
-    Primitives are singleton instances cached by type. Subclasses must
+    Primitives are singleton instances cached by type: every ``Resistor()``
+    returns the same object, and so does unpickling one. Subclasses must
     define all attributes as ClassVar to prevent instance field creation.
     """
 
+    # hash(cls), stored per subclass so __hash__ is one attribute read.
+    _type_hash: ClassVar[int]
+
+    def __new__(cls):
+        # Keyed by class outside the class body: dataclass(slots=True) rebuilds each class.
+        if (instance := _PRIMITIVES.get(cls)) is None:
+            instance = _PRIMITIVES[cls] = object.__new__(cls)
+        return instance
+
     @property
     @abc.abstractmethod
     def name(self) -> str:
@@ -103,26 +152,26 @@ class Primitive(Cell, abc.ABC):
         """Enforce that subclasses define no instance fields."""
         super(Primitive, cls).__init_subclass__(**kwargs)
         own_annotations = cls.__dict__.get("__annotations__", {})
-        hints = get_type_hints(cls, include_extras=True)
-        invalid_fields = []
-        for attr_name in own_annotations:
-            if attr_name in hints and get_origin(hints[attr_name]) is not ClassVar:
-                invalid_fields.append(attr_name)
+        invalid_fields = [name for name, annotation in own_annotations.items() if not _is_class_var(annotation)]
         if invalid_fields:
             raise TypeError(
                 f"Primitive subclass {cls.__name__} cannot define instance fields: {invalid_fields}. "
                 f"All attributes must be ClassVar."
             )
+        cls._type_hash = hash(cls)
 
     def __hash__(self) -> int:
         """Hash based on type for cached singletons."""
-        return hash(type(self))
+        return self._type_hash
 
     def __eq__(self, other) -> bool:
         """Equality based on type for cached singletons."""
         return type(self) is type(other)
 
 
+_PRIMITIVES: dict[type, Primitive] = {}
+
+
 @dataclass(slots=True)
 class Macro(Cell):
     """
@@ -234,13 +283,16 @@ class Netlist(_NamedItem):
         return list(self._top_instances)
 
     @property
-    def cells(self) -> list[Cell]:
+    def cells(self) -> Iterator[Cell]:
         """
-        Returns all cells in the netlist (primitives, macros, instances).
+        Iterates over all cells in the netlist (primitives, macros, instances).
+
+        Each access returns a fresh lazy iterator, so walking a large netlist
+        builds no combined list; wrap it in ``list()`` for random access.
 
-        :return: List of all Cell objects in the netlist.
+        :return: Iterator over all Cell objects in the netlist.
         """
-        return [*self.primitives.values(), *self.macros.values(), *self._top_instances]
+        return chain(self.primitives.values(), self.macros.values(), self._top_instances)
 
     @property
     @abc.abstractmethod
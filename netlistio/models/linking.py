@@ -18,6 +18,7 @@ class LinkErrorType(Enum):
     Enumeration of error types encountered during linking.
 
     UNDEFINED_MODEL: Instance references a non-existent cell.
+    UNNAMED_CELL: A definition has no name, so nothing can reference it.
     CIRCULAR_DEPENDENCY: Subcircuit hierarchy contains a cycle.
     DUPLICATE_DEFINITION: Multiple definitions for the same cell name.
     """
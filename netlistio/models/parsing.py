@@ -50,11 +50,13 @@ class RegionType(Enum):
     MACRO = auto()
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ParseError:
     """
     Records a single parsing error with source context.
 
+    Immutable and hashable, so repeated errors can be deduplicated with a set.
+
     :param line_number: 1-indexed line number where error occurred.
     :param message: Human-readable error description.
     :param line_content: Optional raw line content for debugging.
@@ -101,6 +103,21 @@ class ParseRegion:
     context_delimiter: str | None = None
     context_name: str | None = None
 
+    def __reduce__(self):
+        # Work batches pickle thousands of regions; rebuilding from positional
+        # arguments avoids the default slots protocol's Python-level __setstate__.
+        return (
+            type(self),
+            (
+                self.filepath,
+                self.start_byte,
+                self.end_byte,
+                self.region_type,
+                self.context_delimiter,
+                self.context_name,
+            ),
+        )
+
 
 @dataclass(slots=True, frozen=True)
 class LibrarySection:
@@ -58,7 +58,7 @@ class Resistor(Primitive, _SpicePrefixMixin, _SpicePassiveRegistry):
 
     inst_prefix: ClassVar[str] = "R"
     name: ClassVar[str] = "resistor"
-    ports: ClassVar[tuple[Port, ...]] = (Port("a"), Port("b"))
+    ports: ClassVar[tuple[Port, ...]] = (Port.get("a"), Port.get("b"))
 
 
 @dataclass(slots=True, eq=False)
@@ -67,7 +67,7 @@ class Capacitor(Primitive, _SpicePrefixMixin, _SpicePassiveRegistry):
 
     inst_prefix: ClassVar[str] = "C"
     name: ClassVar[str] = "capacitor"
-    ports: ClassVar[tuple[Port, ...]] = (Port("a"), Port("b"))
+    ports: ClassVar[tuple[Port, ...]] = (Port.get("a"), Port.get("b"))
 
 
 @dataclass(slots=True, eq=False)
@@ -76,7 +76,7 @@ class Inductor(Primitive, _SpicePrefixMixin, _SpicePassiveRegistry):
 
     inst_prefix: ClassVar[str] = "L"
     name: ClassVar[str] = "inductor"
-    ports: ClassVar[tuple[Port, ...]] = (Port("a"), Port("b"))
+    ports: ClassVar[tuple[Port, ...]] = (Port.get("a"), Port.get("b"))
 
 
 @dataclass(slots=True, eq=False)
@@ -85,7 +85,7 @@ class MOSFET(Primitive, _SpicePrefixMixin):
 
     inst_prefix: ClassVar[str] = "M"
     name: ClassVar[str] = "mosfet"
-    ports: ClassVar[tuple[Port, ...]] = (Port("d"), Port("g"), Port("s"), Port("b"))
+    ports: ClassVar[tuple[Port, ...]] = (Port.get("d"), Port.get("g"), Port.get("s"), Port.get("b"))
 
 
 @dataclass(slots=True, eq=False)
@@ -108,7 +108,7 @@ class Diode(Primitive, _SpicePrefixMixin):
 
     inst_prefix: ClassVar[str] = "D"
     name: ClassVar[str] = "diode"
-    ports: ClassVar[tuple[Port, ...]] = (Port("a"), Port("k"))
+    ports: ClassVar[tuple[Port, ...]] = (Port.get("a"), Port.get("k"))
 
 
 class Subckt(Macro, _SpicePrefixMixin):
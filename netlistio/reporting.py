@@ -6,6 +6,7 @@ domain model. Dispatch is by node type, so a new model type registers a single
 method here rather than carrying its own writer.
 """
 
+import inspect
 from collections import Counter
 from functools import singledispatchmethod
 from typing import TextIO
@@ -28,7 +29,15 @@ DEFAULT_MODEL_SUMMARY_THRESHOLD = 3
 
 
 class NetlistPrinter:
-    """Renders netlist model trees as indented, human-readable text."""
+    """
+    Renders netlist model trees as indented, human-readable text.
+
+    Lines are collected and handed to the stream ``FLUSH_LINES`` at a time,
+    and whatever remains when :meth:`print` returns, so a large netlist costs
+    thousands of stream writes rather than millions.
+    """
+
+    FLUSH_LINES = 4096
 
     def __init__(
         self,
@@ -44,8 +53,13 @@ class NetlistPrinter:
         self._stream = stream
         self._indent_char = indent_char
         self._indent_count = indent_count
+        # Indent prefixes by depth, extended on demand; every emitted line reuses one.
+        self._indents = [""]
+        self._pending: list[str] = []
         self._param_limit = param_limit
         self._model_summary_threshold = model_summary_threshold
+        # The per-type handler lookup behind _render; see _visit.
+        self._dispatch = inspect.getattr_static(type(self), "_render").dispatcher.dispatch
 
     def print(self, node: Cell | Netlist | Port, indent: int = 0) -> None:
         """
@@ -54,10 +68,33 @@ class NetlistPrinter:
         :param node: Root node to render.
         :param indent: Starting indentation depth.
         """
-        self._render(node, indent)
+        try:
+            self._visit(node, indent)
+        finally:
+            self._flush()
+
+    def _visit(self, node: Cell | Netlist | Port, indent: int) -> None:
+        # Accessing a singledispatchmethod builds a new wrapper function each time, which
+        # cost more than rendering most nodes; the dispatcher's own type cache does not.
+        self._dispatch(node.__class__)(self, node, indent)
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._stream.write("".join(self._pending))
+            self._pending.clear()
+
+    def _indent(self, depth: int) -> str:
+        indents = self._indents
+        while len(indents) <= depth:
+            indents.append(indents[-1] + self._indent_char * self._indent_count)
+        return indents[depth]
 
     def _emit(self, value: str, indent: int) -> None:
-        self._stream.write(f"{self._indent_char * self._indent_count * indent}{value}")
+        pending = self._pending
+        pending.append(self._indent(indent))
+        pending.append(value)
+        if len(pending) >= 2 * self.FLUSH_LINES:
+            self._flush()
 
     def _header(self, node: Cell | Netlist | Port, indent: int) -> None:
         name = node.name if node.name is not None else "<anonymous>"
@@ -86,7 +123,7 @@ class NetlistPrinter:
     def _render_primitive(self, node: Primitive, indent: int) -> None:
         self._header(node, indent)
         for port in node.ports:
-            self._render(port, indent + 1)
+            self._visit(port, indent + 1)
 
     @_render.register
     def _render_macro(self, node: Macro, indent: int) -> None:
@@ -97,7 +134,7 @@ class NetlistPrinter:
         else:
             self._render_models(models, indent + 1)
         for child in others:
-            self._render(child, indent + 1)
+            self._visit(child, indent + 1)
 
     @_render.register
     def _render_instance(self, node: Instance, indent: int) -> None:
@@ -106,7 +143,7 @@ class NetlistPrinter:
         self._render_instance_params(node, indent + 1)
         self._emit("Definition:\n", indent + 1)
         if node.definition:
-            self._render(node.definition, indent + 2)
+            self._visit(node.definition, indent + 2)
         else:
             self._emit(f"Unresolved: {node.definition_name}\n", indent + 2)
 
@@ -115,14 +152,14 @@ class NetlistPrinter:
         self._header(node, indent)
         self._emit("Primitives:\n", indent)
         for primitive in node.primitives.values():
-            self._render(primitive, indent + 1)
+            self._visit(primitive, indent + 1)
         self._emit("Macros:\n", indent)
         for macro in node.macros.values():
-            self._render(macro, indent + 1)
+            self._visit(macro, indent + 1)
         self._emit("Top-Level Instances:\n", indent)
         self._emit("(virtual top)\n", indent + 1)
         for instance in node.top_instances:
-            self._render(instance, indent + 2)
+            self._visit(instance, indent + 2)
 
     @staticmethod
     def _partition_children(node: Cell) -> tuple[list[Cell], list[Cell]]:
@@ -142,7 +179,7 @@ class NetlistPrinter:
 
     def _render_models(self, models: list[Cell], indent: int) -> None:
         for model in models:
-            self._render(model, indent + 1)
+            self._visit(model, indent + 1)
 
     def _render_instance_nets(self, instance: Instance, indent: int) -> None:
         for net, port in instance.nets:
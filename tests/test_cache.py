@@ -0,0 +1,49 @@
+"""Tests for the on-disk parse result cache."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+
+from netlistio.ingestor.cache import ResultCache
+from netlistio.ingestor.spice import SpiceChunkParserFactory
+from netlistio.models.parsing import ParseRegion, ParseResult, RegionType
+
+
+def _regions(path, *spans):
+    return [ParseRegion(str(path), start, end, RegionType.GLOBAL) for start, end in spans]
+
+
+class TestResultCache:
+    def test_round_trip(self, tmp_path):
+        src = tmp_path / "a.sp"
+        src.write_text("R1 a b 1k\n")
+        cache = ResultCache(tmp_path / "cache")
+        key = cache.key(str(src), _regions(src, (0, 10)), SpiceChunkParserFactory())
+        assert cache.load(key) is None
+        cache.store(key, ParseResult(str(src), cells=["R1"]))
+        assert cache.load(key).cells == ["R1"]
+        assert [p.suffix for p in (tmp_path / "cache").iterdir()] == [".pkl"]
+
+    def test_key_tracks_file_identity_and_regions(self, tmp_path):
+        src = tmp_path / "a.sp"
+        src.write_text("R1 a b 1k\n")
+        cache = ResultCache(tmp_path)
+        factory = SpiceChunkParserFactory()
+        key = cache.key(str(src), _regions(src, (0, 10)), factory)
+        assert key == cache.key(str(src), _regions(src, (0, 10)), factory)
+        assert key != cache.key(str(src), _regions(src, (0, 5), (5, 10)), factory)
+        stat = src.stat()
+        os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert key != cache.key(str(src), _regions(src, (0, 10)), factory)
+
+    def test_missing_file_has_no_key(self, tmp_path):
+        assert ResultCache(tmp_path).key(str(tmp_path / "gone.sp"), [], SpiceChunkParserFactory()) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "deadbeef.pkl").write_bytes(b"not a pickle")
+        assert ResultCache(tmp_path).load("deadbeef") is None
+
+    def test_unwritable_directory_is_ignored(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        ResultCache(blocker / "cache").store("k", ParseResult("f"))
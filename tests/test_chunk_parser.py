@@ -2,7 +2,10 @@
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+from netlistio.ingestor.common import open_buffer
 from netlistio.ingestor.reader import SpiceReader
+from netlistio.ingestor.spice import SpiceChunkParserFactory, SpiceLineParser
+from netlistio.models.parsing import ParseRegion, RegionType
 from netlistio.models.spice import SpiceNetlist
 
 
@@ -26,6 +29,14 @@ R2 mid out 2k
         assert "tc1" in r1.params
         assert r1.params["tc1"] == "0.001"
 
+    def test_crlf_line_endings(self, tmp_path):
+        path = tmp_path / "crlf.sp"
+        path.write_bytes(b"* title\r\n.subckt rc in out\r\nR1 in\r\n+ out 1k\r\n.ends rc\r\n")
+        netlist = SpiceReader().read(path, num_workers=1)
+        (r1,) = netlist.macros["rc"].instances
+        assert [net for net, _ in r1.nets] == ["in", "out"]
+        assert r1.params == {"value": "1k"}
+
     def test_comment_lines_filtered(self, tmp_spice):
         sp = """\
 * title
@@ -63,3 +74,37 @@ R2 a b 2k
         path = tmp_spice("* just a comment\n$ another\n")
         netlist = SpiceReader().read(path, num_workers=1)
         assert not netlist.macros
+
+
+class TestLineKindDispatch:
+    def _parse_counting(self, path, monkeypatch):
+        calls = []
+
+        def _counting(name):
+            real = getattr(SpiceLineParser, name)
+
+            def _wrapper(self, line):
+                calls.append(name)
+                return real(self, line)
+
+            return _wrapper
+
+        for name in ("parse_declaration", "parse_include", "parse_instance"):
+            monkeypatch.setattr(SpiceLineParser, name, _counting(name))
+        with open_buffer(path) as mm:
+            region = ParseRegion(str(path), 0, len(mm), RegionType.GLOBAL)
+            result = SpiceChunkParserFactory()(path, mm, region).parse()
+        return result, calls
+
+    def test_instance_lines_skip_directive_handlers(self, tmp_spice, monkeypatch):
+        result, calls = self._parse_counting(tmp_spice("title\n  R1 a b 1k\nM1 d g s b nch\n"), monkeypatch)
+        assert [c.name for c in result.cells] == ["R1", "M1"]
+        assert calls == ["parse_instance", "parse_instance"]
+
+    def test_directive_lines_skip_instance_handler(self, tmp_spice, monkeypatch):
+        result, calls = self._parse_counting(
+            tmp_spice('title\n.model nch nmos\n.include "a.sp"\n.option x\n'), monkeypatch
+        )
+        assert [c.name for c in result.cells] == ["nch"]
+        assert [d.filepath for d in result.includes] == ["a.sp"]
+        assert "parse_instance" not in calls
@@ -3,6 +3,8 @@
 # pylint: disable=missing-class-docstring,missing-function-docstring
 # pylint: disable=no-value-for-parameter,wrong-import-position,ungrouped-imports
 
+import io
+import sys
 from pathlib import Path
 
 import matplotlib
@@ -39,6 +41,16 @@ class TestCircuitGraphConstruction:
         graph = CircuitGraph.from_netlist(netlist)
         assert isinstance(graph.nets, dict)
 
+    def test_from_macro_matches_add_connection(self, fixture_path):
+        netlist = SpiceReader().read(fixture_path("hierarchy.sp"), num_workers=1)
+        for macro in netlist.macros.values():
+            graph = CircuitGraph.from_macro(macro)
+            expected = CircuitGraph()
+            for inst in macro.instances:
+                for net_name, formal_port in inst.nets:
+                    expected.add_connection(net_name, f"{inst.name}.{formal_port.name}" if formal_port else inst.name)
+            assert graph.nets == expected.nets
+
     def test_add_connection_appends(self):
         graph = CircuitGraph()
         graph.add_connection("vdd", "M1.d")
@@ -80,6 +92,40 @@ class TestAnalyzeConnectivity:
         out = capsys.readouterr().out
         assert "Total Nets" in out
 
+    def test_reports_highest_fanout_net(self, capsys):
+        graph = CircuitGraph()
+        for net, port in [("a", "R1.a"), ("b", "R1.b"), ("b", "R2.a"), ("b", "R3.a")]:
+            graph.add_connection(net, port)
+        graph.analyze_connectivity()
+        out = capsys.readouterr().out
+        assert "Average Fanout: 2.00" in out
+        assert "Highest Fanout Net: b (3 connections)" in out
+
+    def test_numpy_summary_matches_python(self, monkeypatch):
+        degrees = {f"n{i}": (i * 7919) % 113 for i in range(2000)}
+        vectorized = CircuitGraph._summarize_degrees(degrees)  # pylint: disable=protected-access
+        monkeypatch.setattr(cg_module, "HAS_NUMPY", False)
+        pure = CircuitGraph._summarize_degrees(degrees)  # pylint: disable=protected-access
+        assert vectorized[1:] == pure[1:]
+        assert abs(vectorized[0] - pure[0]) < 1e-9
+
+    def test_direct_degrees_match_bipartite_graph(self):
+        graph = CircuitGraph()
+        for net, port in [("vss", "M1.s"), ("vss", "M1.b"), ("vss", "M2.s"), ("out", "M1.d"), ("out", "bare")]:
+            graph.add_connection(net, port)
+        nx_graph = graph._build_nx_graph()  # pylint: disable=protected-access
+        direct = graph._compute_net_degrees_direct()  # pylint: disable=protected-access
+        assert direct == {"vss": 2, "out": 2}
+        assert direct == dict(nx_graph.degree(graph.nets))
+
+    def test_tied_terminals_yield_single_edge(self):
+        graph = CircuitGraph()
+        graph.add_connection("vss", "M1.s")
+        graph.add_connection("vss", "M1.b")
+        edges = []
+        graph._process_ports_for_graph("vss", graph.nets["vss"], {}, edges, {})  # pylint: disable=protected-access
+        assert edges == [("vss", "M1")]
+
 
 class TestVisualize:
     def _make_simple_graph(self):
@@ -118,6 +164,35 @@ class TestVisualize:
         graph.visualize(output_file=out_file, show=False)
         assert (tmp_path / "graph.dot").exists()
 
+    def test_fallback_writer_emits_every_node_and_edge(self):
+        graph = CircuitGraph()
+        graph.add_connection("vdd", "R1.a")
+        graph.add_connection("out", "R1.b")
+        buf = io.StringIO()
+        nx_graph = graph._build_nx_graph()  # pylint: disable=protected-access
+        graph._write_dot_content(buf, nx_graph)  # pylint: disable=protected-access
+        lines = buf.getvalue().splitlines()
+        assert lines[0] == "graph Circuit {" and lines[-1] == "}"
+        assert sum(1 for ln in lines if " -- " in ln) == nx_graph.number_of_edges()
+        assert sum(1 for ln in lines if ln.endswith("];") and " -- " not in ln) == nx_graph.number_of_nodes()
+
+    def test_visualize_empty_graph_skips_matplotlib(self, tmp_path, monkeypatch, caplog):
+        graph = CircuitGraph()
+
+        def _raise(*_args, **_kwargs):
+            raise AssertionError("matplotlib should not run for an empty graph")
+
+        monkeypatch.setattr(graph, "_execute_matplotlib_render", _raise)
+        monkeypatch.setattr(cg_module, "HAS_PYDOT", False)
+        with caplog.at_level("WARNING"):
+            graph.visualize(output_file=str(tmp_path / "empty.png"), show=False)
+        assert "empty" in caplog.text
+        assert not (tmp_path / "empty.png").exists()
+        assert (tmp_path / "empty.png.dot").read_text().startswith("graph Circuit {")
+
+    def test_build_nx_graph_empty(self):
+        assert CircuitGraph()._build_nx_graph().number_of_nodes() == 0  # pylint: disable=protected-access
+
     def test_visualize_show_interactive(self):
         graph = self._make_simple_graph()
         graph.visualize(output_file=None, show=True)
@@ -187,6 +262,21 @@ class TestVisualize:
         graph.visualize(output_file=str(tmp_path / "output.png"), show=False)
 
 
+class TestPartitionMplNodes:
+    def test_single_pass_split_and_labels(self):
+        graph = CircuitGraph()
+        graph.instance_metadata["R1"] = {"model": "resistor"}
+        graph.add_connection("vdd", "R1.a")
+        nx_graph = graph._build_nx_graph()  # pylint: disable=protected-access
+        inst_nodes, net_nodes, inst_labels, net_labels = graph._partition_mpl_nodes(  # pylint: disable=protected-access
+            nx_graph
+        )
+        assert inst_nodes == ["R1"]
+        assert net_nodes == ["vdd"]
+        assert inst_labels == {"R1": "R1\n(resistor)"}
+        assert net_labels == {"vdd": "vdd"}
+
+
 class TestDeviceGraph:
     def _make_divider_graph(self):
         graph = CircuitGraph()
@@ -416,6 +506,17 @@ class TestToPyg:
         ea = data["instance", "connects_to", "net"].edge_attr
         assert torch.all(ea.sum(dim=1) == 1.0)
 
+    def test_edge_attr_marks_terminal_column(self):
+        graph = self._make_simple_graph()
+        graph.add_connection("out", "X1")
+        graph.instance_metadata["X1"] = {"model": "cell"}
+        data = graph.to_pyg()
+        ea = data["instance", "connects_to", "net"].edge_attr
+        vocab = cg_module._TERMINAL_VOCAB  # pylint: disable=protected-access
+        hot = sorted(vocab[i] for i in ea.argmax(dim=1).tolist())
+        assert hot == sorted(["a", "b", "a", "b", "other"])
+        assert ea.dtype.is_floating_point
+
     def test_reverse_edges_present(self):
         graph = self._make_simple_graph()
         data = graph.to_pyg()
@@ -450,3 +551,17 @@ class TestExtractRefDes:
         graph.add_connection("vdd", "bare_ref")
         nx_graph = graph._build_nx_graph()  # pylint: disable=protected-access
         assert nx_graph.has_node("bare_ref")
+
+    def test_extract_ref_des_keeps_text_before_first_dot(self):
+        assert CircuitGraph._extract_ref_des("X1.M2.d") == "X1"  # pylint: disable=protected-access
+        assert CircuitGraph._extract_ref_des("M1") == "M1"  # pylint: disable=protected-access
+
+
+class TestStringInterning:
+    def test_net_and_port_names_are_interned(self):
+        graph = CircuitGraph()
+        graph.add_connection("".join(["v", "dd"]), "".join(["M1", ".d"]))
+        net = next(iter(graph.nets))
+        assert net is sys.intern("vdd")
+        assert graph.nets[net][0] is sys.intern("M1.d")
+        assert CircuitGraph._extract_ref_des("M1.d") is sys.intern("M1")  # pylint: disable=protected-access
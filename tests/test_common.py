@@ -0,0 +1,120 @@
+"""Tests for shared mmap helpers."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import mmap
+
+from netlistio.ingestor import common
+from netlistio.ingestor.common import (
+    MADV_HUGEPAGE,
+    MADV_SEQUENTIAL,
+    MADV_WILLNEED,
+    SMALL_FILE_BYTES,
+    advise,
+    open_buffer,
+    open_mmap,
+    prefetch_file,
+)
+
+
+class TestOpenMmap:
+    def test_maps_file_contents(self, tmp_path):
+        path = tmp_path / "f.sp"
+        path.write_bytes(b"R1 a b 1k\n")
+        with open_mmap(path) as mm:
+            assert mm.readline() == b"R1 a b 1k\n"
+
+    def test_accepts_advice(self, tmp_path):
+        path = tmp_path / "f.sp"
+        path.write_bytes(b"x" * (3 * mmap.PAGESIZE))
+        with open_mmap(path, advice=MADV_SEQUENTIAL) as mm:
+            assert mm.size() == 3 * mmap.PAGESIZE
+
+    def test_large_mapping_offered_huge_pages(self, tmp_path, monkeypatch):
+        path = tmp_path / "f.sp"
+        path.write_bytes(b"x" * (2 * mmap.PAGESIZE))
+        hints = []
+        real_advise = common.advise
+        monkeypatch.setattr(
+            common, "advise", lambda mm, advice, *a: hints.append(advice) or real_advise(mm, advice, *a)
+        )
+        with open_mmap(path, advice=MADV_SEQUENTIAL):
+            pass
+        assert hints == [MADV_SEQUENTIAL]
+        monkeypatch.setattr(common, "HUGE_PAGE_MIN_BYTES", mmap.PAGESIZE)
+        hints.clear()
+        with open_mmap(path, advice=MADV_SEQUENTIAL) as mm:
+            assert mm.size() == 2 * mmap.PAGESIZE
+        assert hints == [MADV_HUGEPAGE, MADV_SEQUENTIAL]
+
+
+class TestOpenBuffer:
+    def test_small_file_is_read(self, tmp_path):
+        path = tmp_path / "f.sp"
+        path.write_bytes(b"R1 a b 1k\n")
+        with open_buffer(path) as buf:
+            assert buf == b"R1 a b 1k\n"
+
+    def test_empty_file_is_read(self, tmp_path):
+        path = tmp_path / "f.sp"
+        path.write_bytes(b"")
+        with open_buffer(path, advice=MADV_SEQUENTIAL) as buf:
+            assert buf == b""
+
+    def test_large_file_is_mapped(self, tmp_path):
+        path = tmp_path / "f.sp"
+        path.write_bytes(b"x" * SMALL_FILE_BYTES)
+        with open_buffer(path, advice=MADV_SEQUENTIAL) as buf:
+            assert isinstance(buf, mmap.mmap)
+            assert len(buf) == SMALL_FILE_BYTES
+
+
+class _RecordingMap:
+    """Stand-in for an mmap that records madvise calls (mmap.mmap cannot be patched)."""
+
+    def __init__(self, size: int):
+        self._size = size
+        self.calls: list[tuple[int, int, int]] = []
+
+    def size(self) -> int:
+        return self._size
+
+    def madvise(self, *args):
+        self.calls.append(args)
+
+
+class TestAdvise:
+    def test_unaligned_range_is_rounded_down(self):
+        mm = _RecordingMap(2 * mmap.PAGESIZE + 10)
+        advise(mm, MADV_WILLNEED, mmap.PAGESIZE + 5, mmap.PAGESIZE + 50)
+        assert mm.calls == [(MADV_WILLNEED, mmap.PAGESIZE, 50)]
+
+    def test_whole_file_sentinel_clamps_to_size(self):
+        mm = _RecordingMap(2 * mmap.PAGESIZE + 10)
+        advise(mm, MADV_WILLNEED, 0, -1)
+        assert mm.calls == [(MADV_WILLNEED, 0, mm.size())]
+
+    def test_no_advice_or_empty_range_is_noop(self):
+        mm = _RecordingMap(mmap.PAGESIZE)
+        advise(mm, None)
+        advise(mm, MADV_WILLNEED, mmap.PAGESIZE, mmap.PAGESIZE)
+        assert not mm.calls
+
+    def test_bytes_buffer_is_ignored(self):
+        advise(b"x" * mmap.PAGESIZE, MADV_WILLNEED)
+
+    def test_real_madvise_accepts_range(self, tmp_path):
+        path = tmp_path / "f.sp"
+        path.write_bytes(b"x" * (2 * mmap.PAGESIZE + 10))
+        with open_mmap(path) as mm:
+            advise(mm, MADV_WILLNEED, 1, 2 * mmap.PAGESIZE + 10)
+
+
+class TestPrefetchFile:
+    def test_existing_file(self, tmp_path):
+        path = tmp_path / "f.sp"
+        path.write_bytes(b"R1 a b 1k\n")
+        prefetch_file(path)
+
+    def test_missing_file_is_silent(self, tmp_path):
+        prefetch_file(tmp_path / "absent.sp")
@@ -2,21 +2,26 @@
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import os
+import pickle
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
 from netlistio.ingestor.compiler import Compiler
-from netlistio.ingestor.parser import Parser
+from netlistio.ingestor.parser import Parser, packed_batch_entry_point
 from netlistio.ingestor.scanner import Scanner
 from netlistio.ingestor.spice import (
     SpiceChunkParserFactory,
     SpiceLibraryProcessor,
     SpiceScanStrategy,
 )
+from netlistio.models.parsing import ParseResult
 
 
-def _make_compiler(root: Path, num_workers: int = 1) -> Compiler:
+def _make_compiler(root: Path, num_workers: int = 1, cache_dir: Path | None = None) -> Compiler:
     def scanner_factory(fp):
         return Scanner(fp, SpiceScanStrategy())
 
@@ -29,6 +34,7 @@ def _make_compiler(root: Path, num_workers: int = 1) -> Compiler:
         scanner_factory=scanner_factory,
         library_factory=SpiceLibraryProcessor,
         num_workers=num_workers,
+        cache_dir=cache_dir,
     )
 
 
@@ -48,6 +54,12 @@ class TestCompilerSingleFile:
         compiler.compile()
         assert len(compiler.visited_regions) > 0
 
+    def test_visited_keys_are_int_triples(self, fixture_path):
+        compiler = _make_compiler(fixture_path("with_include.sp"))
+        compiler.compile()
+        assert all(isinstance(part, int) for key in compiler.visited_regions for part in key)
+        assert len({key[0] for key in compiler.visited_regions}) >= 2
+
 
 class TestCompilerIncludeResolution:
     def test_lib_section_resolved(self, fixture_path):
@@ -84,6 +96,42 @@ class TestCompilerIncludeResolution:
         names = {c.name for c in result.cells}
         assert "leaf" in names
 
+    def test_resolve_path_falls_back_to_root_dir(self, tmp_path):
+        (tmp_path / "shared.sp").write_text("* shared\n")
+        (tmp_path / "sub").mkdir()
+        top = tmp_path / "top.sp"
+        top.write_text("* top\n")
+        resolve = _make_compiler(top)._resolve_path  # pylint: disable=protected-access
+        sub = str(tmp_path / "sub")
+        assert resolve("../sub/../shared.sp", sub) == (tmp_path / "shared.sp").resolve()
+        assert resolve("shared.sp", sub) == (tmp_path / "shared.sp").resolve()
+        with pytest.raises(FileNotFoundError):
+            resolve("absent.sp", sub)
+
+    def test_relative_root_is_anchored_at_construction(self, tmp_path, monkeypatch):
+        (tmp_path / "cells").mkdir()
+        (tmp_path / "cells" / "leaf.sp").write_text(".subckt leaf a\n.ends leaf\n")
+        (tmp_path / "top.sp").write_text('.include "cells/leaf.sp"\nX1 n leaf\n')
+        monkeypatch.chdir(tmp_path)
+        compiler = _make_compiler(Path("top.sp"))
+        monkeypatch.chdir(tmp_path / "cells")
+        assert "leaf" in {c.name for c in compiler.compile().cells}
+
+    def test_resolution_memoized_per_base_dir(self, tmp_path, monkeypatch):
+        from netlistio.ingestor import compiler as compiler_module  # pylint: disable=import-outside-toplevel
+
+        (tmp_path / "models.sp").write_text(".model nch nmos\n")
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.sp").write_text(f'.include "models.sp"\n.include "gone.sp"\n.subckt {name} x\n.ends\n')
+        top = tmp_path / "top.sp"
+        top.write_text('.include "a.sp"\n.include "b.sp"\n.subckt t x\n.ends t\n')
+        probes = []
+        real_exists = compiler_module.os.path.exists
+        monkeypatch.setattr(compiler_module.os.path, "exists", lambda p: probes.append(p) or real_exists(p))
+        _make_compiler(top).compile()
+        assert sum(p.endswith("models.sp") for p in probes) == 1
+        assert sum(p.endswith("gone.sp") for p in probes) == 2  # base dir and root dir, once each
+
     def test_duplicate_include_not_revisited(self, tmp_path):
         lib = tmp_path / "lib.sp"
         lib.write_text(".subckt leaf a b\nR1 a b 1k\n.ends leaf\n")
@@ -94,6 +142,217 @@ class TestCompilerIncludeResolution:
         leaf_cells = [c for c in result.cells if c.name == "leaf"]
         assert len(leaf_cells) == 1
 
+    def test_each_file_scanned_once(self, tmp_path, monkeypatch):
+        (tmp_path / "leaf.sp").write_text(".subckt leaf x\n.ends leaf\n")
+        (tmp_path / "mid.sp").write_text('.include "leaf.sp"\n.subckt mid x\n.ends mid\n')
+        top = tmp_path / "top.sp"
+        top.write_text('.include "mid.sp"\n.include "leaf.sp"\n.subckt t x\n.ends t\n.include "mid.sp"\n')
+        compiler = _make_compiler(top)
+        scanned = []
+        real_factory = compiler._scanner_factory  # pylint: disable=protected-access
+
+        def _recording_factory(fp):
+            scanned.append(fp.name)
+            return real_factory(fp)
+
+        monkeypatch.setattr(compiler, "_scanner_factory", _recording_factory)
+        compiler.compile()
+        assert sorted(scanned) == ["leaf.sp", "mid.sp", "top.sp"]
+
+    def test_files_scanned_off_the_coordinator_thread(self, tmp_path, monkeypatch):
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.sp").write_text(f".subckt {name} x\n.ends {name}\n")
+        top = tmp_path / "top.sp"
+        top.write_text('.include "a.sp"\n.include "b.sp"\n.subckt t x\n.ends t\n')
+        compiler = _make_compiler(top, num_workers=2)
+        threads = []
+        real_factory = compiler._scanner_factory  # pylint: disable=protected-access
+
+        def _recording_factory(fp):
+            threads.append(threading.current_thread())
+            return real_factory(fp)
+
+        monkeypatch.setattr(compiler, "_scanner_factory", _recording_factory)
+        names = [c.name for c in compiler.compile().cells]
+        assert names == ["t", "a", "b"]
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
+
+    def test_mutual_includes_terminate(self, tmp_path):
+        (tmp_path / "a.sp").write_text('.include "b.sp"\n.subckt a x\n.ends a\n')
+        (tmp_path / "b.sp").write_text('.include "a.sp"\n.subckt b x\n.ends b\n')
+        result = _make_compiler(tmp_path / "a.sp").compile()
+        assert sorted(c.name for c in result.cells if c.name) == ["a", "b"]
+
+
+def _failing_worker(_work_batch):
+    raise RuntimeError("worker exploded")
+
+
+def _a_sp_finishes_last(work_batch):
+    if work_batch[0].endswith(f"{os.sep}a.sp"):
+        time.sleep(0.5)
+    return packed_batch_entry_point(work_batch)
+
+
+class TestCompilerParallelDispatch:
+    def test_multi_file_hierarchy_with_worker_pool(self, tmp_path):
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.sp").write_text(f".subckt {name} x y\nR1 x y 1k\n.ends {name}\n")
+        top = tmp_path / "top.sp"
+        top.write_text('.include "a.sp"\n.include "b.sp"\n.include "c.sp"\nXa p q a\n')
+        result = _make_compiler(top, num_workers=3).compile()
+        assert {"a", "b", "c"} <= {c.name for c in result.cells}
+
+    def test_cell_order_is_deterministic(self, fixture_path):
+        first = [c.name for c in _make_compiler(fixture_path("hierarchy.sp"), num_workers=4).compile().cells]
+        second = [c.name for c in _make_compiler(fixture_path("hierarchy.sp"), num_workers=4).compile().cells]
+        assert first == second
+
+    def test_include_order_independent_of_worker_timing(self, tmp_path, monkeypatch):
+        from netlistio.ingestor import compiler as compiler_module  # pylint: disable=import-outside-toplevel
+
+        files = {
+            "top.sp": '.include "a.sp"\n.include "b.sp"\n.lib "l.lib" tt\n.subckt t x\n.ends t\n',
+            "a.sp": '.include "a1.sp"\n.subckt dup x\n.ends dup\n.subckt a x\n.ends a\n',
+            "b.sp": '.include "b1.sp"\n.include "a1.sp"\n.subckt dup y\n.ends dup\n.subckt b x\n.ends b\n',
+            "l.lib": ".lib tt\n.model nmos_tt nmos\n.endl tt\n",
+            "a1.sp": ".subckt a1 x\n.ends a1\n",
+            "b1.sp": '.include "b2.sp"\n.subckt b1 x\n.ends b1\n',
+            "b2.sp": ".subckt b2 x\n.ends b2\n",
+        }
+        for name, text in files.items():
+            (tmp_path / name).write_text(text)
+        # a.sp's include is found after every sibling's; the merge order must not follow.
+        monkeypatch.setattr(compiler_module, "packed_batch_entry_point", _a_sp_finishes_last)
+        cells = _make_compiler(tmp_path / "top.sp", num_workers=4).compile().cells
+        # Breadth-first, each file's includes in directive order, as a sequential walk merges them.
+        assert [c.name for c in cells] == ["t", "dup", "a", "dup", "b", "nmos_tt", "a1", "b1", "b2"]
+        assert cells[1].ports[0].name == "x"
+
+    def test_repeated_include_warns_once(self, tmp_path, caplog):
+        sp = tmp_path / "dup.sp"
+        sp.write_text('.include "missing.sp"\n.subckt a x\n.ends a\n.include "missing.sp"\n')
+        with caplog.at_level("WARNING"):
+            _make_compiler(sp, num_workers=2).compile()
+        assert caplog.text.count("Could not resolve include") == 1
+
+    def test_includes_prefetched_once_before_parsing(self, tmp_path, monkeypatch):
+        from netlistio.ingestor import compiler as compiler_module  # pylint: disable=import-outside-toplevel
+
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.sp").write_text(f".subckt {name} x y\n.ends {name}\n")
+        top = tmp_path / "top.sp"
+        top.write_text('.include "a.sp"\n.include "b.sp"\n.subckt t x\n.ends t\n.include "a.sp"\n')
+        prefetched = []
+        monkeypatch.setattr(compiler_module, "prefetch_file", prefetched.append)
+        _make_compiler(top).compile()
+        assert sorted(p.name for p in prefetched) == ["a.sp", "b.sp"]
+
+    def test_multiple_lib_sections_resolved_in_pool(self, tmp_path):
+        lib = tmp_path / "corners.lib"
+        lib.write_text(
+            ".lib tt\n.model nmos_tt nmos\n.endl tt\n"
+            ".lib ff\n.model nmos_ff nmos\n.endl ff\n"
+            ".lib ss\n.model nmos_ss nmos\n.endl ss\n"
+        )
+        top = tmp_path / "top.sp"
+        top.write_text('.lib "corners.lib" tt\n.lib "corners.lib" ss\n.subckt inv in out\n.ends inv\n')
+        compiler = _make_compiler(top, num_workers=2)
+        names = {c.name for c in compiler.compile().cells}
+        assert {"nmos_tt", "nmos_ss"} <= names
+        assert "nmos_ff" not in names
+        # Root file plus one region per requested section.
+        assert len(compiler.visited_regions) == 3
+
+    def test_library_indexed_once_for_all_sections(self, tmp_path, monkeypatch):
+        lib = tmp_path / "corners.lib"
+        lib.write_text(".lib tt\n.model nmos_tt nmos\n.endl tt\n.lib ff\n.model nmos_ff nmos\n.endl ff\n")
+        (tmp_path / "a.sp").write_text('.lib "corners.lib" ff\n.lib "corners.lib" ss\n.subckt a x\n.ends a\n')
+        top = tmp_path / "top.sp"
+        top.write_text('.lib "corners.lib" tt\n.include "a.sp"\n.subckt inv in out\n.ends inv\n')
+        compiler = _make_compiler(top, num_workers=2)
+        indexed = []
+        real_submit = compiler._submit  # pylint: disable=protected-access
+
+        def _recording_submit(executor, fn, *args):
+            if getattr(fn, "__name__", None) == "index_sections":
+                indexed.append(args)
+            return real_submit(executor, fn, *args)
+
+        monkeypatch.setattr(compiler, "_submit", _recording_submit)
+        names = {c.name for c in compiler.compile().cells}
+        assert {"nmos_tt", "nmos_ff"} <= names
+        assert indexed == [(lib.resolve(),)]
+
+    def test_large_macro_submitted_first_but_merged_in_order(self, tmp_path, monkeypatch):
+        small = "".join(f".subckt s{i} a\nR1 a 0 1k\n.ends\n" for i in range(3))
+        big = ".subckt big a\n" + "R1 a 0 1k\n" * 20000 + ".ends\n"
+        top = tmp_path / "top.sp"
+        top.write_text(small + big)
+        compiler = _make_compiler(top, num_workers=2)
+        submitted = []
+        real_submit = compiler._submit  # pylint: disable=protected-access
+
+        def _recording_submit(executor, fn, *args):
+            if getattr(fn, "__name__", None) == "packed_batch_entry_point":
+                submitted.append([r.context_name for r in args[0][1]])
+            return real_submit(executor, fn, *args)
+
+        monkeypatch.setattr(compiler, "_submit", _recording_submit)
+        names = [c.name for c in compiler.compile().cells]
+        assert submitted[0] == ["big"]
+        assert names == ["s0", "s1", "s2", "big"]
+
+    def test_cache_dir_serves_unchanged_files(self, tmp_path):
+        (tmp_path / "a.sp").write_text(".subckt a x\n.ends a\n")
+        top = tmp_path / "top.sp"
+        top.write_text('.include "a.sp"\n.subckt t x\n.ends t\n')
+        cache_dir = tmp_path / "cache"
+
+        def _compile():
+            return sorted(c.name for c in _make_compiler(top, num_workers=2, cache_dir=cache_dir).compile().cells)
+
+        assert _compile() == ["a", "t"]
+        entries = sorted(cache_dir.glob("*.pkl"))
+        assert len(entries) == 2
+        # Rewriting every entry proves the second run reads them instead of parsing.
+        for entry in entries:
+            entry.write_bytes(pickle.dumps(ParseResult(str(top))))
+        assert not _compile()
+
+    def test_merge_ready_holds_out_of_order_results(self, fixture_path):
+        # pylint: disable=protected-access
+        compiler = _make_compiler(fixture_path("minimal.sp"))
+        merge = compiler._run.merge
+        keys = [(0, 0, 1), (0, 1, 2), (0, 2, 3)]
+        for key in keys:
+            merge.place(key)
+        merge.results.update({keys[1]: ParseResult("f", cells=["b"]), keys[2]: ParseResult("f", cells=["c"])})
+        compiler._merge_ready()
+        assert set(merge.results) == set(keys[1:])
+        assert not compiler._run.result.cells
+        merge.results[keys[0]] = ParseResult("f", cells=["a"])
+        compiler._merge_ready()
+        assert not merge.results
+        assert compiler._run.result.cells == ["a", "b", "c"]
+
+    def test_worker_exception_propagates(self, fixture_path, monkeypatch):
+        from netlistio.ingestor import compiler as compiler_module  # pylint: disable=import-outside-toplevel
+
+        monkeypatch.setattr(compiler_module, "packed_batch_entry_point", _failing_worker)
+        with pytest.raises(RuntimeError, match="worker exploded"):
+            _make_compiler(fixture_path("hierarchy.sp"), num_workers=2).compile()
+
+    def test_num_workers_defaults_to_cpu_count(self, fixture_path):
+        compiler = Compiler(
+            root_filepath=fixture_path("minimal.sp"),
+            parser_factory=lambda fp, regions: Parser(fp, regions, SpiceChunkParserFactory()),
+            scanner_factory=lambda fp: Scanner(fp, SpiceScanStrategy()),
+            library_factory=SpiceLibraryProcessor,
+        )
+        assert any(c.name == "voltage_divider" for c in compiler.compile().cells)
+
 
 class TestCompilerEdgeCases:
     def test_lib_directive_with_missing_section_logs_warning(self, tmp_path, caplog):
@@ -105,6 +364,34 @@ class TestCompilerEdgeCases:
             _make_compiler(sp).compile()
         assert "not found" in caplog.text
 
+    def test_section_lookup_shared_across_spellings(self, tmp_path, caplog):
+        (tmp_path / "models").mkdir()
+        (tmp_path / "models" / "corners.lib").write_text(".lib tt\n.model nmos_tt nmos\n.endl tt\n")
+        sp = tmp_path / "top.sp"
+        sp.write_text(
+            '.lib "models/corners.lib" ff\n.lib "./models/corners.lib" FF\n'
+            '.lib "models/corners.lib" tt\n.lib "./models/../models/corners.lib" TT\n'
+            ".subckt inv in out\n.ends inv\n"
+        )
+        compiler = _make_compiler(sp)
+        with caplog.at_level("WARNING"):
+            result = compiler.compile()
+        assert caplog.text.count("not found") == 1
+        assert [c.name for c in result.cells].count("nmos_tt") == 1
+        assert len(compiler.visited_regions) == 2
+
+    def test_mutually_referencing_sections_terminate(self, tmp_path):
+        (tmp_path / "corners.lib").write_text(
+            '.lib tt\n.lib "corners.lib" ff\n.model ntt nmos\n.endl tt\n'
+            '.lib ff\n.lib "corners.lib" tt\n.lib "corners.lib" ff\n.model nff nmos\n.endl ff\n'
+        )
+        sp = tmp_path / "top.sp"
+        sp.write_text('.lib "corners.lib" tt\n.subckt inv in out\n.ends inv\n')
+        result = _make_compiler(sp).compile()
+        names = [c.name for c in result.cells]
+        assert names.count("ntt") == 1
+        assert names.count("nff") == 1
+
     def test_absolute_path_include_resolved(self, tmp_path):
         lib = tmp_path / "absolute_lib.sp"
         lib.write_text(".subckt leaf a b\nR1 a b 1k\n.ends leaf\n")
@@ -122,6 +409,16 @@ class TestLibrarySectionExtraction:
         assert section.name == "tt"
         assert section.start_byte < section.end_byte
 
+    def test_subclass_without_super_init_finds_sections(self, fixture_path):
+        class _OwnInit(SpiceLibraryProcessor):
+            def __init__(self):
+                self.ready = True
+
+        processor = _OwnInit()
+        tt = processor.find_section(fixture_path("lib_sections.lib"), "tt")
+        assert processor.find_section(fixture_path("lib_sections.lib"), "tt") == tt
+        assert SpiceLibraryProcessor._section_indexes is None  # pylint: disable=protected-access
+
     def test_section_not_found_raises(self, fixture_path):
         processor = SpiceLibraryProcessor()
         with pytest.raises(ValueError, match="not found"):
@@ -134,9 +431,52 @@ class TestLibrarySectionExtraction:
         assert tt.start_byte != ff.start_byte
         assert tt.end_byte < ff.start_byte
 
+    def test_section_bytes_stop_at_endl_line(self, fixture_path):
+        path = fixture_path("lib_sections.lib")
+        data = path.read_bytes()
+        for name in ("tt", "ff"):
+            section = SpiceLibraryProcessor().find_section(path, name)
+            body = data[section.start_byte : section.end_byte]
+            assert body.count(b".model") == 2
+            assert data[section.end_byte :].startswith(f".endl {name}".encode())
+
     def test_missing_endl_falls_back_to_file_end(self, tmp_path):
         lib = tmp_path / "noeol.lib"
         lib.write_text(".lib tt\n.model nmos_tt nmos level=54\n")
         processor = SpiceLibraryProcessor()
         section = processor.find_section(lib, "tt")
         assert section.end_byte == lib.stat().st_size
+
+    def test_index_lists_every_section(self, fixture_path):
+        path = fixture_path("lib_sections.lib")
+        processor = SpiceLibraryProcessor()
+        index = processor.index_sections(path)
+        assert sorted(index) == ["ff", "tt"]
+        assert index["tt"] == processor.find_section(path, "tt")
+
+    def test_index_keys_are_case_insensitive_first_wins(self, tmp_path):
+        lib = tmp_path / "dup.lib"
+        lib.write_text(".lib TT\n.model a nmos\n.endl\n.lib tt\n.model b nmos\n.endl\n")
+        index = SpiceLibraryProcessor().index_sections(lib)
+        assert list(index) == ["tt"]
+        assert index["tt"].name == "TT"
+        assert index["tt"].start_byte == len(".lib TT")
+
+    def test_sections_sharing_an_end_indicator(self, tmp_path):
+        lib = tmp_path / "nested.lib"
+        lib.write_text(".lib outer\n.lib inner\n.model a nmos\n.endl\n.lib last\n")
+        index = SpiceLibraryProcessor().index_sections(lib)
+        end = lib.read_bytes().index(b".endl")
+        assert index["outer"].end_byte == index["inner"].end_byte == end
+        assert index["last"].end_byte == lib.stat().st_size
+
+    def test_further_lookups_reuse_the_index(self, fixture_path, monkeypatch):
+        processor = SpiceLibraryProcessor()
+        calls = []
+        real_index = processor.index_sections
+        monkeypatch.setattr(processor, "index_sections", lambda path: calls.append(path) or real_index(path))
+        for name in ("tt", "FF", "tt"):
+            processor.find_section(fixture_path("lib_sections.lib"), name)
+        with pytest.raises(ValueError):
+            processor.find_section(fixture_path("lib_sections.lib"), "ss")
+        assert len(calls) == 1
@@ -108,6 +108,14 @@ class TestParseInstance:
         assert inst.definition_name == "inv"
         assert any(n == "a" for n, _ in inst.nets)
 
+    def test_returns_none_for_comment(self):
+        assert self.parser.parse_instance("* this is a comment") is None
+
+
+class TestParseInstanceTokens:
+    def setup_method(self):
+        self.parser = _make_parser()
+
     def test_key_value_params_extracted(self):
         inst = self.parser.parse_instance("R1 a b r=10k tc1=0.001")
         assert inst is not None
@@ -119,12 +127,46 @@ class TestParseInstance:
         assert inst is not None
         assert "r" in inst.params
 
-    def test_returns_none_for_comment(self):
-        assert self.parser.parse_instance("* this is a comment") is None
+    def test_equals_normalization_one_sided(self):
+        inst = self.parser.parse_instance("M1 d g s b nmos w\t=1u l= 100n m=2")
+        assert inst.params == {"w": "1u", "l": "100n", "m": "2"}
+        assert [n.net for n in inst.nets] == ["d", "g", "s", "b"]
 
     def test_returns_none_for_too_few_tokens(self):
         assert self.parser.parse_instance("R1") is None
 
+    def test_subckt_without_model_token_has_no_definition_name(self):
+        inst = self.parser.parse_instance("X1 w=1")
+        assert inst.definition_name is None
+
+
+class TestParseInstanceInterning:
+    def setup_method(self):
+        self.parser = _make_parser()
+
+    def test_repeated_names_share_one_string(self):
+        first = self.parser.parse_instance("X1 in mid vdd inv")
+        second = self.parser.parse_instance("X2 mid out vdd inv")
+        assert first.definition_name is second.definition_name
+        assert first.nets[1].net is second.nets[0].net
+        assert first.nets[2].net is second.nets[2].net
+
+    def test_repeated_params_share_one_string(self):
+        first = self.parser.parse_instance("M1 d g s b nch w=1u l=0.1u")
+        second = self.parser.parse_instance("M2 d g s b nch l=0.1u w=1u")
+        (l1, w1), (l2, w2) = (sorted(i.params.items()) for i in (first, second))
+        assert l1[0] is l2[0] and l1[1] is l2[1]
+        assert w1[0] is w2[0] and w1[1] is w2[1]
+
+
+class TestParseInstancePrefix:
+    def setup_method(self):
+        self.parser = _make_parser()
+
+    def test_lowercase_prefix(self):
+        assert isinstance(self.parser.parse_instance("r1 a b 10k").definition, Resistor)
+        assert self.parser.parse_instance("x1 a b inv").definition_name == "inv"
+
     def test_returns_none_for_unknown_prefix(self):
         assert self.parser.parse_instance("Z1 a b some_model") is None
 
@@ -166,6 +208,16 @@ class TestParseDeclaration:
         assert isinstance(decl, Model)
         assert decl.params.get("FLAG") == "true"
 
+    def test_indented_declarations(self):
+        assert isinstance(self.parser.parse_declaration("  .SubCkt inv a b"), Subckt)
+        decl = self.parser.parse_declaration("\t.MODEL pch pmos vth0=-0.4")
+        assert isinstance(decl, Model)
+        assert (decl.name, decl.base_type, decl.params) == ("pch", "pmos", {"vth0": "-0.4"})
+
+    def test_returns_none_for_other_directives(self):
+        for line in (".param w=1u", ".option post", ".model", '.include "a.sp"', ".ends inv"):
+            assert self.parser.parse_declaration(line) is None
+
     def test_returns_none_for_instance(self):
         assert self.parser.parse_declaration("R1 a b 10k") is None
 
@@ -214,6 +266,20 @@ class TestParseInclude:
         assert self.parser.parse_include("R1 a b 10k") is None
         assert self.parser.parse_include("* comment") is None
 
+    def test_every_directive_form_with_leading_whitespace(self):
+        for line in ('  .INCLUDE "a.sp"', "\t.Lib b.lib ff", "  [! c.spi ]", "[?d.spi]"):
+            assert self.parser.parse_include(line) is not None, line
+
+    def test_directive_keywords_mid_line_are_not_directives(self):
+        assert self.parser.parse_include("XU1 .lib .include [! sub") is None
+
+    def test_lib_with_trailing_tokens_is_not_a_directive(self):
+        assert self.parser.parse_include(".lib a.lib tt extra") is None
+
+    def test_non_ascii_whitespace_stays_in_unquoted_path(self):
+        result = self.parser.parse_include(".include a\u00a0b.sp")
+        assert result.filepath == "a\u00a0b.sp"
+
     def test_is_value_numeric(self):
         assert self.parser._is_value("100n") is True
         assert self.parser._is_value("1.5e-7") is True
@@ -237,28 +303,30 @@ _PARAM_VALUE = st.text(
 
 @given(st.lists(_IDENTIFIER, min_size=0, max_size=10))
 @settings(max_examples=200)
-def test_extract_params_removes_all_kv_tokens(identifiers):
-    """After _extract_params, no token with '=' remains in the list."""
+def test_split_device_tokens_removes_all_kv_tokens(identifiers):
+    """After _split_device_tokens, no token with '=' remains among the nets or definition."""
     parser = _make_parser()
     kv_tokens = [f"{k}={v}" for k, v in zip(identifiers[::2], identifiers[1::2])]
     plain_tokens = identifiers[len(kv_tokens) * 2 :]
     tokens = kv_tokens + plain_tokens
     params = {}
-    parser._extract_params(tokens, params)
-    assert not any("=" in t for t in tokens)
+    nets_list, definition_name = parser._split_device_tokens(tokens, params, None)
+    assert not any("=" in n.net for n in nets_list)
+    assert definition_name is None or "=" not in definition_name
+    assert len(params) == len({t.split("=", 1)[0] for t in kv_tokens})
 
 
 @given(st.lists(_IDENTIFIER, min_size=0, max_size=10))
 @settings(max_examples=200)
-def test_extract_params_preserves_plain_tokens(identifiers):
-    """_extract_params does not remove tokens without '='."""
+def test_split_device_tokens_preserves_plain_tokens(identifiers):
+    """_split_device_tokens keeps every token without '=' as a net or the definition."""
     parser = _make_parser()
     tokens = list(identifiers)
     params = {}
-    parser._extract_params(tokens, params)
-    for ident in identifiers:
-        if "=" not in ident:
-            assert ident in tokens
+    nets_list, definition_name = parser._split_device_tokens(tokens, params, None)
+    assert tokens == identifiers
+    kept = [n.net for n in nets_list] + ([definition_name] if definition_name is not None else [])
+    assert kept == [ident for ident in identifiers if "=" not in ident]
 
 
 @given(st.text(min_size=1).filter(lambda s: s[0].isdigit()))
@@ -283,14 +351,14 @@ def test_is_value_false_for_alpha_leading(token):
     )
 )
 @settings(max_examples=200)
-def test_separate_nets_from_model_last_token_is_definition(tokens):
+def test_split_device_tokens_last_token_is_definition(tokens):
     """The last token always becomes the definition name; the rest become net entries.
 
     Duplicate net names produce duplicate entries — two terminals tied to the same
     net are preserved so the linker can assign formal ports by position.
     """
     parser = _make_parser()
-    nets_list, definition_name = parser._separate_nets_from_model(list(tokens), None)
+    nets_list, definition_name = parser._split_device_tokens(list(tokens), {}, None)
     assert definition_name == tokens[-1]
     assert [n for n, _ in nets_list] == tokens[:-1]
 
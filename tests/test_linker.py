@@ -4,7 +4,7 @@
 
 import logging
 
-from netlistio.ingestor.linker import link
+from netlistio.ingestor.linker import _split_instances, link
 from netlistio.ingestor.registry import ModelRegistry
 from netlistio.models.generic import Instance, NetConnection, Port
 from netlistio.models.linking import LinkErrorType
@@ -22,6 +22,17 @@ def _link(*cells, registry=None):
     return link(_parse_result(*cells), registry, SpiceNetlist)
 
 
+class TestSplitInstances:
+    def test_instance_has_no_subclasses(self):
+        # _split_instances tests the exact type; a subclass would be taken for a definition.
+        assert not Instance.__subclasses__()
+
+    def test_keeps_order_within_each_group(self):
+        sub, model = Subckt(name="inv", ports=()), Model(name="nch", base_type="nmos")
+        x1, x2 = Instance(name="X1", nets=[]), Instance(name="X2", nets=[])
+        assert _split_instances([x1, sub, x2, model]) == ([x1, x2], [sub, model])
+
+
 class TestBasicLinking:
     def test_links_instance_to_macro(self):
         sub = Subckt(name="inv", ports=(Port("in"), Port("out")))
@@ -37,6 +48,18 @@ class TestBasicLinking:
         port_names = [p for _, p in inst.nets]
         assert any(p and p.name == "in" for p in port_names)
 
+    def test_ports_filled_on_existing_connections(self):
+        sub = Subckt(name="buf", ports=(Port("in"), Port("out")))
+        connections = [NetConnection("net_a"), NetConnection("net_b")]
+        inst = Instance(name="X1", nets=list(connections), definition_name="buf")
+        r_conns = [NetConnection("a"), NetConnection("b")]
+        res = Instance(name="R1", nets=list(r_conns), definition=Resistor())
+        _link(sub, inst, res)
+        assert all(a is b for a, b in zip(inst.nets, connections))
+        assert [c.port for c in connections] == list(sub.ports)
+        assert all(a is b for a, b in zip(res.nets, r_conns))
+        assert [c.port for c in r_conns] == list(Resistor().ports)
+
     def test_links_instance_to_model(self):
         model = Model(name="nmos_fast", base_type="nmos")
         inst = Instance(name="M1", nets=[NetConnection("d"), NetConnection("g")], definition_name="nmos_fast")
@@ -51,6 +74,13 @@ class TestBasicLinking:
         result = _link(inst)
         assert len(result.top_instances) == 1
 
+    def test_top_instances_keep_order_around_definitions(self):
+        sub = Subckt(name="inv", ports=(Port("a"),))
+        first = Instance(name="X1", nets=[NetConnection("n")], definition_name="inv")
+        second = Instance(name="R1", nets=[NetConnection("a"), NetConnection("b")], definition=Resistor())
+        result = _link(first, sub, second)
+        assert result.top_instances == [first, second]
+
     def test_primitives_collected_from_instances(self):
         r = Resistor()
         inst = Instance(name="R1", definition=r)
@@ -97,6 +127,20 @@ class TestErrors:
         result = _link(sub1, sub2)
         assert any(e.error_type == LinkErrorType.DUPLICATE_DEFINITION for e in result.errors)
 
+    def test_duplicate_differing_only_in_case_produces_error(self):
+        first = Subckt(name="inv", ports=(Port("a"),))
+        second = Subckt(name="INV", ports=(Port("a"), Port("b")))
+        inst = Instance(name="X1", nets=[NetConnection("n")], definition_name="Inv")
+        result = _link(first, second, inst)
+        assert any(e.error_type == LinkErrorType.DUPLICATE_DEFINITION for e in result.errors)
+        assert inst.definition is first
+
+    def test_library_only_duplicate_keeps_first_definition(self):
+        first = Subckt(name="inv", ports=())
+        second = Subckt(name="inv", ports=())
+        result = _link(first, second)
+        assert result.netlist.macros["inv"] is first
+
     def test_unnamed_cell_produces_error(self):
         model = Model(name=None, base_type="nmos")
         result = _link(model)
@@ -125,6 +169,35 @@ class TestTopologicalSort:
         result = _link(a, b, top)
         assert any(e.error_type == LinkErrorType.CIRCULAR_DEPENDENCY for e in result.errors)
 
+    def test_cycle_reported_without_downstream_consumers(self):
+        a = Subckt(name="a", ports=(Port("x"),))
+        b = Subckt(name="b", ports=(Port("x"),))
+        user = Subckt(name="user", ports=(Port("x"),))
+        a.children.append(Instance(name="X1", nets=[NetConnection("x")], definition=b))
+        b.children.append(Instance(name="X2", nets=[NetConnection("x")], definition=a))
+        user.children.append(Instance(name="X3", nets=[NetConnection("x")], definition=a))
+        top = Instance(name="Xtop", nets=[NetConnection("x")], definition_name="user")
+        (error,) = [e for e in _link(a, b, user, top).errors if e.error_type == LinkErrorType.CIRCULAR_DEPENDENCY]
+        assert sorted(error.affected_cells) == ["a", "b"]
+        assert error.message.endswith(f"{error.affected_cells[0]}")
+
+    def test_self_instantiation_is_a_cycle(self):
+        loop = Subckt(name="loop", ports=(Port("x"),))
+        loop.children.append(Instance(name="X1", nets=[NetConnection("x")], definition=loop))
+        top = Instance(name="Xtop", nets=[NetConnection("x")], definition_name="loop")
+        (error,) = [e for e in _link(loop, top).errors if e.error_type == LinkErrorType.CIRCULAR_DEPENDENCY]
+        assert error.message == "Circular dependency detected: loop → loop"
+
+    def test_repeated_child_instances_counted_once(self):
+        leaf = Subckt(name="leaf", ports=(Port("x"),))
+        parent = Subckt(name="parent", ports=(Port("x"),))
+        for i in range(3):
+            parent.children.append(Instance(name=f"X{i}", nets=[NetConnection("x")], definition=leaf))
+        top = Instance(name="Xtop", nets=[NetConnection("x")], definition_name="parent")
+        result = _link(leaf, parent, top)
+        assert list(result.netlist.macros) == ["leaf", "parent"]
+        assert not result.errors
+
     def test_port_mismatch_does_not_crash(self):
         sub = Subckt(name="mismatch", ports=(Port("a"), Port("b"), Port("c")))
         inst = Instance(name="X1", nets=[NetConnection("net1"), NetConnection("net2")], definition_name="mismatch")
@@ -3,6 +3,8 @@
 # pylint: disable=missing-class-docstring,missing-function-docstring
 # pylint: disable=no-value-for-parameter,import-outside-toplevel,unused-variable
 
+import pickle
+
 import pytest
 
 from netlistio.models.generic import Instance, NetConnection, Port, Primitive
@@ -67,6 +69,11 @@ class TestPrimitives:
         assert Resistor() == Resistor()
         assert Resistor() != Capacitor()
 
+    def test_primitive_is_singleton_per_type(self):
+        assert Resistor() is Resistor()
+        assert Resistor() is not Capacitor()
+        assert pickle.loads(pickle.dumps(Resistor())) is Resistor()
+
     def test_primitive_hash_by_type(self):
         assert hash(Resistor()) == hash(Resistor())
         assert hash(Resistor()) != hash(Capacitor())
@@ -74,7 +81,7 @@ class TestPrimitives:
     def test_primitive_rejects_instance_fields(self):
         with pytest.raises(TypeError, match="cannot define instance fields"):
 
-            class BadPrimitive(Primitive):  # noqa: F841
+            class BadPrimitive(Primitive):  # pylint: disable=abstract-method
                 bad_field: int
 
     def test_primitive_init_subclass_allows_classvars(self):
@@ -86,12 +93,31 @@ class TestPrimitives:
 
         assert GoodPrimitive.name == "good"
 
+    def test_primitive_init_subclass_reads_string_annotations(self):
+        class QuotedPrimitive(Primitive):
+            name: "ClassVar[str]" = "quoted"
+            ports: "typing.ClassVar[tuple]" = ()
+
+        assert QuotedPrimitive.name == "quoted"
+        with pytest.raises(TypeError, match=r"\['bad_field'\]"):
+
+            class BadQuotedPrimitive(Primitive):  # pylint: disable=abstract-method
+                bad_field: "int"
+
 
 class TestPort:
     def test_port_name(self):
         p = Port("vdd")
         assert p.name == "vdd"
 
+    def test_get_shares_one_port_per_name(self):
+        assert Port.get("vdd") is Port.get("vdd")
+        assert Port.get("vdd") == Port("vdd")
+        assert Resistor.ports[0] is Capacitor.ports[0]
+
+    def test_unpickled_port_is_the_shared_one(self):
+        assert pickle.loads(pickle.dumps(Port("vss"))) is Port.get("vss")
+
 
 class TestMacro:
     def _make_macro(self):
@@ -191,6 +217,17 @@ class TestSpiceNetlist:
         cells = nl.cells
         assert any(c.name == "inv" for c in cells)
 
+    def test_cells_chains_primitives_macros_and_top_instances(self):
+        inst = Instance(name="X1", definition_name="inv")
+        nl = SpiceNetlist(
+            name="test.sp",
+            primitives={"resistor": Resistor()},
+            macros={"inv": Subckt(name="inv", ports=())},
+            _top_instances=[inst],
+        )
+        assert [c.name for c in nl.cells] == ["resistor", "inv", "X1"]
+        assert [c.name for c in nl.cells] == ["resistor", "inv", "X1"]
+
 
 class TestSpiceRegistries:
     def test_prefix_registry_has_standard_types(self):
@@ -254,6 +291,10 @@ class TestParsingModels:
         e = ParseError(line_number=5, message="bad token", line_content="X bad")
         assert e.line_number == 5
 
+    def test_parse_errors_deduplicate(self):
+        errors = [ParseError(5, "bad token"), ParseError(5, "bad token"), ParseError(6, "bad token")]
+        assert len(set(errors)) == 2
+
     def test_parse_result_defaults(self):
         r = ParseResult(filepath="test.sp")
         assert not r.cells
@@ -264,6 +305,11 @@ class TestParsingModels:
         r = ParseRegion(filepath="f.sp", start_byte=0, end_byte=100, region_type=RegionType.GLOBAL)
         assert r.region_type == RegionType.GLOBAL
 
+    def test_parse_region_pickles_positionally(self):
+        r = ParseRegion("f.sp", 3, 9, RegionType.MACRO, context_delimiter=".subckt", context_name="inv")
+        assert pickle.loads(pickle.dumps(r)) == r
+        assert r.__reduce__()[1] == ("f.sp", 3, 9, RegionType.MACRO, ".subckt", "inv")
+
     def test_library_section(self):
         s = LibrarySection(name="tt", start_byte=10, end_byte=200)
         assert s.name == "tt"
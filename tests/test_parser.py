@@ -1,17 +1,33 @@
 """
 Direct tests for parser internals — bypasses multiprocessing to reach coverage.
 
-ChunkParser, SpiceChunkParser, SpiceChunkParserFactory, and _worker_entry_point
+ChunkParser, SpiceChunkParser, SpiceChunkParserFactory, and _worker_batch_entry_point
 all execute inside subprocess workers during normal operation, so they are invisible
 to pytest-cov. These tests call them directly in the main process.
 """
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import gc
+import pickle
 from pathlib import Path
 
-from netlistio.ingestor.common import open_mmap
-from netlistio.ingestor.parser import _worker_entry_point
+from netlistio.ingestor import parser as parser_module
+from netlistio.ingestor.common import (
+    MADV_DONTNEED,
+    MADV_SEQUENTIAL,
+    MADV_WILLNEED,
+    open_mmap,
+)
+from netlistio.ingestor.parser import (
+    MIN_BATCH_BYTES,
+    Parser,
+    _worker_batch_entry_point,
+    _WorkerBuffers,
+    largest_first,
+    packed_batch_entry_point,
+    unpack_result,
+)
 from netlistio.ingestor.scanner import Scanner
 from netlistio.ingestor.spice import (
     SpiceChunkParser,
@@ -19,7 +35,7 @@ from netlistio.ingestor.spice import (
     SpiceLineParser,
     SpiceScanStrategy,
 )
-from netlistio.models.parsing import ParseRegion, RegionType
+from netlistio.models.parsing import WHOLE_FILE, ParseRegion, RegionType
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -34,22 +50,181 @@ def _last_global_region(sp_path: Path) -> ParseRegion:
     return regions[-1]
 
 
+def _parse_each_region(sp_path: Path) -> list:
+    """Parses every region of *sp_path* as its own single-region batch."""
+    factory = SpiceChunkParserFactory()
+    regions = Scanner(sp_path, SpiceScanStrategy()).scan()
+    return [_worker_batch_entry_point((str(sp_path), [region], factory)) for region in regions]
+
+
 class TestWorkerEntryPoint:
     def test_parses_macro_region(self):
         path = FIXTURES / "minimal.sp"
         region = _macro_region(path)
-        result = _worker_entry_point((str(path), region, SpiceChunkParserFactory()))
+        result = _worker_batch_entry_point((str(path), [region], SpiceChunkParserFactory()))
         assert len(result.cells) == 1
         assert result.cells[0].name == "voltage_divider"
 
     def test_parses_global_region(self):
         path = FIXTURES / "hierarchy.sp"
         region = _last_global_region(path)
-        result = _worker_entry_point((str(path), region, SpiceChunkParserFactory()))
+        result = _worker_batch_entry_point((str(path), [region], SpiceChunkParserFactory()))
         # Global region of hierarchy.sp has one top-level instance
         assert any(c.name == "Xbuf_inst" for c in result.cells)
 
 
+class TestWorkerBuffers:
+    def test_disabled_outside_pool_workers(self):
+        assert parser_module._worker_buffers.enabled is False  # pylint: disable=protected-access
+
+    def test_init_worker_installs_result_cache(self, tmp_path, monkeypatch):
+        # pylint: disable=protected-access
+        monkeypatch.setattr(parser_module, "_worker_buffers", _WorkerBuffers())
+        monkeypatch.setattr(parser_module, "_worker_settings", parser_module._WorkerSettings())
+        parser_module.init_worker(str(tmp_path))
+        assert parser_module._worker_buffers.enabled is True
+        assert parser_module._worker_settings.result_cache.directory == tmp_path
+
+    def test_reuses_open_buffer(self, tmp_path):
+        path = tmp_path / "a.sp"
+        path.write_text("R1 a b 1k\n")
+        buffers = _WorkerBuffers()
+        assert buffers.get(str(path)) is buffers.get(str(path))
+
+    def test_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_WorkerBuffers, "LIMIT", 2)
+        paths = {}
+        for name in ("a", "b", "c"):
+            paths[name] = tmp_path / f"{name}.sp"
+            paths[name].write_bytes(b"*" * (1 << 17))  # large enough to be mapped
+        buffers = _WorkerBuffers()
+        a, b = buffers.get(str(paths["a"])), buffers.get(str(paths["b"]))
+        buffers.get(str(paths["a"]))
+        buffers.get(str(paths["c"]))
+        assert b.closed
+        assert not a.closed
+        assert buffers.get(str(paths["a"])) is a
+
+    def test_enabled_entry_point_parses_from_cache(self, monkeypatch):
+        buffers = _WorkerBuffers()
+        buffers.enabled = True
+        monkeypatch.setattr(parser_module, "_worker_buffers", buffers)
+        path = FIXTURES / "minimal.sp"
+        region = _macro_region(path)
+        for _ in range(2):
+            result = _worker_batch_entry_point((str(path), [region], SpiceChunkParserFactory()))
+            assert result.cells[0].name == "voltage_divider"
+
+
+class TestParserWorkBatches:
+    def test_small_regions_share_one_batch(self):
+        path = FIXTURES / "hierarchy.sp"
+        regions = list(Scanner(path, SpiceScanStrategy()).scan())
+        batches = Parser(path, regions, SpiceChunkParserFactory()).work_batches(num_workers=4)
+        assert len(batches) == 1
+        assert batches[0][:2] == (str(path), regions)
+        assert pickle.loads(pickle.dumps(batches)) is not None
+
+    def test_batches_close_at_target_and_keep_order(self):
+        regions = [ParseRegion("f.sp", i * 1000, (i + 1) * 1000, RegionType.GLOBAL) for i in range(200)]
+        batches = Parser(Path("f.sp"), regions, SpiceChunkParserFactory()).work_batches(num_workers=1)
+        assert [r for _, batch, _ in batches for r in batch] == regions
+        assert all(sum(r.end_byte - r.start_byte for r in batch) >= MIN_BATCH_BYTES for _, batch, _ in batches[:-1])
+
+    def test_batch_count_bounded_per_worker(self):
+        regions = [ParseRegion("f.sp", i * 100, (i + 1) * 100, RegionType.MACRO) for i in range(100_000)]
+        batches = Parser(Path("f.sp"), regions, SpiceChunkParserFactory()).work_batches(num_workers=4)
+        assert len(batches) <= 4 * parser_module._BATCHES_PER_WORKER  # pylint: disable=protected-access
+
+    def test_whole_file_region_gets_own_batch(self):
+        regions = [
+            ParseRegion("f.sp", 0, 10, RegionType.GLOBAL),
+            ParseRegion("f.sp", 10, WHOLE_FILE, RegionType.GLOBAL),
+            ParseRegion("g.sp", 0, 10, RegionType.GLOBAL),
+        ]
+        batches = Parser(Path("f.sp"), regions, SpiceChunkParserFactory()).work_batches(num_workers=2)
+        assert [batch for _, batch, _ in batches] == [regions[:1], regions[1:2], regions[2:]]
+
+    def test_largest_batches_dispatched_first(self):
+        spans = [(0, 10), (10, 5000), (5000, 5100), (5100, WHOLE_FILE), (0, 100)]
+        batches = [("f.sp", [ParseRegion("f.sp", a, b, RegionType.GLOBAL)], None) for a, b in spans]
+        assert largest_first(batches) == [3, 1, 2, 4, 0]
+
+    def test_batch_span_advised_once(self, monkeypatch):
+        hints = []
+        monkeypatch.setattr(parser_module, "advise", lambda _mm, advice, start, end: hints.append((advice, start, end)))
+        path = FIXTURES / "hierarchy.sp"
+        regions = list(Scanner(path, SpiceScanStrategy()).scan())
+        _worker_batch_entry_point((str(path), regions, SpiceChunkParserFactory()))
+        span = (regions[0].start_byte, regions[-1].end_byte)
+        assert hints == [(MADV_SEQUENTIAL, *span), (MADV_WILLNEED, *span)]
+
+    def test_reused_buffer_releases_batch_span(self, monkeypatch):
+        hints = []
+        monkeypatch.setattr(parser_module, "advise", lambda _mm, advice, start, end: hints.append((advice, start, end)))
+        buffers = _WorkerBuffers()
+        buffers.enabled = True
+        monkeypatch.setattr(parser_module, "_worker_buffers", buffers)
+        path = FIXTURES / "hierarchy.sp"
+        regions = list(Scanner(path, SpiceScanStrategy()).scan())
+        _worker_batch_entry_point((str(path), regions, SpiceChunkParserFactory()))
+        span = (regions[0].start_byte, regions[-1].end_byte)
+        assert hints == [(MADV_SEQUENTIAL, *span), (MADV_WILLNEED, *span), (MADV_DONTNEED, *span)]
+
+    def test_batch_matches_per_region_results(self):
+        path = FIXTURES / "hierarchy.sp"
+        expected = _parse_each_region(path)
+        result = _worker_batch_entry_point(
+            (str(path), list(Scanner(path, SpiceScanStrategy()).scan()), SpiceChunkParserFactory())
+        )
+        assert [c.name for c in result.cells] == [c.name for r in expected for c in r.cells]
+        assert result.includes == [d for r in expected for d in r.includes]
+
+    def test_packed_result_round_trips(self):
+        path = FIXTURES / "hierarchy.sp"
+        batch = (str(path), list(Scanner(path, SpiceScanStrategy()).scan()), SpiceChunkParserFactory())
+        expected = _worker_batch_entry_point(batch)
+        result = unpack_result(packed_batch_entry_point(batch))
+        assert [c.name for c in result.cells] == [c.name for c in expected.cells]
+        assert result.includes == expected.includes
+
+    def test_packing_leaves_collector_state_alone(self):
+        path = FIXTURES / "hierarchy.sp"
+        batch = (str(path), list(Scanner(path, SpiceScanStrategy()).scan()), SpiceChunkParserFactory())
+        assert gc.isenabled()
+        unpack_result(packed_batch_entry_point(batch))
+        assert gc.isenabled()
+        gc.disable()
+        try:
+            unpack_result(packed_batch_entry_point(batch))
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+
+class TestParserParse:
+    def test_pool_result_covers_every_region(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(parser_module, "INLINE_PARSE_BYTES", 0)
+        path = tmp_path / "top.sp"
+        path.write_text('.include "a.sp"\n.subckt inv a\n.ends\n.include "a.sp"\n.subckt buf a\n.ends\nX1 n inv\n')
+        parser = Parser(path, list(Scanner(path, SpiceScanStrategy()).scan()), SpiceChunkParserFactory())
+        result = parser.parse(num_workers=2)
+        expected = _parse_each_region(path)
+        assert sorted(c.name for c in result.cells) == sorted(c.name for r in expected for c in r.cells)
+        assert [d.filepath for d in result.includes] == ["a.sp"]
+
+    def test_small_file_parsed_without_pool(self, monkeypatch):
+        def _no_pool(*_args, **_kwargs):
+            raise AssertionError("pool started for a small file")
+
+        monkeypatch.setattr(parser_module.multiprocessing, "Pool", _no_pool)
+        path = FIXTURES / "hierarchy.sp"
+        parser = Parser(path, list(Scanner(path, SpiceScanStrategy()).scan()), SpiceChunkParserFactory())
+        expected = _parse_each_region(path)
+        result = parser.parse(num_workers=4)
+        assert [c.name for c in result.cells] == [c.name for r in expected for c in r.cells]
+
+
 class TestSpiceChunkParserFactory:
     def test_call_returns_spice_chunk_parser(self):
         path = FIXTURES / "minimal.sp"
@@ -106,16 +281,73 @@ class TestSpiceChunkParserDirect:
         result = self._make_parser(sp, region)
         assert result.cells[0].name == "buf"
 
-    def test_read_physical_line_respects_end_byte(self):
+    def test_block_reads_respect_end_byte(self):
         path = FIXTURES / "minimal.sp"
         region = _macro_region(path)
-        # end_byte != -1, so _read_physical_line respects the region boundary
+        # end_byte != -1, so block reads stop at the region boundary
         with open_mmap(path) as mm:
             lp = SpiceLineParser(str(path), mm, region)
             cp = SpiceChunkParser(mm, region, lp)
             lines = [ln for ln in cp if ln is not None]
         assert lines  # region produced at least one logical line
 
+    def test_block_reads_match_across_boundaries(self, tmp_path, monkeypatch):
+        sp = tmp_path / "blocks.sp"
+        sp.write_text("title\nR1 a b 1k\n+ tc1=1\n* note\nX1 a averyveryverylongnetname b cell\nR2 a b 2k")
+        region = ParseRegion(str(sp), 0, -1, RegionType.GLOBAL)
+
+        def _lines():
+            with open_mmap(sp) as mm:
+                return list(SpiceChunkParser(mm, region, SpiceLineParser(str(sp), mm, region)))
+
+        expected = _lines()
+        monkeypatch.setattr(SpiceChunkParser, "READ_BLOCK_BYTES", 7)
+        assert _lines() == expected == ["R1 a b 1k tc1=1", "X1 a averyveryverylongnetname b cell", "R2 a b 2k"]
+
+    def test_continuations_fold_across_comments_and_blocks(self, tmp_path, monkeypatch):
+        sp = tmp_path / "fold.sp"
+        text = "* title\n+ orphan\nR1 a\n* note\n\n  + b\t\n$ x\n+ 1k\n  * indented\nR2 c d 2k\n+\n"
+        region = ParseRegion(str(sp), 0, -1, RegionType.GLOBAL)
+
+        def _lines():
+            with open_mmap(sp) as mm:
+                return list(SpiceChunkParser(mm, region, SpiceLineParser(str(sp), mm, region)))
+
+        expected = ["orphan", "R1 a b 1k", "R2 c d 2k"]
+        for newline in ("\n", "\r\n"):
+            sp.write_bytes(text.replace("\n", newline).encode())
+            for block_bytes in (1, 4, 1 << 20):
+                monkeypatch.setattr(SpiceChunkParser, "READ_BLOCK_BYTES", block_bytes)
+                # Whitespace before a break, including the CRLF "\r", is stripped like any line end.
+                assert _lines() == expected
+
+    def test_multibyte_text_survives_small_blocks(self, tmp_path, monkeypatch):
+        sp = tmp_path / "utf8.sp"
+        sp.write_text("title\nR1 a b 1k desc=\u00b5m\nX1 n\u00e9t b cell\n", encoding="utf-8")
+        region = ParseRegion(str(sp), 0, -1, RegionType.GLOBAL)
+        monkeypatch.setattr(SpiceChunkParser, "READ_BLOCK_BYTES", 3)
+        with open_mmap(sp) as mm:
+            lines = list(SpiceChunkParser(mm, region, SpiceLineParser(str(sp), mm, region)))
+        assert lines == ["R1 a b 1k desc=\u00b5m", "X1 n\u00e9t b cell"]
+
+    def test_abandoned_iteration_releases_mmap(self, tmp_path):
+        sp = tmp_path / "abandon.sp"
+        sp.write_text("* t\nR1 a b 1k\nR2 c d 2k\n")
+        region = ParseRegion(str(sp), 0, -1, RegionType.GLOBAL)
+        with open_mmap(sp) as mm:
+            lines = iter(SpiceChunkParser(mm, region, SpiceLineParser(str(sp), mm, region)))
+            assert next(lines) == "R1 a b 1k"
+        # Leaving the block closes the mmap; a live buffer export would raise BufferError.
+        assert mm.closed
+
+    def test_mid_line_end_byte_reads_whole_line(self, tmp_path):
+        sp = tmp_path / "midline.sp"
+        sp.write_text("* t\nR1 a b 1k\nR2 c d 2k\n")
+        region = ParseRegion(str(sp), 0, len("* t\nR1 a"), RegionType.GLOBAL)
+        with open_mmap(sp) as mm:
+            lines = list(SpiceChunkParser(mm, region, SpiceLineParser(str(sp), mm, region)))
+        assert lines == ["R1 a b 1k"]
+
     def test_global_region_with_includes(self):
         path = FIXTURES / "with_include.sp"
         regions = list(Scanner(path, SpiceScanStrategy()).scan())
@@ -21,6 +21,39 @@ class TestPrimitiveRendering:
         assert "Port" in buf.getvalue() or "a" in buf.getvalue()
 
 
+class TestIndentation:
+    def test_each_depth_indented_by_configured_unit(self):
+        buf = io.StringIO()
+        NetlistPrinter(buf, indent_char="\t", indent_count=2).print(Resistor(), indent=1)
+        lines = buf.getvalue().splitlines()
+        assert lines[0].startswith("\t\tResistor")
+        assert lines[1].startswith("\t\t\t\tPort")
+
+
+class TestBuffering:
+    class _CountingStream(io.StringIO):
+        def __init__(self):
+            super().__init__()
+            self.writes = 0
+
+        def write(self, s):
+            self.writes += 1
+            return super().write(s)
+
+    def test_small_tree_written_once(self):
+        stream = self._CountingStream()
+        NetlistPrinter(stream).print(Resistor())
+        assert stream.writes == 1
+
+    def test_flushes_every_batch_of_lines(self, monkeypatch):
+        monkeypatch.setattr(NetlistPrinter, "FLUSH_LINES", 1)
+        stream, unbuffered = self._CountingStream(), io.StringIO()
+        NetlistPrinter(stream).print(Resistor())
+        NetlistPrinter(unbuffered).print(Resistor())
+        assert stream.writes == len(unbuffered.getvalue().splitlines())
+        assert stream.getvalue() == unbuffered.getvalue()
+
+
 class TestPortRendering:
     def test_port_name_in_output(self):
         buf = io.StringIO()
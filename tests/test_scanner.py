@@ -2,7 +2,15 @@
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
-from netlistio.ingestor.scanner import Scanner
+import re
+import subprocess
+import sys
+
+import pytest
+
+from netlistio.ingestor import _scan_kernel
+from netlistio.ingestor.common import MADV_SEQUENTIAL, SMALL_FILE_BYTES
+from netlistio.ingestor.scanner import Scanner, ScanStrategy
 from netlistio.ingestor.spice import SpiceScanStrategy
 from netlistio.models.parsing import RegionType
 
@@ -11,6 +19,20 @@ def _scan(path):
     return list(Scanner(path, SpiceScanStrategy()).scan())
 
 
+class _LineFsmStrategy(SpiceScanStrategy):
+    """Reference strategy: always falls back to the Scanner's line-by-line FSM."""
+
+    def scan_buffer(self, mm, filepath):
+        return None
+
+    def boundary_regex(self):
+        return None
+
+
+def _fsm_scan(path):
+    return list(Scanner(path, _LineFsmStrategy()).scan())
+
+
 class TestSpiceScanStrategy:
     def test_matches_subckt_start(self):
         strategy = SpiceScanStrategy()
@@ -29,6 +51,11 @@ class TestSpiceScanStrategy:
         strategy = SpiceScanStrategy()
         assert strategy.matches_macro_start(b"X1 a b c inv\n") is None
 
+    def test_subckt_after_other_text_is_not_a_start(self):
+        strategy = SpiceScanStrategy()
+        assert strategy.matches_macro_start(b"R1 a b 1k .subckt inv a\n") is None
+        assert strategy.matches_macro_start(b"  \t.subckt inv a\n") == (".subckt", "inv")
+
     def test_matches_ends(self):
         strategy = SpiceScanStrategy()
         assert strategy.matches_macro_end(b".ends\n") is True
@@ -89,9 +116,161 @@ class TestScanner:
         # Scanner finalizes on EOF; unterminated MACRO gets emitted
         assert len(regions) >= 1
 
+    def test_line_fsm_same_on_read_and_mapped_files(self, tmp_spice):
+        # The small file is read into bytes; the padded copy is large enough to be mapped.
+        body = ".subckt a x\nR1 x 0 1k\n.ends\n* no trailing newline"
+        padding = "*" * SMALL_FILE_BYTES + "\n"
+        small = [(r.start_byte, r.end_byte, r.region_type) for r in _fsm_scan(tmp_spice(body))]
+        head, *rest = _fsm_scan(tmp_spice(padding + body))
+        shift = len(padding)
+        assert (head.start_byte, head.end_byte) == (0, shift)
+        assert [(r.start_byte - shift, r.end_byte - shift, r.region_type) for r in rest] == small
+
+    def test_line_fsm_same_across_block_boundaries(self, tmp_spice, monkeypatch):
+        from netlistio.ingestor import scanner as scanner_module  # pylint: disable=import-outside-toplevel
+
+        # Lone "\r" does not end a line; "\r\n" may be cut between two blocks.
+        path = tmp_spice(".subckt a x\r\nR1 x 0\r.ends\r\n" + "* " + "long " * 20 + "\n.subckt b y\n.ends")
+        expected = _fsm_scan(path)
+        monkeypatch.setattr(scanner_module, "_BLOCK_BYTES", 3)
+        assert _fsm_scan(path) == expected == _scan(path)
+
+    def test_scan_requests_sequential_readahead(self, tmp_spice, monkeypatch):
+        from netlistio.ingestor import scanner as scanner_module  # pylint: disable=import-outside-toplevel
+
+        hints = []
+        real_open_buffer = scanner_module.open_buffer
+
+        def _recording_open_buffer(path, advice=None):
+            hints.append(advice)
+            return real_open_buffer(path, advice)
+
+        monkeypatch.setattr(scanner_module, "open_buffer", _recording_open_buffer)
+        _scan(tmp_spice("*" * SMALL_FILE_BYTES + "\n"))
+        assert hints == [MADV_SEQUENTIAL]
+
     def test_scanner_iter_delegates_to_scan(self, fixture_path):
         path = fixture_path("minimal.sp")
         # Each Scanner call owns fresh context state; iter() delegates to scan()
         regions_iter = list(Scanner(path, SpiceScanStrategy()))
         regions_scan = list(Scanner(path, SpiceScanStrategy()).scan())
         assert len(regions_iter) == len(regions_scan)
+
+
+class TestCompiledScanKernel:
+    """The Numba kernel must reproduce the line FSM region-for-region."""
+
+    _TRICKY = (
+        "title line\n"
+        "  .SUBCKT outer a b\n"
+        ".subckt inner x\n"
+        "\t.ends   inner\n"
+        ".endsouter\n"
+        ".subcktnope a\n"
+        ".subckt\n"
+        "  * .subckt commented\n"
+        ".Subckt tail p q\r\n"
+        "R1 p q 1k"
+    )
+
+    @pytest.fixture
+    def jit_strategy(self, monkeypatch):
+        pytest.importorskip("numba")
+        monkeypatch.setattr(SpiceScanStrategy, "JIT_MIN_BYTES", 0)
+        return SpiceScanStrategy()
+
+    def test_matches_fsm_on_fixtures(self, fixture_path, jit_strategy):
+        for name in ("minimal.sp", "hierarchy.sp", "continuation.sp", "mosfets.sp", "with_include.sp"):
+            path = fixture_path(name)
+            assert list(Scanner(path, jit_strategy).scan()) == _fsm_scan(path), name
+
+    def test_matches_fsm_on_edge_cases(self, tmp_spice, jit_strategy):
+        path = tmp_spice(self._TRICKY)
+        assert list(Scanner(path, jit_strategy).scan()) == _fsm_scan(path)
+
+    def test_many_regions_grow_row_buffer(self, tmp_spice, jit_strategy):
+        path = tmp_spice("".join(f".subckt c{i} a\nR1 a 0 1k\n.ends\nX{i} n c{i}\n" for i in range(40)))
+        assert list(Scanner(path, jit_strategy).scan()) == _fsm_scan(path)
+
+    def test_pure_python_kernel_matches_fsm(self, tmp_spice):
+        np = pytest.importorskip("numpy")
+        path = tmp_spice(self._TRICKY)
+        kernel = getattr(_scan_kernel.scan_spice, "py_func", _scan_kernel.scan_spice)
+        rows = kernel(np.frombuffer(path.read_bytes(), dtype=np.uint8))
+        assert [(r[0], r[1]) for r in rows.tolist()] == [(r.start_byte, r.end_byte) for r in _fsm_scan(path)]
+
+    def test_small_files_skip_kernel(self, fixture_path, monkeypatch):
+        def _raise(_buf):
+            raise AssertionError("kernel should not run below JIT_MIN_BYTES")
+
+        monkeypatch.setattr(_scan_kernel, "scan_spice", _raise)
+        assert _scan(fixture_path("minimal.sp")) == _fsm_scan(fixture_path("minimal.sp"))
+
+    def test_small_scans_do_not_import_numba(self, fixture_path):
+        code = (
+            "import sys\n"
+            "from netlistio.ingestor.scanner import Scanner\n"
+            "from netlistio.ingestor.spice import SpiceScanStrategy\n"
+            f"Scanner({str(fixture_path('hierarchy.sp'))!r}, SpiceScanStrategy()).scan()\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestBoundaryRegexScan:
+    """The whole-buffer boundary regex must reproduce the line FSM region-for-region."""
+
+    def test_matches_fsm_on_fixtures(self, fixture_path):
+        for name in ("minimal.sp", "hierarchy.sp", "continuation.sp", "mosfets.sp", "with_include.sp", "models.sp"):
+            path = fixture_path(name)
+            assert _scan(path) == _fsm_scan(path), name
+
+    def test_matches_fsm_on_edge_cases(self, tmp_spice):
+        path = tmp_spice(TestCompiledScanKernel._TRICKY)  # pylint: disable=protected-access
+        assert _scan(path) == _fsm_scan(path)
+
+    def test_keyword_and_name_on_separate_lines(self, tmp_spice):
+        path = tmp_spice("  \n.subckt\n  foo a\n.ends\n\n  \n.SUBCKT bar\n.ends\n")
+        regions = _scan(path)
+        assert regions == _fsm_scan(path)
+        assert [r.context_name for r in regions if r.region_type == RegionType.MACRO] == ["bar"]
+
+    def test_unterminated_macro_is_global(self, tmp_spice):
+        path = tmp_spice(".subckt open a\n.subckt inner b\n.ends\nR1 a 0 1k\n")
+        assert _scan(path) == _fsm_scan(path)
+        assert [r.region_type for r in _scan(path)] == [RegionType.GLOBAL]
+
+    def test_any_strategy_can_supply_a_boundary_regex(self, tmp_spice):
+        class _ModuleStrategy(ScanStrategy):
+            RE_START = re.compile(rb"^\s*(module)\s+(\w+)")
+
+            def matches_macro_start(self, line):
+                if match := self.RE_START.match(line):
+                    return match.group(1).decode(), match.group(2).decode()
+                return None
+
+            def matches_macro_end(self, line):
+                return line.strip() == b"endmodule"
+
+        class _ModuleRegexStrategy(_ModuleStrategy):
+            def boundary_regex(self):
+                return re.compile(rb"^[^\S\n]*(?:(?P<delimiter>module)[^\S\n]+(?P<name>\w+)|endmodule$)", re.MULTILINE)
+
+        path = tmp_spice("wire a;\nmodule top (a);\n  module sub;\n  endmodule\nendmodule\nassign b = a;\n")
+        regions = list(Scanner(path, _ModuleRegexStrategy()).scan())
+        assert regions == list(Scanner(path, _ModuleStrategy()).scan())
+        assert [r.context_name for r in regions] == [None, "top", None]
+
+
+class TestRegionPathInterning:
+    def test_regions_share_one_interned_path(self, fixture_path):
+        regions = _scan(fixture_path("hierarchy.sp"))
+        assert len(regions) > 1
+        assert all(r.filepath is regions[0].filepath for r in regions)
+        assert regions[0].filepath is sys.intern(str(fixture_path("hierarchy.sp")))
+
+    def test_macros_share_one_delimiter_string(self, fixture_path):
+        for scan in (_scan, _fsm_scan):
+            macros = [r for r in scan(fixture_path("hierarchy.sp")) if r.region_type == RegionType.MACRO]
+            assert len(macros) > 1
+            assert all(r.context_delimiter is macros[0].context_delimiter for r in macros)